@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+"""
+Offscreen benchmarks, run them from the ``src`` directory, i.e.: ``python -m benchmarks.sceneindex``
+"""
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Image memory held per 1k nodes with the shared asset cache compared to every item decoding its own images, and
+the time to render a view of nodes drawing from scaled pixmaps compared to scaling the decoded images
+
+Before the cache every socket decoded the pulse and error icons, op and act nodes the status icons and state
+nodes their picture. Drawing the decoded images is what painting did before: the painter scaled the full image
+down on every paint.
+"""
+import contextlib
+import gc
+import time
+
+from PySide6.QtCore import QRectF
+from PySide6.QtGui import QImage, QPainter
+
+from benchmarks.common import *
+
+from qdassets import QD_AssetCache
+from qdquestscene import QD_QuestScene
+from qdviewgfx import QD_ViewGfx
+
+import qdassets
+
+
+# what items decoded in their initAssets, state node type -> images of the node, images of every socket
+ITEM_IMAGES = {
+    'StateNode_enter': ['icons/src.png'],
+    'StateNode_act': ['icons/status_icons.png', 'icons/src.png'],
+    'StateNode_exit': ['icons/dst.png'],
+    'StateNode_pulse': ['icons/pulse.png'],
+}
+SOCKET_IMAGES = ['icons/socket_pulse.png', 'icons/socket_error.png']
+
+
+@contextlib.contextmanager
+def sharedAssets(cache: QD_AssetCache):
+    """Items draw from ``cache`` instead of the process wide one"""
+    modules = [module for module in sys.modules.values() if getattr(module, 'assets', None) is qdassets.assets]
+    for module in modules:
+        module.assets = cache
+    try:
+        yield
+    finally:
+        for module in modules:
+            module.assets = qdassets.assets
+
+
+@contextlib.contextmanager
+def drawingDecodedImages():
+    """Items draw the full decoded image and let the painter scale it, like before the cache"""
+    drawImage = QD_AssetCache.drawImage
+
+    def decodedDrawImage(self, painter, target, path, source=None):
+        image = self.image(path)
+        painter.drawImage(target, image, source if source is not None else QRectF(image.rect()))
+
+    QD_AssetCache.drawImage = decodedDrawImage
+    try:
+        yield
+    finally:
+        QD_AssetCache.drawImage = drawImage
+
+
+def buildScene(count: int) -> QD_QuestScene:
+    """``count`` nodes of every state node type in a grid"""
+    scene = QD_QuestScene()
+    for row, typeName in enumerate(ITEM_IMAGES):
+        for column in range(count):
+            utils.getStateNodeType(typeName)(scene).setPos(column * 160, row * 160)
+    return scene
+
+
+def memory(count: int) -> list:
+    """Decoded images per 1k nodes of every type, items decoding their own against the shared cache"""
+    perImage = {path: QImage(path).sizeInBytes() for path in set(sum(ITEM_IMAGES.values(), SOCKET_IMAGES))}
+
+    rows = []
+    for typeName, paths in ITEM_IMAGES.items():
+        cache = QD_AssetCache()
+        with sharedAssets(cache):
+            scene = QD_QuestScene()
+            nodes = [utils.getStateNodeType(typeName)(scene) for _ in range(count)]
+
+            image = QImage(200, 200, QImage.Format.Format_ARGB32_Premultiplied)
+            painter = QPainter(image)
+            for node in nodes:
+                for socket in node.sockets:
+                    socket.gfx._hoverState = 2
+                for item in [node.gfx] + [socket.gfx for socket in node.sockets]:
+                    item.paint(painter, None)
+            painter.end()
+
+            sockets = len(nodes[0].sockets)
+            start = time.perf_counter()
+            decoded = [QImage(path) for _ in range(count) for path in paths + SOCKET_IMAGES * sockets]
+            decodeTime = time.perf_counter() - start
+
+            before = 1000 * (sum(perImage[path] for path in paths) + sockets * sum(perImage[path] for path in SOCKET_IMAGES))
+            after = cache.memoryUsage()
+            rows.append([typeName, sockets, '%.1f' % (before / 2**20), '%.2f' % (after / 2**20), '%.1f' % ((before - after) / 2**20), '%.1f' % (decodeTime * 1e3 / count)])
+
+            del decoded
+            scene.clear()
+            del scene, nodes
+            gc.collect()
+    return rows
+
+
+def render(count: int, frames: int = 10) -> list:
+    """Milliseconds per view render at different zoom levels"""
+    scene = buildScene(count)
+    view = QD_ViewGfx(scene.gfx)
+    view.resize(1600, 1000)
+
+    image = QImage(1600, 1000, QImage.Format.Format_ARGB32_Premultiplied)
+
+    def draw():
+        for _ in range(frames):
+            painter = QPainter(image)
+            view.render(painter)
+            painter.end()
+
+    rows = []
+    for zoom in (0.25, 1.0, 2.0):
+        view.resetTransform()
+        view.scale(zoom, zoom)
+        view.centerOn(scene.gfx.itemsBoundingRect().center())
+
+        row = [zoom]
+        for context, cache in ((drawingDecodedImages(), QD_AssetCache()), (contextlib.nullcontext(), QD_AssetCache()), (contextlib.nullcontext(), QD_AssetCache(atlas=True))):
+            with context, sharedAssets(cache):
+                draw()
+                row.append('%.1f' % (timeit(draw, repeat=3) * 1e3 / frames))
+        rows.append(row)
+
+    view.setScene(None)
+    scene.clear()
+    del scene, view
+    gc.collect()
+    return rows
+
+
+if __name__ == '__main__':
+    print('decoded images per 1k nodes in MiB, extrapolated from 100 nodes, and decoding time per node items paid before')
+    printTable(['node', 'sockets', 'per item', 'shared', 'saved', 'decode ms'], memory(100))
+    print()
+    print('milliseconds per render of a 1600x1000 view over 4 x 25 nodes')
+    printTable(['zoom', 'decoded image', 'scaled pixmap', 'atlas'], render(25))
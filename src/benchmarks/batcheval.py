@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Pass counts of the condition nodes of a quest over a player population, NumPy predicates compared to a Python loop
+
+The quest has level and hasItem checkers plus an enter node with job, level and gold requirements for every ten
+checkers, many of them asking the same thing. The Python loop runs on a sample of the players and is scaled to the whole table.
+"""
+import operator
+import os
+import random
+import tempfile
+
+import numpy as np
+
+from benchmarks.common import *
+
+from qdbatcheval import QD_BatchEvaluator, QD_PlayerTable, JOB_NAMES, ITEM_NAMES
+
+
+CHECKER_OPERATORS = (operator.gt, operator.lt, operator.eq, operator.ne, operator.le, operator.ge)
+WIDGET_OPERATORS = (operator.gt, operator.lt, operator.eq, operator.le, operator.ge, operator.ne)
+
+
+def buildNodes(count: int, seed: int = 0) -> list:
+    """Serialized checker and enter nodes, in the fields the editor saves"""
+    rand = random.Random(seed)
+    nodes = []
+    for nodeId in range(1, count + 1):
+        kind = nodeId % 11
+        if kind % 2 == 0:
+            nodes.append({'id': nodeId, 'type': '_ConditionChecker_level', 'content': {'choice': rand.randrange(6), 'value': str(rand.randrange(1, 60))}})
+        elif kind != 1:
+            nodes.append({'id': nodeId, 'type': '_ConditionChecker_hasItem', 'content': {'choice': rand.randrange(6), 'value': str(rand.randrange(5)), 'item': rand.randrange(len(ITEM_NAMES))}})
+        else:
+            nodes.append({'id': nodeId, 'type': 'StateNode_enter', 'index': nodeId, 'widget': {
+                'job': {name: rand.random() < 0.5 for name in JOB_NAMES},
+                'level': {'index': rand.randrange(6), 'value': str(rand.randrange(1, 60))},
+                'gold': {'index': rand.randrange(6), 'value': rand.choice(['', str(rand.randrange(100000))])},
+            }})
+    return nodes
+
+
+def buildTable(rows: int, seed: int = 0) -> QD_PlayerTable:
+    rng = np.random.default_rng(seed)
+    return QD_PlayerTable(
+            rng.integers(0, len(JOB_NAMES), rows),
+            rng.integers(1, 60, rows),
+            rng.integers(0, 100000, rows),
+            rng.integers(0, 5, (rows, len(ITEM_NAMES))))
+
+
+def loopCounts(nodes: list, table: QD_PlayerTable, rows: int) -> dict:
+    """What evaluating the nodes player by player in Python looks like"""
+    job, level, gold, items = table.job[:rows].tolist(), table.level[:rows].tolist(), table.gold[:rows].tolist(), table.items[:rows].tolist()
+    counts = {}
+    for data in nodes:
+        count = 0
+        if data['type'] == 'StateNode_enter':
+            widget = data['widget']
+            jobs = [widget['job'][name] for name in JOB_NAMES]
+            levelOp, levelValue = WIDGET_OPERATORS[widget['level']['index']], int(widget['level']['value'])
+            goldOp, goldValue = WIDGET_OPERATORS[widget['gold']['index']], widget['gold']['value']
+            for row in range(rows):
+                if jobs[job[row]] and levelOp(level[row], levelValue) and (goldValue == '' or goldOp(gold[row], int(goldValue))):
+                    count += 1
+        else:
+            content = data['content']
+            relation, value = CHECKER_OPERATORS[content['choice']], int(content['value'])
+            for row in range(rows):
+                owned = level[row] if data['type'] == '_ConditionChecker_level' else items[row][content['item']]
+                if relation(owned, value):
+                    count += 1
+        counts[data['id']] = count
+    return counts
+
+
+def benchmark(nodeCount: int, rows: int, sample: int = 20000) -> list:
+    nodes = buildNodes(nodeCount)
+    table = buildTable(rows)
+
+    evaluator = QD_BatchEvaluator(nodes)
+    head = QD_PlayerTable(table.job[:sample], table.level[:sample], table.gold[:sample], table.items[:sample])
+    assert evaluator.passCounts(head) == loopCounts(nodes, table, sample)
+
+    compileTime = timeit(lambda: QD_BatchEvaluator(nodes), repeat=3)
+    batchTime = timeit(lambda: evaluator.passCounts(table), repeat=3)
+    loopTime = timeit(lambda: loopCounts(nodes, table, sample), repeat=1) * rows / sample
+
+    milliseconds = lambda t: '%.1f' % (t * 1e3)
+    return [nodeCount, rows, milliseconds(loopTime), milliseconds(compileTime), milliseconds(batchTime), '%.0fx' % (loopTime / batchTime)]
+
+
+def loadBenchmark(rows: int) -> list:
+    table = buildTable(rows)
+    with tempfile.TemporaryDirectory() as folder:
+        npzFile, csvFile = os.path.join(folder, 'players.npz'), os.path.join(folder, 'players.csv')
+        table.save(npzFile)
+
+        columns = np.column_stack([table.job, table.level, table.gold, table.items])
+        header = ','.join(['job', 'level', 'gold'] + ['item%d' % index for index in range(len(ITEM_NAMES))])
+        np.savetxt(csvFile, columns, fmt='%d', delimiter=',', header=header, comments='')
+
+        for loaded in (QD_PlayerTable.fromFile(npzFile), QD_PlayerTable.fromFile(csvFile)):
+            assert np.array_equal(loaded.gold, table.gold) and np.array_equal(loaded.items, table.items)
+
+        npzTime = timeit(lambda: QD_PlayerTable.fromFile(npzFile), repeat=3)
+        csvTime = timeit(lambda: QD_PlayerTable.fromFile(csvFile), repeat=1)
+
+    return [rows, '%.1f' % (npzTime * 1e3), '%.1f' % (csvTime * 1e3)]
+
+
+if __name__ == '__main__':
+    print('milliseconds for all nodes over all players, python loop scaled from a sample')
+    printTable(['nodes', 'players', 'python loop', 'compile', 'numpy', 'speedup'],
+               [benchmark(nodeCount, rows) for nodeCount, rows in ((30, 1000000), (30, 5000000), (150, 5000000))])
+
+    print()
+    print('milliseconds to load the player table')
+    printTable(['players', 'npz', 'csv'], [loadBenchmark(rows) for rows in (1000000,)])
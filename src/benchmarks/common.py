@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Helpers shared by all benchmarks: offscreen QApplication, node registration and timing
+"""
+import io
+import os
+import sys
+import time
+import contextlib
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtWidgets import QApplication
+
+from qdutils import *
+
+# node packages have no __init__ exports, import the modules to get them registered
+import statenodes.enter
+import statenodes.act
+import statenodes.exit
+import statenodes.pulse
+
+confg.DEBUG = False
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def timeit(func, repeat: int = 3) -> float:
+    """Returns the best wall time in seconds of ``repeat`` calls, stdout of ``func`` is dropped"""
+    best = None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def printTable(header: list, rows: list):
+    widths = [max(len(str(x)) for x in col) for col in zip(header, *rows)]
+    print('  '.join(str(x).rjust(w) for x, w in zip(header, widths)))
+    for row in rows:
+        print('  '.join(str(x).rjust(w) for x, w in zip(row, widths)))
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Graph statistics of many quests computed by walking model objects compared to one concatenated CSR export
+
+Both compute in-degrees, nodes reachable from the roots and the number of connected components. The export is
+paid once per quest file, the statistics run over all quests with a few NumPy calls per BFS level.
+"""
+from collections import deque
+
+from benchmarks.common import *
+
+from qdmodel import QD_ModelScene
+from qdscenecsr import QD_SceneCSR
+from benchmarks.modelload import buildData
+
+
+def objectStats(data: dict) -> tuple:
+    scene = QD_ModelScene()
+    scene.deserialize(data)
+
+    children = {}
+    inDegrees = dict.fromkeys(scene.nodes, 0)
+    for node in scene.nodes:
+        children[node] = [edge.getOtherSocket(sock).node for sock in node.sockets if sock.is_output for edge in sock.edges]
+        for child in children[node]:
+            inDegrees[child] += 1
+
+    roots = [node for node, degree in inDegrees.items() if degree == 0]
+    reached, queue = set(roots), deque(roots)
+    while queue:
+        for child in children[queue.popleft()]:
+            if child not in reached:
+                reached.add(child)
+                queue.append(child)
+
+    return len(reached), len(scene.components.components())
+
+
+def csrStats(csr: QD_SceneCSR) -> tuple:
+    labels = csr.componentLabels(ignorePulseEdge=True)
+    return int(csr.reachable(csr.inDegrees() == 0).sum()), len(set(labels.tolist()))
+
+
+def benchmark(quests: int, count: int) -> list:
+    data = buildData(count)
+
+    def objectWalk():
+        return [objectStats(data) for _ in range(quests)]
+
+    def export():
+        typeCodes = {}
+        return QD_SceneCSR.concatenate([QD_SceneCSR.fromData(data, typeCodes) for _ in range(quests)])
+
+    csr = export()
+    reached, components = csrStats(csr)
+    assert (reached, components) == tuple(sum(x) for x in zip(*objectWalk()))
+
+    objectTime = timeit(objectWalk, repeat=3)
+    exportTime = timeit(export, repeat=3)
+    statsTime = timeit(lambda: csrStats(csr), repeat=7)
+
+    milliseconds = lambda t: '%.1f' % (t * 1e3)
+    return [quests, count, milliseconds(objectTime), milliseconds(exportTime), milliseconds(statsTime), '%.0fx' % (objectTime / statsTime)]
+
+
+if __name__ == '__main__':
+    print('milliseconds for all quests, model objects include loading')
+    printTable(['quests', 'nodes', 'model objects', 'csr export', 'csr stats', 'stats speedup'],
+               [benchmark(quests, count) for quests, count in ((100, 50), (1000, 50), (1000, 200))])
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Typing into the content of a node which evaluates on every keystroke compared to debounced evaluation
+
+Every keystroke of the immediate version runs a pass over the node and its descendants, the debounced version
+runs one pass after the burst.
+"""
+import time
+
+from benchmarks.common import *
+
+from benchmarks.evalscheduler import _EvalNode, buildScene
+
+
+class _DebouncedEvalNode(_EvalNode):
+    evalDebounceMs = 20
+
+
+def typeKeys(scene, node, keys: int, immediate: bool):
+    for _ in range(keys):
+        # every keystroke changes the content
+        scene.evaluator.cache.clear()
+        if immediate:
+            node.onInputChanged(None)
+        else:
+            node.onContentChanged('text')
+
+    # let the debounce timer fire
+    while scene.evaluator.hasDebouncedNodes:
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def benchmark(count: int, keys: int) -> list:
+    row = [count, keys]
+    for nodeType, immediate in ((_EvalNode, True), (_DebouncedEvalNode, False)):
+        scene, nodes = buildScene(nodeType, count)
+        scene.evaluator.evaluations = 0
+        scene.evaluator.passes = 0
+
+        start = time.perf_counter()
+        typeKeys(scene, nodes[0], keys, immediate)
+        elapsed = time.perf_counter() - start
+
+        row += [scene.evaluator.passes, scene.evaluator.evaluations]
+        if immediate:
+            row.append('%.1f' % (elapsed * 1e3))
+        scene.clear()
+    return row
+
+
+if __name__ == '__main__':
+    print('passes and evaluations for a burst of keystrokes, debounced by 20ms')
+    printTable(['nodes', 'keys', 'immediate passes', 'evals', 'ms', 'debounced passes', 'evals'],
+               [benchmark(count, keys) for count, keys in ((10, 20), (20, 20), (20, 100))])
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Cost and outcome of ``itemAt`` over a dense bundle of edges, hit testing in Python against the bare centre line,
+against a stroked outline built on every call, and as shipped: the cached outline tested by Qt itself
+
+Every pulse node is connected to every exit node. Probes are picked at random in the bounds of the bundle, and
+a few pixels beside random edges: the ones beside an edge should find an edge. The bare line is filled for hit
+tests, a direct line is never found, and a curve closed by its chord is found far away from the line itself.
+The python variants cost a call back into Python for the bounding rect and the shape of every candidate edge.
+"""
+import contextlib
+import gc
+import random
+
+from PySide6.QtCore import QPointF
+from PySide6.QtGui import QTransform, QPainterPathStroker
+from PySide6.QtWidgets import QGraphicsPathItem
+
+from benchmarks.common import *
+
+from qdedge import QD_Edge
+from qdedgegfx import QD_EdgeGfx, EDGE_HIT_WIDTH
+from qdmodel import EdgeType
+from qdquestscene import QD_QuestScene
+from qdsocketgfx import SocketType
+
+
+def buildScene(count: int, edgeType: EdgeType) -> QD_QuestScene:
+    """``count`` pulse nodes on the left, ``count`` exit nodes on the right, ``count * count`` edges"""
+    pulseType, exitType = utils.getStateNodeType('StateNode_pulse'), utils.getStateNodeType('StateNode_exit')
+    scene = QD_QuestScene()
+
+    pulses = [pulseType(scene) for _ in range(count)]
+    exits = [exitType(scene) for _ in range(count)]
+    for index, (pulse, exit) in enumerate(zip(pulses, exits)):
+        pulse.setPos(0, index * 120)
+        exit.setPos(2000, index * 120)
+
+    for pulse in pulses:
+        for exit in exits:
+            QD_Edge(scene, pulse.getSocket(SocketType.PulseOut), exit.getSocket(SocketType.In), edge_type=edgeType)
+    return scene
+
+
+@contextlib.contextmanager
+def hitShape(kind: str):
+    """Edge items hit test in Python against the bare line or a stroke built on every call, or as shipped"""
+    def strokedShape(self):
+        stroker = QPainterPathStroker()
+        stroker.setWidth(self.hitWidth)
+        return stroker.createStroke(self.edgePath())
+
+    if kind != 'outline':
+        QD_EdgeGfx.boundingRect = lambda self: QGraphicsPathItem.boundingRect(self)
+        QD_EdgeGfx.shape = strokedShape if kind == 'stroked' else lambda self: self.edgePath()
+    try:
+        yield
+    finally:
+        if kind != 'outline':
+            del QD_EdgeGfx.boundingRect, QD_EdgeGfx.shape
+
+
+def makeProbes(scene: QD_QuestScene, probes: int) -> tuple:
+    """Random points in the bounds of the bundle and points 3px beside random edges"""
+    rand = random.Random(0)
+
+    bounds = scene.gfx.itemsBoundingRect()
+    randomProbes = [QPointF(rand.uniform(bounds.left(), bounds.right()), rand.uniform(bounds.top(), bounds.bottom())) for _ in range(probes)]
+
+    besideProbes = []
+    for edge in rand.sample(scene.edges, probes):
+        path = edge.gfx.edgePath()
+        percent = rand.uniform(0.2, 0.8)
+        point, angle = path.pointAtPercent(percent), path.angleAtPercent(percent)
+        besideProbes.append(point + QTransform().rotate(-angle).map(QPointF(0, 3)))
+    return randomProbes, besideProbes
+
+
+def benchmark(count: int, edgeType: EdgeType, probes: int = 200) -> list:
+    transform = QTransform()
+    isEdge = lambda item: isinstance(item, QD_EdgeGfx)
+
+    # a found edge is far if its line is not within half the hit width of the probe
+    near = QPainterPathStroker()
+    near.setWidth(EDGE_HIT_WIDTH + 2)
+    isFar = lambda item, point: isEdge(item) and not near.createStroke(item.edgePath()).contains(point)
+
+    row = []
+    times = []
+    for kind in ('line', 'stroked', 'outline'):
+        # a scene per run, PySide looks up python overrides only once per item
+        with hitShape(kind):
+            scene = buildScene(count, edgeType)
+            randomProbes, besideProbes = makeProbes(scene, probes)
+            probe = lambda points: [scene.gfx.itemAt(point, transform) for point in points]
+
+            if not row:
+                row.append(len(scene.edges))
+            probe(randomProbes)
+            times.append(timeit(lambda: probe(randomProbes), repeat=3))
+            row.append('%.0f' % (times[-1] * 1e6 / probes))
+            if kind != 'stroked':
+                row.append('%.0f%%' % (100 * sum(map(isEdge, probe(besideProbes))) / probes))
+                row.append('%.0f%%' % (100 * sum(map(isFar, probe(randomProbes), randomProbes)) / probes))
+
+            scene.clear()
+            del scene, probe
+            gc.collect()
+    row.append('%.1fx' % (times[0] / times[2]))
+    return row
+
+
+if __name__ == '__main__':
+    print('microseconds per itemAt at random points, share of points 3px beside an edge which find an edge, and')
+    print('share of random points which find an edge far from its line')
+    header = ['edges', 'line us', 'line beside', 'line far', 'stroked us', 'outline us', 'outline beside', 'outline far', 'speedup']
+    for edgeType in (EdgeType.Bezier, EdgeType.Direct):
+        print(edgeType.name)
+        printTable(header, [benchmark(count, edgeType) for count in (30, 100)])
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Panning a view over a dense bundle of edges with cached edge paths compared to rebuilding them on every call
+
+Every pulse node is connected to every exit node, the view scrolls across the bundle one frame at a time.
+Rebuilding is what the edge items did before they kept their path: a new path on every paint, shape and
+bounding rect call.
+"""
+import contextlib
+import gc
+
+from PySide6.QtGui import QImage, QPainter
+
+from benchmarks.common import *
+
+from qdedge import QD_Edge
+from qdedgegfx import QD_EdgeGfx, GfxEdgeDirect, GfxEdgeBezier
+from qdquestscene import QD_QuestScene
+from qdsocketgfx import SocketType
+from qdviewgfx import QD_ViewGfx
+
+
+def buildScene(count: int) -> QD_QuestScene:
+    """``count`` pulse nodes on the left, ``count`` exit nodes on the right, ``count * count`` edges"""
+    pulseType, exitType = utils.getStateNodeType('StateNode_pulse'), utils.getStateNodeType('StateNode_exit')
+    scene = QD_QuestScene()
+
+    pulses = [pulseType(scene) for _ in range(count)]
+    exits = [exitType(scene) for _ in range(count)]
+    for index, (pulse, exit) in enumerate(zip(pulses, exits)):
+        pulse.setPos(0, index * 120)
+        exit.setPos(2000, index * 120)
+
+    for pulse in pulses:
+        for exit in exits:
+            QD_Edge(scene, pulse.getSocket(SocketType.PulseOut), exit.getSocket(SocketType.In))
+    return scene
+
+
+@contextlib.contextmanager
+def rebuildingPaths():
+    """Edge items build a new path on every call, like before the path got cached"""
+    cached = QD_EdgeGfx.edgePath
+    QD_EdgeGfx.edgePath = lambda self: self.calcPath()
+    QD_EdgeGfx.boundingRect = lambda self: self.calcPath().boundingRect()
+    try:
+        yield
+    finally:
+        # the items use QGraphicsPathItem's bounding rect again
+        QD_EdgeGfx.edgePath = cached
+        del QD_EdgeGfx.boundingRect
+
+
+def benchmark(count: int, frames: int = 20) -> list:
+    image = QImage(1600, 1000, QImage.Format.Format_ARGB32_Premultiplied)
+
+    calls = [0]
+    calcPaths = {edgeClass: edgeClass.calcPath for edgeClass in (GfxEdgeDirect, GfxEdgeBezier)}
+
+    def counting(calcPath):
+        def countingCalcPath(self):
+            calls[0] += 1
+            return calcPath(self)
+        return countingCalcPath
+
+    results = []
+    for edgeClass, calcPath in calcPaths.items():
+        edgeClass.calcPath = counting(calcPath)
+    try:
+        for context in (rebuildingPaths(), contextlib.nullcontext()):
+            # a scene per run, PySide looks up python overrides only once per item
+            with context:
+                scene = buildScene(count)
+                view = QD_ViewGfx(scene.gfx)
+                view.resize(1600, 1000)
+                bounds = scene.gfx.itemsBoundingRect()
+
+                def pan():
+                    # one frame per step, like dragging the view across the bundle
+                    for frame in range(frames):
+                        x = bounds.left() + bounds.width() * frame / frames
+                        view.centerOn(x, bounds.center().y())
+                        painter = QPainter(image)
+                        view.render(painter)
+                        painter.end()
+
+                pan()
+                calls[0] = 0
+                results.append(timeit(pan, repeat=3))
+                results.append(calls[0] / 3 / frames)
+
+                edges = len(scene.edges)
+                view.setScene(None)
+                scene.clear()
+                del scene, view
+                gc.collect()
+    finally:
+        for edgeClass, calcPath in calcPaths.items():
+            edgeClass.calcPath = calcPath
+
+    milliseconds = lambda t: '%.1f' % (t * 1e3 / frames)
+    return [edges, milliseconds(results[0]), '%.0f' % results[1], milliseconds(results[2]), '%.0f' % results[3], '%.1fx' % (results[0] / results[2])]
+
+
+if __name__ == '__main__':
+    print('per frame while panning: milliseconds and calcPath calls')
+    printTable(['edges', 'rebuild ms', 'rebuild paths', 'cached ms', 'cached paths', 'speedup'],
+               [benchmark(count) for count in (20, 50, 71)])
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Evaluations after an edit of the first node of a chain with the result cache compared to evaluating everything
+
+The edit changes a note in the node content, which changes its cache key but not its value, so with the cache
+only the edited node evaluates and everything downstream takes its cached result.
+"""
+import time
+
+from benchmarks.common import *
+
+from benchmarks.evalscheduler import _EvalNode, buildScene
+from qdsocketgfx import SocketType
+
+
+class _NotedEvalNode(_EvalNode):
+    def __init__(self, scene: 'QD_QuestScene'):
+        super().__init__(scene)
+        self.note = 0
+
+    def serialize(self) -> dict:
+        return super().serialize() | {'note': self.note}
+
+    def evalImplementation(self):
+        # stands in for real work
+        time.sleep(0.001)
+        return super().evalImplementation()
+
+
+def benchmark(count: int) -> list:
+    scene, nodes = buildScene(_NotedEvalNode, count)
+    nodes[0].onInputChanged(None)
+
+    def edit(useCache: bool):
+        if not useCache:
+            scene.evaluator.cache.clear()
+        nodes[0].note += 1
+        nodes[0].onInputChanged(None)
+
+    row = [count]
+    for useCache in (False, True):
+        scene.evaluator.evaluations = 0
+        elapsed = timeit(lambda: edit(useCache), repeat=3)
+        row += [scene.evaluator.evaluations // 3, '%.1f' % (elapsed * 1e3)]
+
+    cache = scene.evaluator.cache
+    row.append('%d/%d' % (cache.hits.total(), cache.misses.total()))
+    scene.clear()
+    return row
+
+
+if __name__ == '__main__':
+    print('evaluations and milliseconds per edit, every evaluation takes 1ms')
+    printTable(['nodes', 'no cache evals', 'ms', 'cached evals', 'ms', 'hits/misses'], [benchmark(count) for count in (10, 20, 40)])
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Evaluations after an input change with the scheduler compared to the former recursive evalChildren
+
+The graph is a ladder where node ``i`` feeds nodes ``i + 1`` and ``i + 2``, so the number of paths to a node grows
+like the Fibonacci numbers. Each node lists its farther child first, the recursive version then evaluates a node
+before all of its inputs are done and again for every path reaching it.
+
+Evaluation counts don't show work done around ``evalImplementation``, the time of a pass over a long chain does:
+it has to grow linearly with the chain, a node walking all its descendants while evaluating makes it quadratic.
+"""
+from collections import deque
+
+from benchmarks.common import *
+
+from PySide6.QtCore import QPointF
+
+from qdedge import QD_Edge
+from qdquestscene import QD_QuestScene
+from qdsocketgfx import SocketType
+
+
+class _EvalNode(utils.getStateNodeType('StateNode_pulse')):
+    """Pulse node with a dirty flag and a value summing its inputs"""
+
+    def __init__(self, scene: 'QD_QuestScene'):
+        self._dirty = False
+        super().__init__(scene, [SocketType.In, SocketType.Out_False, SocketType.Out_True])
+        self.value = 0
+
+    def isDirty(self) -> bool:
+        return self._dirty
+
+    def markDirty(self, new_value: bool = True):
+        self._dirty = new_value
+
+    def getSocketPosition(self, socktype: SocketType) -> QPointF:
+        return QPointF(0 if socktype.is_in else self.gfx.width, self.gfx.height * (0.3 if socktype is SocketType.Out_True else 0.7))
+
+    def evalImplementation(self):
+        self.value = 1 + sum(node.value for node in self.getInputs())
+        self.markDirty(False)
+        self.evalChildren()
+        return self.value
+
+
+class _RecursiveEvalNode(_EvalNode):
+    """Former evaluation: descendants marked two levels deep and children evaluated recursively"""
+
+    def evalImplementation(self):
+        self.markDescendantsDirty()
+        return super().evalImplementation()
+
+    def markDescendantsDirty(self, new_value: bool = True):
+        for other_node in self.getChildrenNodes():
+            other_node.markDirty(new_value)
+            other_node.markChildrenDirty(new_value)
+
+    def evalChildren(self):
+        for node in self.getChildrenNodes():
+            node.eval()
+
+    def onInputChanged(self, socket: 'QD_Socket'):
+        self.markDirty()
+        self.markDescendantsDirty()
+        self.eval()
+
+    def evalContentKey(self):
+        # never equal to a cached key, there was no result cache either
+        return object()
+
+
+def buildScene(nodeType: type, count: int, ladder: bool = True) -> QD_QuestScene:
+    scene = QD_QuestScene()
+    nodes = [nodeType(scene) for _ in range(count)]
+
+    for i, node in enumerate(nodes):
+        node.setPos(i * 200, (i % 2) * 200)
+        if i + 1 < count:
+            QD_Edge(scene, node.getSocket(SocketType.Out_True), nodes[i + 1].getSocket(SocketType.In))
+        if ladder and i + 2 < count:
+            QD_Edge(scene, node.getSocket(SocketType.Out_False), nodes[i + 2].getSocket(SocketType.In))
+    return scene, nodes
+
+
+def benchmark(count: int) -> list:
+    row = [count]
+    for nodeType in (_RecursiveEvalNode, _EvalNode):
+        scene, nodes = buildScene(nodeType, count)
+
+        def inputChanged():
+            scene.evaluator.evaluations = 0
+            scene.evaluator.cache.clear()
+            nodes[0].onInputChanged(nodes[0].getSocket(SocketType.In))
+
+        elapsed = timeit(inputChanged, repeat=3)
+        row += [scene.evaluator.evaluations, '%.1f' % (elapsed * 1e3), nodes[-1].value]
+        scene.clear()
+    return row
+
+
+def chain(count: int) -> list:
+    """Milliseconds of the pass after changing the input of the first node of a chain"""
+    scene, nodes = buildScene(_EvalNode, count, ladder=False)
+
+    def inputChanged():
+        scene.evaluator.cache.clear()
+        nodes[0].onInputChanged(nodes[0].getSocket(SocketType.In))
+
+    elapsed = timeit(inputChanged, repeat=3)
+    scene.clear()
+    return [count, '%.1f' % (elapsed * 1e3), '%.1f' % (elapsed * 1e6 / count)]
+
+
+if __name__ == '__main__':
+    print('evaluations and milliseconds after changing the input of the first node')
+    printTable(['nodes', 'recursive evals', 'ms', 'last value', 'scheduled evals', 'ms', 'last value'],
+               [benchmark(count) for count in (10, 15, 20)])
+    print()
+    print('milliseconds of the pass after changing the input of the first node of a chain')
+    printTable(['nodes', 'ms', 'us per node'], [chain(count) for count in (250, 500, 1000)])
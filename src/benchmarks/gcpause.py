@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Garbage collector pauses while editing a loaded scene, with and without freezing the objects of the loaded document
+
+The edit moves every node a few times and stores a history stamp after each round, like dragging does.
+Also checks that removed nodes are freed by reference counting alone.
+"""
+import gc
+import weakref
+
+from benchmarks.common import *
+
+from qdgc import QD_GCMonitor, loadingDocument
+from qdquestscene import QD_QuestScene
+from benchmarks.modelload import buildData
+
+
+def loadScene(data: dict) -> QD_QuestScene:
+    nodeType = utils.getStateNodeType('StateNode_pulse')
+
+    scene = QD_QuestScene()
+    scene.setNodeClassSelector(lambda data: nodeType)
+    scene.deserialize(data)
+    scene.history.storeInitialHistoryStamp()
+    return scene
+
+
+def edit(scene: QD_QuestScene, rounds: int):
+    for i in range(rounds):
+        for node in scene.nodes:
+            node.setPos(node.pos.x() + 1, node.pos.y())
+        scene.history.storeHistory("Moved nodes", setModified=True)
+
+
+def freedByRefcount(scene: QD_QuestScene) -> bool:
+    gc.disable()
+    try:
+        node = scene.nodes[len(scene.nodes) // 2]
+        refs = [weakref.ref(node), weakref.ref(node.gfx)] + [weakref.ref(socket) for socket in node.sockets]
+        node.remove()
+        del node
+        return all(ref() is None for ref in refs)
+    finally:
+        gc.enable()
+
+
+def benchmark(count: int, freeze: bool, rounds: int = 20) -> list:
+    data = buildData(count)
+    gc.collect()
+
+    if freeze:
+        with loadingDocument():
+            scene = loadScene(data)
+    else:
+        scene = loadScene(data)
+
+    monitor = QD_GCMonitor()
+    monitor.start()
+    timeit(lambda: edit(scene, rounds), repeat=1)
+    monitor.stop()
+
+    freed = freedByRefcount(scene)
+
+    scene.clear()
+    del scene
+    gc.unfreeze()
+    gc.collect()
+
+    fullPauses = [seconds for generation, seconds, _ in monitor.pauses if generation == 2]
+    milliseconds = lambda t: '%.1f' % (t * 1e3)
+    return [count, 'yes' if freeze else 'no', len(monitor.pauses), milliseconds(sum(seconds for _, seconds, _ in monitor.pauses)),
+            len(fullPauses), milliseconds(max(fullPauses, default=0)), 'yes' if freed else 'no']
+
+
+if __name__ == '__main__':
+    rows = []
+    for count in (200, 400):
+        rows.append(benchmark(count, False))
+        rows.append(benchmark(count, True))
+    printTable(['nodes', 'frozen', 'collections', 'total ms', 'full collections', 'max full ms', 'freed without gc'], rows)
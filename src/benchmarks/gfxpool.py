@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Undo and redo of a large deletion with and without reusing graphics items, widgets and contents of removed nodes,
+sockets and edges
+
+The scene repeats a chain of every state node type. The pool runs as the editor creates it, only the run without
+reuse changes its limit. The op nodes in ``nodes`` aren't ported yet and can't be saved, so none are part of it.
+"""
+import gc
+
+from benchmarks.common import *
+
+from qdedge import QD_Edge
+from qdquestscene import QD_QuestScene
+from qdsocketgfx import SocketType
+
+
+CHAIN = ['StateNode_enter', 'StateNode_act', 'StateNode_pulse', 'StateNode_exit']
+
+
+def buildScene(count: int) -> QD_QuestScene:
+    """``count`` chains of every state node type"""
+    scene = QD_QuestScene()
+    scene.setNodeClassSelector(lambda data: utils.getStateNodeType(data['type']))
+
+    for row in range(count):
+        nodes = [utils.getStateNodeType(typeName)(scene) for typeName in CHAIN]
+        for column, node in enumerate(nodes):
+            node.setPos(column * 300, row * 200)
+
+        for node1, node2 in zip(nodes, nodes[1:]):
+            QD_Edge(scene, node1.getSocket(SocketType.Out_True), node2.getSocket(SocketType.In))
+
+    scene.history.storeInitialHistoryStamp()
+    return scene
+
+
+def deleteAll(scene):
+    with scene.transaction("Delete all"):
+        for node in scene.nodes.copy():
+            node.remove()
+        scene.history.storeHistory("Delete all", setModified=True)
+
+
+def benchmark(count: int) -> list:
+    times = []
+    for reuse in (False, True):
+        scene = buildScene(count)
+        if not reuse:
+            scene.gfxPool.limit = 0
+        deleteAll(scene)
+
+        def undoRedo():
+            scene.history.undo()
+            scene.history.redo()
+
+        times.append(timeit(undoRedo, repeat=5))
+
+        scene.clear()
+        del scene
+        gc.collect()
+
+    milliseconds = lambda t: '%.0f' % (t * 1e3)
+    return [count * len(CHAIN), milliseconds(times[0]), milliseconds(times[1]), '%.1fx' % (times[0] / times[1])]
+
+
+if __name__ == '__main__':
+    print('milliseconds per undo and redo of deleting every node')
+    printTable(['nodes', 'no pool', 'pool', 'speedup'], [benchmark(count) for count in (25, 50, 100)])
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Saved size and load time of sequential ids compared to the address-style ids of older files
+"""
+import json
+
+from benchmarks.common import *
+
+from qdmodel import QD_ModelScene
+from benchmarks.modelload import buildData
+
+
+def toLegacyIds(data: dict) -> dict:
+    """Same scene with ids shaped like the memory addresses older versions saved"""
+    legacy = lambda objId: None if objId is None else 2975034525344 + objId * 16
+    return data | {
+        'id': legacy(data['id']),
+        'nodes': [nodeData | {'id': legacy(nodeData['id']), 'sockets': [sockData | {'id': legacy(sockData['id'])} for sockData in nodeData['sockets']]} for nodeData in data['nodes']],
+        'edges': [edgeData | {'id': legacy(edgeData['id']), 'start': legacy(edgeData['start']), 'end': legacy(edgeData['end'])} for edgeData in data['edges']],
+    }
+
+
+def benchmark(count: int) -> list:
+    data = buildData(count)
+    legacyData = toLegacyIds(data)
+
+    sequentialTime = timeit(lambda: QD_ModelScene().deserialize(data), repeat=7)
+    legacyTime = timeit(lambda: QD_ModelScene().deserialize(legacyData), repeat=7)
+
+    kilobytes = lambda d: '%.0f' % (len(json.dumps(d, indent=4)) / 1024)
+    milliseconds = lambda t: '%.1f' % (t * 1e3)
+    return [count, kilobytes(legacyData), kilobytes(data), milliseconds(legacyTime), milliseconds(sequentialTime)]
+
+
+if __name__ == '__main__':
+    printTable(['nodes', 'legacy KB', 'sequential KB', 'legacy load ms', 'sequential load ms'], [benchmark(count) for count in (1000, 4000, 16000)])
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Load speed of the headless model compared to the editor scene for the same quest data
+"""
+import gc
+
+from benchmarks.common import *
+
+from qdmodel import QD_ModelScene, QD_ModelNode, QD_ModelEdge
+from qdquestscene import QD_QuestScene
+from qdsocketgfx import SocketType
+
+
+def buildData(count: int) -> dict:
+    """Chain of pulse nodes built with the model itself, so no widgets are needed to create the input"""
+    model = QD_ModelScene()
+
+    nodes = []
+    for i in range(count):
+        node = QD_ModelNode(model, 'StateNode_pulse')
+        for socktype in (SocketType.In, SocketType.Out_True, SocketType.PulseOut):
+            node.addSocket(QD_ModelNode.Socket_class(node, socktype))
+        node.setPos(i * 100.0, 0.0)
+        model.addNode(node)
+        nodes.append(node)
+
+    for node1, node2 in zip(nodes, nodes[1:]):
+        QD_ModelEdge(model, node1.getSocket(SocketType.Out_True), node2.getSocket(SocketType.In))
+    return model.serialize()
+
+
+def benchmark(count: int) -> list:
+    data = buildData(count)
+    nodeType = utils.getStateNodeType('StateNode_pulse')
+
+    def loadScene():
+        scene = QD_QuestScene()
+        scene.setNodeClassSelector(lambda data: nodeType)
+        scene.deserialize(data)
+        scene.clear()
+
+    modelTime = timeit(lambda: QD_ModelScene().deserialize(data))
+    sceneTime = timeit(loadScene, repeat=1)
+    gc.collect()
+
+    return [count, '%.0f' % (count / modelTime), '%.0f' % (count / sceneTime), '%.0fx' % (sceneTime / modelTime)]
+
+
+if __name__ == '__main__':
+    print('nodes loaded per second')
+    printTable(['nodes', 'QD_ModelScene', 'QD_QuestScene', 'speedup'], [benchmark(count) for count in (100, 200, 400)])
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Footprint of socket and edge model objects, and throughput of connection validation
+
+Memory is the shallow size of the python objects (instance plus its ``__dict__`` if any), gfx items are not counted.
+"""
+import gc
+import sys
+import random
+
+from benchmarks.common import *
+
+from qdquestscene import QD_QuestScene
+from qdviewgfx import QD_ViewGfx
+from qdedge import QD_Edge
+from qdsocketgfx import SocketType
+
+
+def shallowSize(obj) -> int:
+    return sys.getsizeof(obj) + (sys.getsizeof(obj.__dict__) if hasattr(obj, '__dict__') else 0)
+
+
+def buildScene(count: int) -> QD_QuestScene:
+    nodeType = utils.getStateNodeType('StateNode_pulse')
+
+    scene = QD_QuestScene()
+    nodes = [nodeType(scene) for _ in range(count)]
+    for node1, node2 in zip(nodes, nodes[1:]):
+        QD_Edge(scene, node1.getSocket(SocketType.Out_True), node2.getSocket(SocketType.In))
+    return scene
+
+
+def benchmark(count: int = 200, checks: int = 20000) -> list:
+    scene = buildScene(count)
+    view = QD_ViewGfx(scene.gfx)
+
+    sockets = [socket for node in scene.nodes for socket in node.sockets]
+    socketBytes = sum(shallowSize(socket) for socket in sockets) / len(sockets)
+    edgeBytes = sum(shallowSize(edge) for edge in scene.edges) / len(scene.edges)
+
+    random.seed(0)
+    pairs = [(random.choice(sockets), random.choice(sockets)) for _ in range(checks)]
+    checkTime = timeit(lambda: [view.canConnectSockets(socket1, socket2) for socket1, socket2 in pairs], repeat=7)
+    flagTime = timeit(lambda: [(socket.type.is_in, socket.type.is_pulse) for socket, _ in pairs], repeat=7)
+
+    del scene, view, sockets, pairs
+    gc.collect()
+
+    return ['%.0f KiB' % (socketBytes * 10000 / 1024), '%.0f KiB' % (edgeBytes * 10000 / 1024), '%.0f' % (checks / checkTime), '%.0f' % (checks / flagTime)]
+
+
+if __name__ == '__main__':
+    printTable(['10k sockets', '10k edges', 'canConnectSockets/s', 'flag pairs/s'], [benchmark()])
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+Paint time per node type with body paths shared per size compared to building them on every paint
+
+Every node item is painted into an offscreen image, plain and hovered. Rebuilding is what the items did before
+the paths got cached: new title, content and outline paths, simplified, on every paint call. It simplifies the
+outline once where hovered nodes used to do it twice, so it slightly understates the old cost.
+"""
+import contextlib
+
+from PySide6.QtGui import QImage, QPainter
+from PySide6.QtWidgets import QStyleOptionGraphicsItem
+
+from benchmarks.common import *
+
+from qdopnode import QD_OpNode
+from qdopnodecontent import QD_OpNodeContent
+from qdopnodecontentgfx import QD_OpNodeContentGfx
+from qdquestscene import QD_QuestScene
+from qdstatescene import QD_StateScene
+
+
+class _EmptyContentGfx(QD_OpNodeContentGfx):
+    def initUI(self):
+        pass
+
+
+class _EmptyContent(QD_OpNodeContent):
+    NodeContentGfx_class = _EmptyContentGfx
+
+
+class _EmptyOpNode(QD_OpNode):
+    """The op nodes in ``nodes`` aren't ported yet, this one paints the same body with an empty content"""
+    NodeContent_class = _EmptyContent
+
+
+@contextlib.contextmanager
+def rebuildingPaths():
+    """Node items build their paths on every paint, like before they got cached"""
+    enterGfx = utils.getStateNodeType('StateNode_enter').StateNodeGfx_class
+    cached = Utils.titledNodePaths, Utils.ellipseNodePaths, enterGfx.textPath
+
+    Utils.titledNodePaths = staticmethod(Utils.titledNodePaths.__wrapped__)
+    Utils.ellipseNodePaths = staticmethod(Utils.ellipseNodePaths.__wrapped__)
+    enterGfx.textPath = staticmethod(enterGfx.textPath.__wrapped__)
+    try:
+        yield
+    finally:
+        Utils.titledNodePaths, Utils.ellipseNodePaths = map(staticmethod, cached[:2])
+        enterGfx.textPath = staticmethod(cached[2])
+
+
+def buildNodes() -> list:
+    """One node of every type with a body, the op node lives in the scene of a state node"""
+    scene = QD_QuestScene()
+    nodes = [utils.getStateNodeType(typeName)(scene) for typeName in ('StateNode_enter', 'StateNode_act', 'StateNode_exit', 'StateNode_pulse')]
+    nodes.append(_EmptyOpNode(QD_StateScene()))
+    return nodes
+
+
+def benchmark(node, paints: int = 2000) -> list:
+    image = QImage(200, 200, QImage.Format.Format_ARGB32_Premultiplied)
+    option = QStyleOptionGraphicsItem()
+
+    def paint():
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        for _ in range(paints):
+            node.gfx.paint(painter, option)
+        painter.end()
+
+    row = [type(node).__name__]
+    for hovered in (False, True):
+        node.gfx.hovered = hovered
+        times = []
+        for context in (rebuildingPaths(), contextlib.nullcontext()):
+            with context:
+                paint()
+                times.append(timeit(paint, repeat=3))
+        row += ['%.1f' % (t * 1e6 / paints) for t in times] + ['%.1fx' % (times[0] / times[1])]
+    node.gfx.hovered = False
+    return row
+
+
+if __name__ == '__main__':
+    print('microseconds per paint call')
+    printTable(['node', 'rebuild', 'cached', 'speedup', 'hovered rebuild', 'hovered cached', 'hovered speedup'],
+               [benchmark(node) for node in buildNodes()])
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+Players simulated per second walking one player at a time in Python compared to the NumPy simulator
+
+The quest is a chain of acts: ``Out_True`` goes on, ``Out_False`` goes back one act, every fifth act leads
+through a pulse node whose pulse output ends in a dead end. Acts time out after two minutes.
+"""
+import math
+import os
+import random
+
+from benchmarks.common import *
+
+from qdmodel import QD_ModelScene, QD_ModelNode, QD_ModelEdge
+from qdquestsim import QD_QuestSimModel, QD_QuestSimulator, parseTimeout
+from qdsocketgfx import SocketType
+
+
+def buildData(count: int) -> dict:
+    model = QD_ModelScene()
+
+    def addNode(typeName, socktypes):
+        node = QD_ModelNode(model, typeName)
+        for socktype in socktypes:
+            node.addSocket(QD_ModelNode.Socket_class(node, socktype))
+        model.addNode(node)
+        return node
+
+    def connect(node1, socktype, node2, intype=SocketType.In):
+        QD_ModelEdge(model, node1.getSocket(socktype), node2.getSocket(intype))
+
+    enter = addNode('StateNode_enter', (SocketType.Out_True,))
+    acts = [addNode('StateNode_act', (SocketType.In, SocketType.Out_True, SocketType.Out_False)) for _ in range(count)]
+    exit = addNode('StateNode_exit', (SocketType.In,))
+    for act in acts:
+        act.fields['confg'] = {'log': '', 'comment': '', 'timeout': '120'}
+
+    connect(enter, SocketType.Out_True, acts[0])
+    for index, act in enumerate(acts):
+        nextNode = acts[index + 1] if index + 1 < count else exit
+        if index % 5 == 4:
+            pulse = addNode('StateNode_pulse', (SocketType.In, SocketType.Out_True, SocketType.PulseOut))
+            lost = addNode('StateNode_act', (SocketType.In, SocketType.PulseIn))
+            connect(act, SocketType.Out_True, pulse)
+            connect(pulse, SocketType.Out_True, nextNode)
+            connect(pulse, SocketType.PulseOut, lost, SocketType.PulseIn)
+        else:
+            connect(act, SocketType.Out_True, nextNode)
+        connect(act, SocketType.Out_False, acts[max(0, index - 1)])
+    return model.serialize()
+
+
+def walkPlayers(data: dict, players: int, branchWeights: dict, meanStepTime: float, maxSteps: int) -> dict:
+    """What simulating player by player over the saved data looks like"""
+    nodes = {node['id']: node for node in data['nodes']}
+    sockets = {sock['id']: (node['id'], SocketType(sock['type'])) for node in data['nodes'] for sock in node['sockets']}
+
+    outEdges = {nodeId: {} for nodeId in nodes}
+    for edge in data['edges']:
+        (startNode, startType), (endNode, endType) = sockets[edge['start']], sockets[edge['end']]
+        if startType.is_in:
+            startNode, startType, endNode = endNode, endType, startNode
+        outEdges[startNode].setdefault(startType, []).append(endNode)
+
+    enters = [nodeId for nodeId, node in nodes.items() if node['type'] == 'StateNode_enter']
+    outcomes = {'completed': 0, 'deadEnd': 0, 'timeout': 0, 'unfinished': 0}
+    rand = random.Random(0)
+    for _ in range(players):
+        nodeId, elapsed = rand.choice(enters), 0.0
+        for _ in range(maxSteps):
+            node = nodes[nodeId]
+            if node['type'] == 'StateNode_exit':
+                outcomes['completed'] += 1
+                break
+
+            if node['type'] == 'StateNode_act':
+                duration = rand.expovariate(1.0 / meanStepTime)
+                elapsed += duration
+                if duration > parseTimeout(node.get('confg', {}).get('timeout')):
+                    outcomes['timeout'] += 1
+                    break
+
+            choices = list(outEdges[nodeId].items())
+            if not choices:
+                outcomes['deadEnd'] += 1
+                break
+
+            weights = [branchWeights.get(nodeId, {}).get(socktype, 1.0) for socktype, _ in choices]
+            targets = rand.choices(choices, weights)[0][1]
+            nodeId = rand.choice(targets)
+        else:
+            outcomes['unfinished'] += 1
+    return outcomes
+
+
+def benchmark(count: int, players: int, loopPlayers: int = 20000) -> list:
+    data = buildData(count)
+
+    # players mostly succeed in an act, pulse nodes rarely fire
+    branchWeights = {}
+    for node in data['nodes']:
+        if node['type'] == 'StateNode_act':
+            branchWeights[node['id']] = {SocketType.Out_True: 0.9, SocketType.Out_False: 0.1}
+        elif node['type'] == 'StateNode_pulse':
+            branchWeights[node['id']] = {SocketType.Out_True: 0.99, SocketType.PulseOut: 0.01}
+
+    model = QD_QuestSimModel.fromData(data, branchWeights=branchWeights)
+    meanStepTime, maxSteps = 30.0, 10 * count
+
+    result = QD_QuestSimulator(model, processes=1).simulate(players, seed=0, meanStepTime=meanStepTime, maxSteps=maxSteps)
+    pooled = QD_QuestSimulator(model, processes=os.cpu_count()).simulate(players, seed=0, meanStepTime=meanStepTime, maxSteps=maxSteps)
+
+    loopTime = timeit(lambda: walkPlayers(data, loopPlayers, branchWeights, meanStepTime, maxSteps), repeat=1)
+    outcomes = walkPlayers(data, loopPlayers, branchWeights, meanStepTime, maxSteps)
+
+    # both simulate the same quest, rates agree within sampling noise
+    assert abs(outcomes['completed'] / loopPlayers - result.completionRate) < 5 * math.sqrt(0.25 / loopPlayers)
+
+    return [count, players, '%.1f%%' % (100 * result.completionRate), result.deadEnds.sum(), result.timeouts.sum(),
+            '%.0f' % (loopPlayers / loopTime), '%.0f' % result.playersPerSecond, '%.0f' % pooled.playersPerSecond]
+
+
+if __name__ == '__main__':
+    print('players per second, %d worker processes' % os.cpu_count())
+    printTable(['acts', 'players', 'completed', 'dead ends', 'timeouts', 'python loop', 'numpy', 'numpy pool'],
+               [benchmark(count, players) for count, players in ((20, 100000), (20, 1000000), (100, 1000000))])
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Cost of keeping dead nodes up to date while edges get removed and connected again, incremental compared to a
+full traversal after every change
+
+The quest is a ladder of act nodes between one enter and one exit node with a pulse node on every tenth rung,
+the edges changed are picked at random across the whole graph.
+"""
+import random
+from collections import deque
+
+from benchmarks.common import *
+
+from qdmodel import QD_ModelScene, QD_ModelNode, QD_ModelEdge
+from qdsocketgfx import SocketType
+
+
+def buildScene(count: int) -> QD_ModelScene:
+    scene = QD_ModelScene()
+
+    def addNode(typeName, socktypes):
+        node = QD_ModelNode(scene, typeName)
+        for socktype in socktypes:
+            node.addSocket(QD_ModelNode.Socket_class(node, socktype))
+        scene.addNode(node)
+        return node
+
+    enter = addNode('StateNode_enter', (SocketType.Out_True,))
+    exit = addNode('StateNode_exit', (SocketType.In,))
+
+    previous = [enter, enter]
+    for index in range(count):
+        rung = [addNode('StateNode_act', (SocketType.In, SocketType.Out_True, SocketType.Out_False, SocketType.PulseIn)) for _ in range(2)]
+        for node in rung:
+            QD_ModelEdge(scene, previous[0].getSocket(SocketType.Out_True), node.getSocket(SocketType.In))
+            QD_ModelEdge(scene, previous[1].getSocket(SocketType.Out_True), node.getSocket(SocketType.In))
+
+        if index % 10 == 9:
+            pulse = addNode('StateNode_pulse', (SocketType.In, SocketType.Out_True, SocketType.PulseOut))
+            QD_ModelEdge(scene, rung[0].getSocket(SocketType.Out_False), pulse.getSocket(SocketType.In))
+            QD_ModelEdge(scene, pulse.getSocket(SocketType.PulseOut), rung[1].getSocket(SocketType.PulseIn))
+        previous = rung
+
+    for node in previous:
+        QD_ModelEdge(scene, node.getSocket(SocketType.Out_True), exit.getSocket(SocketType.In))
+    return scene
+
+
+def fullDeadNodes(scene: QD_ModelScene) -> list:
+    """What finding dead nodes without incremental state costs: two traversals of the whole graph"""
+    succ, pred = {node: [] for node in scene.nodes}, {node: [] for node in scene.nodes}
+    for edge in scene.edges:
+        fromNode, toNode = scene.reachability.edgeEnds(edge)
+        succ[fromNode].append(toNode)
+        pred[toNode].append(fromNode)
+
+    def reach(starts, links):
+        reached, queue = set(starts), deque(starts)
+        while queue:
+            for node in links[queue.popleft()]:
+                if node not in reached:
+                    reached.add(node)
+                    queue.append(node)
+        return reached
+
+    forward = reach(scene.nodesOfType('StateNode_enter'), succ)
+    backward = reach(scene.nodesOfType('StateNode_exit'), pred)
+    return [node for node in scene.nodes if node not in forward or node not in backward]
+
+
+def benchmark(count: int, changes: int = 200) -> list:
+    scene = buildScene(count)
+    rand = random.Random(0)
+
+    # socket pair -> its edge, toggled edges get recreated
+    edges = {(edge.start_socket, edge.end_socket): edge for edge in rand.sample(scene.edges, changes)}
+
+    def toggle(check):
+        for sockets, edge in edges.items():
+            edge.remove()
+            check()
+            edges[sockets] = QD_ModelEdge(scene, *sockets)
+            check()
+
+    incrementalTime = timeit(lambda: toggle(lambda: None), repeat=3)
+    fullTime = timeit(lambda: toggle(lambda: fullDeadNodes(scene)), repeat=1)
+
+    assert set(fullDeadNodes(scene)) == set(scene.reachability.deadNodes())
+
+    perChange = lambda t: '%.1f' % (t * 1e6 / (2 * changes))
+    return [len(scene.nodes), perChange(incrementalTime), perChange(fullTime), '%.0fx' % (fullTime / incrementalTime)]
+
+
+if __name__ == '__main__':
+    print('microseconds per edge change, including the edge change itself')
+    printTable(['nodes', 'incremental', 'full traversal', 'speedup'], [benchmark(count) for count in (500, 2000, 8000)])
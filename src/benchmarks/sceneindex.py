@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Scaling of the id-keyed scene paths: undo/redo restore, selection restore and node removal
+
+Per-node cost should stay flat when the scene size doubles.
+"""
+import gc
+
+from benchmarks.common import *
+
+from qdquestscene import QD_QuestScene
+
+
+def buildScene(count: int) -> QD_QuestScene:
+    nodeType = utils.getStateNodeType('StateNode_exit')
+
+    scene = QD_QuestScene()
+    scene.setNodeClassSelector(lambda data: nodeType)
+
+    for i in range(count):
+        node = nodeType(scene)
+        node.setPos(i * 100, 0)
+    return scene
+
+
+def benchmark(count: int) -> list:
+    scene = buildScene(count)
+    for node in scene.nodes:
+        node.gfx.setSelected(True)
+
+    stamp = scene.history.createHistoryStamp('benchmark')
+
+    restoreTime = timeit(lambda: scene.deserialize(stamp['snapshot']))
+    selectTime = timeit(lambda: scene.history.restoreHistoryStamp(stamp))
+    clearTime = timeit(scene.clear, repeat=1)
+
+    del scene
+    gc.collect()
+
+    perNode = lambda t: '%.1f' % (t * 1e6 / count)
+    return [count, perNode(restoreTime), perNode(selectTime), perNode(clearTime)]
+
+
+if __name__ == '__main__':
+    print('microseconds per node')
+    printTable(['nodes', 'deserialize', 'restore stamp', 'remove'], [benchmark(count) for count in (250, 500, 1000)])
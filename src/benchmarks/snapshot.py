@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Cost of scene snapshots after a few edits compared to copying the whole graph
+
+The incremental snapshot only rebuilds records of the edited objects, the rest of its cost is one dict copy.
+"""
+from benchmarks.common import *
+
+from qdmodel import QD_ModelScene
+from benchmarks.modelload import buildData
+
+
+def benchmark(count: int, edits: int = 10) -> list:
+    scene = QD_ModelScene()
+    scene.deserialize(buildData(count))
+    nodes = scene.nodes
+
+    def editAndSnapshot():
+        for node in nodes[:edits]:
+            node.setPos(node.position[0], node.position[1] + 1.0)
+        return scene.takeSnapshot()
+
+    def fullSnapshot():
+        scene.snapshotter.markAllChanged()
+        return scene.takeSnapshot()
+
+    scene.takeSnapshot()
+    fullTime = timeit(fullSnapshot, repeat=7)
+    incrementalTime = timeit(editAndSnapshot, repeat=7)
+
+    snapshot1 = scene.takeSnapshot()
+    snapshot2 = editAndSnapshot()
+    shared = sum(1 for nodeId, record in snapshot2.nodes.items() if snapshot1.nodes.get(nodeId) is record)
+
+    milliseconds = lambda t: '%.2f' % (t * 1e3)
+    return [count, milliseconds(fullTime), milliseconds(incrementalTime), '%.0fx' % (fullTime / incrementalTime), shared]
+
+
+if __name__ == '__main__':
+    print('milliseconds per snapshot, 10 nodes moved between snapshots')
+    printTable(['nodes', 'full', 'incremental', 'speedup', 'shared records'], [benchmark(count) for count in (2000, 8000, 32000)])
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Per-edge cost of connecting, laying out and disconnecting many pulse edges on one pair of sockets
+
+Per-edge cost should stay flat when the edge count doubles.
+"""
+import gc
+
+from benchmarks.common import *
+
+from qdquestscene import QD_QuestScene
+from qdedge import QD_Edge
+from qdsocketgfx import SocketType
+
+
+def benchmark(count: int) -> list:
+    scene = QD_QuestScene()
+
+    sender = utils.getStateNodeType('StateNode_pulse')(scene)
+    receiver = utils.getStateNodeType('StateNode_act')(scene)
+    receiver.addPulseIn()
+
+    pulseOut = sender.getSocket(SocketType.PulseOut)
+    pulseIn = receiver.getSocket(SocketType.PulseIn)
+
+    edges = []
+    connectTime = timeit(lambda: edges.append([QD_Edge(scene, pulseOut, pulseIn) for _ in range(count)]), repeat=1)
+    layoutTime = timeit(receiver.updateConnectedEdges)
+    # newest first, the worst case for a list based socket
+    disconnectTime = timeit(lambda: [edge.remove() for edge in reversed(edges[0])], repeat=1)
+
+    del scene, sender, receiver, pulseOut, pulseIn, edges
+    gc.collect()
+
+    perEdge = lambda t: '%.1f' % (t * 1e6 / count)
+    return [count, perEdge(connectTime), perEdge(layoutTime), perEdge(disconnectTime)]
+
+
+if __name__ == '__main__':
+    print('microseconds per edge')
+    printTable(['edges', 'connect', 'layout', 'disconnect'], [benchmark(count) for count in (500, 1000, 2000, 4000)])
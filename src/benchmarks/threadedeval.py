@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Time the GUI thread is blocked by evaluating slow nodes in place compared to evaluating them on the thread pool
+
+Each node spends 20ms in its evaluation, standing in for resolving items or checking conditions against data.
+The last column changes every input 5 times in a row and counts jobs cancelled before their result was applied.
+"""
+import time
+
+from benchmarks.common import *
+
+from benchmarks.evalscheduler import _EvalNode, buildScene
+from qdsocketgfx import SocketType
+
+WORK_SECONDS = 0.02
+
+
+class _SlowEvalNode(_EvalNode):
+    def evalImplementation(self):
+        time.sleep(WORK_SECONDS)
+        return super().evalImplementation()
+
+
+class _ThreadedEvalNode(_EvalNode):
+    evalInThread = True
+
+    def evalCompute(self, inputs, cancelled):
+        # sleeps in slices so a cancelled job stops early
+        deadline = time.perf_counter() + WORK_SECONDS
+        while time.perf_counter() < deadline and not cancelled.is_set():
+            time.sleep(0.001)
+        return 1 + sum(inputs)
+
+
+def changeInputs(scene, nodes, times: int = 1):
+    for _ in range(times):
+        # inputs change for real each time
+        scene.evaluator.cache.clear()
+        with scene.evaluator.batch():
+            for node in nodes:
+                node.onInputChanged(node.getSocket(SocketType.In))
+
+
+def waitForJobs(scene):
+    while scene.evaluator.pool.busy:
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def benchmark(count: int) -> list:
+    # separate single nodes, one pass evaluates all of them
+    row = [count]
+    for nodeType in (_SlowEvalNode, _ThreadedEvalNode):
+        scene, nodes = buildScene(nodeType, 1)
+        nodes += [nodeType(scene) for _ in range(count - 1)]
+
+        start = time.perf_counter()
+        changeInputs(scene, nodes)
+        blocked = time.perf_counter() - start
+        waitForJobs(scene)
+        done = time.perf_counter() - start
+
+        row += ['%.0f' % (blocked * 1e3), '%.0f' % (done * 1e3)]
+        if nodeType is _ThreadedEvalNode:
+            changeInputs(scene, nodes, times=5)
+            waitForJobs(scene)
+            row.append('%d/%d' % (scene.evaluator.pool.cancelledJobs, scene.evaluator.pool.submitted))
+        scene.clear()
+    return row
+
+
+if __name__ == '__main__':
+    print('milliseconds the GUI thread is blocked and until all values are applied')
+    printTable(['nodes', 'in place blocked', 'done', 'threaded blocked', 'done', 'cancelled'],
+               [benchmark(count) for count in (4, 16, 32)])
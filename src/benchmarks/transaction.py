@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Bulk edit with a history stamp per step compared to the same edit inside one scene transaction
+
+The edit disconnects every edge of a chain and selects every node, as a script would do it step by step.
+"""
+import gc
+
+from benchmarks.common import *
+
+from qdedge import QD_Edge
+from qdquestscene import QD_QuestScene
+from qdsocketgfx import SocketType
+
+
+def buildScene(count: int) -> QD_QuestScene:
+    nodeType = utils.getStateNodeType('StateNode_pulse')
+
+    scene = QD_QuestScene()
+    scene.setNodeClassSelector(lambda data: nodeType)
+
+    nodes = [nodeType(scene) for _ in range(count)]
+    for i, node in enumerate(nodes):
+        node.setPos(i * 300, 0)
+
+    for node1, node2 in zip(nodes, nodes[1:]):
+        QD_Edge(scene, node1.getSocket(SocketType.Out_True), node2.getSocket(SocketType.In))
+
+    scene.history.storeInitialHistoryStamp()
+    return scene
+
+
+def bulkEdit(scene: QD_QuestScene):
+    for edge in scene.edges:
+        edge.remove()
+        scene.history.storeHistory("Removed edge", setModified=True)
+
+    for node in scene.nodes:
+        node.gfx.doSelect()
+
+
+def benchmark(count: int) -> list:
+    scene = buildScene(count)
+    data = scene.serialize()
+
+    def stepwise():
+        bulkEdit(scene)
+
+    def transaction():
+        with scene.transaction("Bulk edit"):
+            bulkEdit(scene)
+
+    times = []
+    for edit in (stepwise, transaction):
+        scene.doDeselectItems(silent=True)
+        scene.deserialize(data)
+        times.append(timeit(edit, repeat=1))
+
+    scene.clear()
+    del scene
+    gc.collect()
+
+    milliseconds = lambda t: '%.0f' % (t * 1e3)
+    return [count, milliseconds(times[0]), milliseconds(times[1]), '%.0fx' % (times[0] / times[1])]
+
+
+if __name__ == '__main__':
+    print('milliseconds per bulk edit')
+    printTable(['nodes', 'stamp per step', 'transaction', 'speedup'], [benchmark(count) for count in (100, 200, 300)])
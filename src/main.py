@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
+import os
 import sys
+import atexit
 
 from PySide6.QtCore import QCoreApplication
 from PySide6.QtWidgets import QApplication
@@ -7,11 +9,17 @@ from PySide6.QtGui import QIcon
 
 from qdutils import *
 from qdmainwindow import QD_MainWindow
+from qdgc import QD_GCMonitor
 
 if __name__ == '__main__':
     QCoreApplication.setOrganizationName(confg.APP_ORG)
     QCoreApplication.setApplicationName(confg.APP_NAME)
 
+    if confg.GC_STATS or os.environ.get('QD_GC_STATS'):
+        gcMonitor = QD_GCMonitor()
+        gcMonitor.start()
+        atexit.register(lambda: print(gcMonitor.report()))
+
     app = QApplication(sys.argv)
     app.setStyle(confg.APP_STYLE)
 
@@ -73,6 +73,9 @@ class _ConditionChecker_hasItem(QD_OpNode):
 
     NodeContent_class = _ConditionCheckerContent_hasItem
 
+    # evaluate once typing pauses
+    evalDebounceMs = 300
+
     def __init__(self, scene):
         super().__init__(scene, sockets={SocketType.In, SocketType.Out_True, SocketType.Out_False})
         self.eval()
@@ -80,7 +83,9 @@ class _ConditionChecker_hasItem(QD_OpNode):
 
     def initInnerClasses(self):
         super().initInnerClasses()
-        self.content.gfx.edit.textChanged.connect(self.onInputChanged)
+        self.content.gfx.edit.textChanged.connect(self.content.onContentChanged)
+        self.content.gfx.choice.currentIndexChanged.connect(self.content.onContentChanged)
+        self.content.gfx.items.currentIndexChanged.connect(self.content.onContentChanged)
 
 
     def evalImplementation(self):
@@ -88,9 +93,6 @@ class _ConditionChecker_hasItem(QD_OpNode):
         self.markDirty(False)
         self.markInvalid(False)
 
-        self.markDescendantsInvalid(False)
-        self.markDescendantsDirty()
-
         self.gfx.setToolTip("")
 
         self.evalChildren()
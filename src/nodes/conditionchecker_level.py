@@ -66,6 +66,9 @@ class _ConditionChecker_level(QD_OpNode):
 
     NodeContent_class = _ConditionCheckerContent_level
 
+    # evaluate once typing pauses
+    evalDebounceMs = 300
+
     def __init__(self, scene):
         super().__init__(scene, sockets={SocketType.In, SocketType.Out_True, SocketType.Out_False})
         self.eval()
@@ -73,7 +76,8 @@ class _ConditionChecker_level(QD_OpNode):
 
     def initInnerClasses(self):
         super().initInnerClasses()
-        self.content.gfx.edit.textChanged.connect(self.onInputChanged)
+        self.content.gfx.edit.textChanged.connect(self.content.onContentChanged)
+        self.content.gfx.choice.currentIndexChanged.connect(self.content.onContentChanged)
 
 
     def evalImplementation(self):
@@ -81,9 +85,6 @@ class _ConditionChecker_level(QD_OpNode):
         self.markDirty(False)
         self.markInvalid(False)
 
-        self.markDescendantsInvalid(False)
-        self.markDescendantsDirty()
-
         self.gfx.setToolTip("")
 
         self.evalChildren()
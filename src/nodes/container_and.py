@@ -70,9 +70,6 @@ class _Container_and(QD_OpNode):
         self.markDirty(False)
         self.markInvalid(False)
 
-        self.markDescendantsInvalid(False)
-        self.markDescendantsDirty()
-
         self.gfx.setToolTip("")
 
         self.evalChildren()
@@ -47,6 +47,11 @@ class _Container_or(QD_OpNode):
         self.eval()
 
 
+    def initInnerClasses(self):
+        super().initInnerClasses()
+        self.content.gfx.edit.textChanged.connect(self.content.onContentChanged)
+
+
     def evalImplementation(self):
         u_value = 1 # hack
         s_value = int(u_value)
@@ -54,9 +59,6 @@ class _Container_or(QD_OpNode):
         self.markDirty(False)
         self.markInvalid(False)
 
-        self.markDescendantsInvalid(False)
-        self.markDescendantsDirty()
-
         self.gfx.setToolTip("")
 
         self.evalChildren()
@@ -55,6 +55,12 @@ class _Container_repeat(QD_OpNode):
         self.eval()
 
 
+    def initInnerClasses(self):
+        super().initInnerClasses()
+        self.content.gfx.choice.currentIndexChanged.connect(self.content.onContentChanged)
+        self.content.gfx.times.textChanged.connect(self.content.onContentChanged)
+
+
     def evalImplementation(self):
         u_value = 1 # hack
         s_value = int(u_value)
@@ -62,9 +68,6 @@ class _Container_repeat(QD_OpNode):
         self.markDirty(False)
         self.markInvalid(False)
 
-        self.markDescendantsInvalid(False)
-        self.markDescendantsDirty()
-
         self.gfx.setToolTip("")
 
         self.evalChildren()
@@ -49,6 +49,11 @@ class _Notifier(QD_OpNode):
         self.eval()
 
 
+    def initInnerClasses(self):
+        super().initInnerClasses()
+        self.content.gfx.edit.textChanged.connect(self.content.onContentChanged)
+
+
     def evalImplementation(self):
         u_value = 1 # hack
         s_value = int(u_value)
@@ -56,9 +61,6 @@ class _Notifier(QD_OpNode):
         self.markDirty(False)
         self.markInvalid(False)
 
-        self.markDescendantsInvalid(False)
-        self.markDescendantsDirty()
-
         self.gfx.setToolTip("")
 
         self.evalChildren()
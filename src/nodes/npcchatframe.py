@@ -192,6 +192,7 @@ class _NPCChatFrameContentGfx(QD_OpNodeContentGfx):
         if not s:
             s = 'NPC对话'
         self.label.setText(s)
+        self.content.onContentChanged()
 
 
     def setOutputs(self, sockets):
@@ -233,9 +234,6 @@ class _NPCChatFrame(QD_OpNode):
         self.markDirty(False)
         self.markInvalid(False)
 
-        self.markDescendantsInvalid(False)
-        self.markDescendantsDirty()
-
         self.gfx.setToolTip("")
         self.evalChildren()
 
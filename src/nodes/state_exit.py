@@ -50,6 +50,11 @@ class _State_exit(QD_OpNode):
         self.eval()
 
 
+    def initInnerClasses(self):
+        super().initInnerClasses()
+        self.content.gfx.edit.textChanged.connect(self.content.onContentChanged)
+
+
     def evalImplementation(self):
         u_value = 1 # hack
         s_value = int(u_value)
@@ -57,9 +62,6 @@ class _State_exit(QD_OpNode):
         self.markDirty(False)
         self.markInvalid(False)
 
-        self.markDescendantsInvalid(False)
-        self.markDescendantsDirty()
-
         self.gfx.setToolTip("")
         self.evalChildren()
 
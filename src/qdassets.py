@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+A module containing the image assets shared by all graphics items of the process
+"""
+import math
+
+from PySide6.QtCore import QRectF, Qt
+from PySide6.QtGui import QImage, QPixmap, QPainter
+
+
+class QD_AssetCache():
+    """Decodes every image file once and hands out pixmaps scaled ahead to the size they get painted at
+
+    Items used to decode their own copy of every image they draw, a socket alone held a 1200x1200 pulse icon.
+    Now the decoded image is shared and only kept to scale pixmaps from: a pixmap is scaled smoothly to the
+    pixel size of the target, device pixel ratio and view zoom included, rounded up to a power of two so
+    zooming doesn't keep adding sizes.
+
+    With ``atlas`` small pixmaps are packed into shared sheets of ``ATLAS_SIZE`` pixels, for paint engines
+    that batch draws per texture. A sheet is allocated in full, so the raster engine is better off without.
+    Both images and pixmaps are created on first use, pixmaps need the ``QApplication`` to exist by then.
+    """
+
+    ATLAS_SIZE = 1024
+
+    # smallest and largest zoom a pixmap is scaled for, beyond that the painter scales it
+    MIN_SCALE = 1 / 16
+    MAX_SCALE = 4
+
+    def __init__(self, atlas: bool = False):
+        self.atlas = atlas
+        self.clear()
+
+    def clear(self):
+        # path -> QImage as decoded, null if the file can't be read
+        self._images = {}
+
+        # (path, width, height) -> (QPixmap, QRectF) of the image scaled to width x height pixels
+        self._pixmaps = {}
+
+        # (path, target width, target height, scale, source) -> (QPixmap, QRectF) to draw, None without an image
+        self._draws = {}
+
+        # atlas sheets with their shelves, [QPixmap, [[y, height, x], ...]]
+        self._sheets = []
+
+    def image(self, path: str) -> QImage:
+        """Returns the shared ``QImage`` of ``path``, callers must not modify it"""
+        image = self._images.get(path)
+        if image is None:
+            image = self._images[path] = QImage(path)
+        return image
+
+    def pixmap(self, path: str, width: int, height: int) -> tuple:
+        """Returns ``(pixmap, source)``: the image of ``path`` scaled to ``width`` x ``height`` pixels is at ``source`` of ``pixmap``"""
+        key = path, width, height
+        found = self._pixmaps.get(key)
+        if found is None:
+            scaled = self.image(path).scaled(width, height, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            found = self._pixmaps[key] = self._pack(scaled) if self.atlas else (QPixmap.fromImage(scaled), QRectF(0, 0, width, height))
+        return found
+
+    def drawImage(self, painter: QPainter, target: QRectF, path: str, source: QRectF = None):
+        """Draws ``source`` of the image of ``path``, all of it by default, into ``target``, like ``QPainter.drawImage``"""
+        transform = painter.worldTransform()
+        scale = painter.device().devicePixelRatioF() * math.hypot(transform.m11(), transform.m12())
+        scale = 2.0 ** math.ceil(math.log2(min(max(scale, self.MIN_SCALE), self.MAX_SCALE)))
+
+        key = path, target.width(), target.height(), scale, None if source is None else source.getRect()
+        if key not in self._draws:
+            self._draws[key] = self._drawSource(target, path, source, scale)
+
+        found = self._draws[key]
+        if found is not None:
+            painter.drawPixmap(target, *found)
+
+    def _drawSource(self, target: QRectF, path: str, source: [QRectF, None], scale: float) -> [tuple, None]:
+        """Returns ``(pixmap, rect)`` to draw ``source`` of the image into ``target`` at ``scale``, ``None`` if there is no image"""
+        image = self.image(path)
+        if image.isNull():
+            return None
+
+        if source is None:
+            source = QRectF(image.rect())
+
+        # never scale the image up, the painter does that as well from the original
+        factor = min(scale * target.width() / source.width(), scale * target.height() / source.height(), 1.0)
+        width, height = max(1, round(image.width() * factor)), max(1, round(image.height() * factor))
+        pixmap, rect = self.pixmap(path, width, height)
+
+        fx, fy = width / image.width(), height / image.height()
+        return pixmap, QRectF(rect.x() + source.x() * fx, rect.y() + source.y() * fy, source.width() * fx, source.height() * fy)
+
+    def memoryUsage(self) -> int:
+        """Bytes held by decoded images and pixmaps, estimated at 4 bytes per pixmap pixel"""
+        images = sum(image.sizeInBytes() for image in self._images.values())
+        if self.atlas:
+            pixmaps = {id(pixmap): pixmap for pixmap, _ in self._pixmaps.values()}.values()
+        else:
+            pixmaps = [pixmap for pixmap, _ in self._pixmaps.values()]
+        return images + sum(4 * pixmap.width() * pixmap.height() for pixmap in pixmaps)
+
+    def _pack(self, image: QImage) -> tuple:
+        """Copies ``image`` into a free spot of an atlas sheet, images too large for a sheet get their own pixmap"""
+        width, height = image.width(), image.height()
+        if width > self.ATLAS_SIZE // 4 or height > self.ATLAS_SIZE // 4:
+            return QPixmap.fromImage(image), QRectF(0, 0, width, height)
+
+        for sheet, shelves in self._sheets:
+            spot = self._shelfSpot(shelves, width, height)
+            if spot is not None:
+                break
+        else:
+            sheet = QPixmap(self.ATLAS_SIZE, self.ATLAS_SIZE)
+            sheet.fill(Qt.GlobalColor.transparent)
+            shelves = []
+            self._sheets.append([sheet, shelves])
+            spot = self._shelfSpot(shelves, width, height)
+
+        painter = QPainter(sheet)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.drawImage(spot[0], spot[1], image)
+        painter.end()
+        return sheet, QRectF(spot[0], spot[1], width, height)
+
+    def _shelfSpot(self, shelves: list, width: int, height: int) -> [tuple, None]:
+        # one pixel gap keeps smooth scaling from bleeding in neighbours
+        for shelf in shelves:
+            y, shelfHeight, x = shelf
+            if height <= shelfHeight and x + width <= self.ATLAS_SIZE:
+                shelf[2] = x + width + 1
+                return x, y
+
+        y = shelves[-1][0] + shelves[-1][1] + 1 if shelves else 0
+        if y + height > self.ATLAS_SIZE:
+            return None
+
+        shelves.append([y, height, width + 1])
+        return 0, y
+
+
+assets = QD_AssetCache()
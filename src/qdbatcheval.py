@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+A module evaluating the condition nodes of a quest against a whole player population with NumPy
+
+Only this module needs NumPy, the editor itself runs without it.
+"""
+import json
+import os
+from typing import NamedTuple
+
+import numpy as np
+
+
+# job keys of the enter node in the order of their codes in the ``job`` column
+JOB_NAMES = ('warrior', 'wizard', 'taoist')
+
+# items of the hasItem checker combo box, column ``item<k>`` holds how many of item ``k`` a player owns
+ITEM_NAMES = ("太阳水", "龙纹剑", "幽灵战衣（男）", "金币")
+
+# relations by combo box index, the checker nodes and QD_RelationalComboBox list them in different orders
+CHECKER_RELATIONS = (np.greater, np.less, np.equal, np.not_equal, np.less_equal, np.greater_equal)
+WIDGET_RELATIONS = (np.greater, np.less, np.equal, np.less_equal, np.greater_equal, np.not_equal)
+
+
+class QD_PlayerTable():
+    """Snapshot of many players, one row per player, every column a NumPy array
+
+    :Instance Attributes:
+
+    - **job** - ``int8[rowCount]`` index into :data:`JOB_NAMES`
+    - **level** - ``int32[rowCount]``
+    - **gold** - ``int64[rowCount]``
+    - **items** - ``int32[rowCount, len(ITEM_NAMES)]`` count of each item of :data:`ITEM_NAMES`
+
+    Files are either ``.npz`` archives holding these arrays, see :meth:`save`, or ``.csv`` files with a header
+    line naming the columns ``job,level,gold,item0,item1,...``. Item columns missing in the file are zeros.
+    """
+
+    def __init__(self, job, level, gold, items=None):
+        self.job = np.asarray(job, dtype=np.int8)
+        self.level = np.asarray(level, dtype=np.int32)
+        self.gold = np.asarray(gold, dtype=np.int64)
+
+        if items is None:
+            self.items = np.zeros((len(self.job), len(ITEM_NAMES)), dtype=np.int32)
+        else:
+            self.items = np.asarray(items, dtype=np.int32).reshape(len(self.job), len(ITEM_NAMES))
+
+        # column-major, so each item column is contiguous
+        self.items = np.asfortranarray(self.items)
+
+    @property
+    def rowCount(self) -> int:
+        return len(self.job)
+
+    @classmethod
+    def fromNPZ(cls, filename: str) -> 'QD_PlayerTable':
+        with np.load(filename) as data:
+            return cls(data['job'], data['level'], data['gold'], data['items'] if 'items' in data else None)
+
+    @classmethod
+    def fromCSV(cls, filename: str) -> 'QD_PlayerTable':
+        with open(filename, "r", encoding='utf-8') as f:
+            header = [name.strip() for name in f.readline().split(',')]
+            rows = np.loadtxt(f, delimiter=',', dtype=np.int64, ndmin=2)
+
+        columns = {name: rows[:, index] for index, name in enumerate(header)}
+        for name in ('job', 'level', 'gold'):
+            if name not in columns:
+                raise ValueError('%s: missing column %s' % (filename, name))
+
+        items = np.zeros((len(rows), len(ITEM_NAMES)), dtype=np.int32)
+        for index in range(len(ITEM_NAMES)):
+            if 'item%d' % index in columns:
+                items[:, index] = columns['item%d' % index]
+
+        return cls(columns['job'], columns['level'], columns['gold'], items)
+
+    @classmethod
+    def fromFile(cls, filename: str) -> 'QD_PlayerTable':
+        """Loads a ``.npz`` or ``.csv`` file, chosen by extension"""
+        if os.path.splitext(filename)[1].lower() == '.npz':
+            return cls.fromNPZ(filename)
+        return cls.fromCSV(filename)
+
+    def save(self, filename: str):
+        np.savez(filename, job=self.job, level=self.level, gold=self.gold, items=self.items)
+
+
+class QD_BatchPredicate(NamedTuple):
+    """Requirement of one node, a conjunction of ``(column, relation, value)`` terms plus an allowed job set
+
+    ``column`` is a :class:`QD_PlayerTable` attribute name or ``item<k>``, ``jobs`` is ``None`` if any job passes.
+    """
+    nodeId: int
+    typeName: str
+    terms: tuple
+    jobs: tuple = None
+
+
+class QD_BatchEvaluator():
+    """Compiles the condition nodes of saved scene data into predicates and counts the players passing each
+
+    Handles ``_ConditionChecker_level``, ``_ConditionChecker_hasItem`` and the job, level and gold requirements
+    of ``StateNode_enter``, other nodes are ignored. Each node is evaluated on its own, without the nodes leading
+    to it. Checkers without a valid value are left out like the editor leaves them dirty or invalid, an empty
+    requirement of an enter node lets every player pass.
+
+    Works from serialized data only, so it runs on files and on :class:`qdmodel.QD_ModelScene` without editor
+    node classes. Terms shared by several nodes are computed once per table.
+
+    :Instance Attributes:
+
+    - **predicates** - list of :class:`QD_BatchPredicate` in node id order
+    """
+
+    # largest column value + 1 counted by histogram in passCounts
+    HISTOGRAM_LIMIT = 1 << 16
+
+    def __init__(self, nodes: list):
+        """
+        :param nodes: serialized nodes, each with its ``type`` field
+        """
+        self.predicates = []
+        for data in sorted(nodes, key=lambda data: data['id']):
+            predicate = self.compile(data)
+            if predicate is not None:
+                self.predicates.append(predicate)
+
+    @classmethod
+    def fromData(cls, data: dict) -> 'QD_BatchEvaluator':
+        return cls(data['nodes'])
+
+    @classmethod
+    def fromScene(cls, scene: 'QD_ModelScene') -> 'QD_BatchEvaluator':
+        """Compiles a :class:`qdmodel.QD_ModelScene` or an editor scene"""
+        return cls([node.serialize() for node in scene.nodes])
+
+    @classmethod
+    def fromFile(cls, filename: str) -> 'QD_BatchEvaluator':
+        """Compiles the scene of a saved quest file"""
+        with open(filename, "r", encoding='utf-8') as f:
+            return cls.fromData(json.load(f)['scene'])
+
+    @staticmethod
+    def _parseValue(text: str, allowNegative: bool = True) -> [int, None]:
+        try:
+            value = int(text)
+        except (TypeError, ValueError):
+            return None
+        return value if allowNegative or value >= 0 else None
+
+    @classmethod
+    def compile(cls, data: dict) -> [QD_BatchPredicate, None]:
+        """Returns the predicate of one serialized node, ``None`` if it has no requirement this class knows"""
+        typeName = data.get('type')
+        if typeName in ('_ConditionChecker_level', '_ConditionChecker_hasItem'):
+            content = data.get('content', {})
+            value = cls._parseValue(content.get('value'), allowNegative=False)
+            if value is None or not 0 <= content.get('choice', -1) < len(CHECKER_RELATIONS):
+                return None
+
+            column = 'level'
+            if typeName == '_ConditionChecker_hasItem':
+                if not 0 <= content.get('item', -1) < len(ITEM_NAMES):
+                    return None
+                column = 'item%d' % content['item']
+
+            return QD_BatchPredicate(data['id'], typeName, ((column, CHECKER_RELATIONS[content['choice']], value),))
+
+        if typeName == 'StateNode_enter':
+            widget = data.get('widget', {})
+            terms = []
+            for column in ('level', 'gold'):
+                condition = widget.get(column, {})
+                value = cls._parseValue(condition.get('value'))
+                if value is not None and 0 <= condition.get('index', -1) < len(WIDGET_RELATIONS):
+                    terms.append((column, WIDGET_RELATIONS[condition['index']], value))
+
+            jobs = widget.get('job', {})
+            return QD_BatchPredicate(data['id'], typeName, tuple(terms), tuple(code for code, name in enumerate(JOB_NAMES) if jobs.get(name)))
+
+        return None
+
+    @staticmethod
+    def _column(table: QD_PlayerTable, column: str) -> np.ndarray:
+        if column.startswith('item'):
+            return table.items[:, int(column[4:])]
+        return getattr(table, column)
+
+    def iterMasks(self, table: QD_PlayerTable, predicates: list = None):
+        """Yields ``(nodeId, bool[rowCount])`` of ``predicates``, all by default, ``True`` for players passing the node"""
+        # (column, relation, value) or ('job', jobs) -> mask, nodes asking the same share it
+        termMasks = {}
+
+        def termMask(term):
+            if term not in termMasks:
+                column, relation, value = term
+                termMasks[term] = relation(self._column(table, column), value)
+            return termMasks[term]
+
+        def jobMask(jobs):
+            if ('job', jobs) not in termMasks:
+                allowed = np.zeros(max(len(JOB_NAMES), int(table.job.max(initial=0)) + 1), dtype=bool)
+                allowed[list(jobs)] = True
+                termMasks['job', jobs] = allowed[table.job]
+            return termMasks['job', jobs]
+
+        for predicate in self.predicates if predicates is None else predicates:
+            parts = [termMask(term) for term in predicate.terms]
+            if predicate.jobs is not None:
+                parts.append(jobMask(predicate.jobs))
+
+            if not parts:
+                yield predicate.nodeId, np.ones(table.rowCount, dtype=bool)
+            elif len(parts) == 1:
+                yield predicate.nodeId, parts[0]
+            else:
+                # pairwise in place, reducing the list would stack all masks into a new array first
+                mask = np.logical_and(parts[0], parts[1])
+                for part in parts[2:]:
+                    np.logical_and(mask, part, out=mask)
+                yield predicate.nodeId, mask
+
+    def passMasks(self, table: QD_PlayerTable) -> dict:
+        """Returns node id -> ``bool[rowCount]``, ``True`` for players passing the node"""
+        return dict(self.iterMasks(table))
+
+    def passCounts(self, table: QD_PlayerTable) -> dict:
+        """
+        Returns node id -> number of players passing the node, without keeping a mask per node
+
+        Nodes with a single term on a column of small non-negative values, like level and item counts, are counted
+        from a histogram of that column instead of comparing every row.
+        """
+        # column -> number of players per value, None if its values don't fit a histogram
+        histograms = {}
+
+        def histogram(column):
+            if column not in histograms:
+                values = self._column(table, column)
+                if values.size and 0 <= values.min() and values.max() < self.HISTOGRAM_LIMIT:
+                    histograms[column] = np.bincount(values)
+                else:
+                    histograms[column] = None
+            return histograms[column]
+
+        counts = {}
+        masked = []
+        for predicate in self.predicates:
+            if len(predicate.terms) == 1 and predicate.jobs is None:
+                column, relation, value = predicate.terms[0]
+                players = histogram(column)
+                if players is not None:
+                    counts[predicate.nodeId] = int(players[relation(np.arange(len(players)), value)].sum())
+                    continue
+            masked.append(predicate)
+
+        counts.update((nodeId, int(np.count_nonzero(mask))) for nodeId, mask in self.iterMasks(table, masked))
+        return {predicate.nodeId: counts[predicate.nodeId] for predicate in self.predicates}
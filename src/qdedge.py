@@ -1,18 +1,14 @@
 # -*- coding: utf-8 -*-
-from enum import Enum, unique
-from qdserializable import QD_Serializable
+from qdmodel import QD_ModelEdge, EdgeType
 from qdutils import *
 from qdedgegfx import *
 
-@unique
-class EdgeType(int, Enum):
-    Direct = 0
-    Bezier = 1
-
-class QD_Edge(QD_Serializable):
+class QD_Edge(QD_ModelEdge):
     """Class for representing QD_Edge in NodeEditor.
     """
 
+    __slots__ = ('gfx',)
+
     def __init__(self, scene: 'QD_StateScene', start_socket: 'QD_Socket' = None, end_socket: 'QD_Socket' = None, edge_type=EdgeType.Direct):
         """
 
@@ -29,89 +25,42 @@ class QD_Edge(QD_Serializable):
             - **scene** - reference to the :class:`scene.QD_StateScene`
             - **gfx** - Instance of :class:`qdedgegfx.QD_EdgeGfx` subclass handling graphical representation in the ``QGraphicsScene``.
         """
-        super().__init__()
-        self.scene = scene
-
-        # default init
-        self._start_socket = None
-        self._end_socket = None
-
-        self.start_socket = start_socket
-        self.end_socket = end_socket
-        self.edge_type = edge_type
-
-        self.scene.addEdge(self)
-
-    def __str__(self):
-        return "<QD_Edge %s..%s -- S:%s E:%s>" % (hex(id(self))[2:5], hex(id(self))[-3:], self.start_socket, self.end_socket)
-
-    @property
-    def start_socket(self):
-        """
-        Start socket
-
-        :getter: Returns start :class:`socket.QD_Socket`
-        :setter: Sets start :class:`socket.QD_Socket` safely
-        :type: :class:`socket.QD_Socket`
-        """
-        return self._start_socket
-
-    @start_socket.setter
-    def start_socket(self, value):
-        # if we were assigned to some socket before, delete us from the socket
-        if self._start_socket is not None:
-            self._start_socket.removeEdge(self)
-
-        # assign new start socket
-        self._start_socket = value
-        # addEdge to the QD_Socket class
-        if self.start_socket is not None:
-            self.start_socket.addEdge(self)
-
-    @property
-    def end_socket(self):
-        """
-        End socket
-
-        :getter: Returns end :class:`socket.QD_Socket` or ``None`` if not set
-        :setter: Sets end :class:`socket.QD_Socket` safely
-        :type: :class:`socket.QD_Socket` or ``None``
-        """
-        return self._end_socket
-
-    @end_socket.setter
-    def end_socket(self, value):
-        # if we were assigned to some socket before, delete us from the socket
-        if self._end_socket is not None:
-            self._end_socket.removeEdge(self)
-
-        # assign new end socket
-        self._end_socket = value
-        # addEdge to the QD_Socket class
-        if self.end_socket is not None:
-            self.end_socket.addEdge(self)
+        super().__init__(scene, start_socket, end_socket, edge_type)
 
     @property
     def edge_type(self):
         """QD_Edge type
 
         :getter: get edge type constant for current ``QD_Edge``. See :ref:`edge-type-constants`
-        :setter: sets new edge type. On background, creates new :class:`qdedgegfx.QD_EdgeGfx`
-            child class if necessary, adds this ``QGraphicsPathItem`` to the ``QGraphicsScene`` and updates edge sockets
-            positions.
+        :setter: sets new edge type. On background, switches to another :class:`qdedgegfx.QD_EdgeGfx`
+            child class if necessary, taking it from the scene's gfx pool when one is available, adds this
+            ``QGraphicsPathItem`` to the ``QGraphicsScene`` and updates edge sockets positions.
         """
         return self._edge_type
 
     @edge_type.setter
     def edge_type(self, value):
-        if hasattr(self, 'gfx') and self.gfx is not None:
-            self.scene.gfx.removeItem(self.gfx)
-
         self._edge_type = value
+        self.scene.onEdgeChanged(self)
+
         edgeClass = self.determineEdgeClass(self.edge_type)
-        self.gfx = edgeClass(self)
+        gfx = getattr(self, 'gfx', None)
+
+        # deserializing keeps the edge type most of the time, keep the item then
+        if gfx is None or gfx.__class__ is not edgeClass:
+            if gfx is not None:
+                self.releaseGfx()
+
+            self.gfx = self.scene.gfxPool.acquire(edgeClass)
+            if self.gfx is None:
+                self.gfx = edgeClass(self)
+            else:
+                self.gfx.rebind(self)
 
-        self.scene.gfx.addItem(self.gfx)
+            self.scene.gfx.addItem(self.gfx)
+        else:
+            # same item, the path may still depend on the edge type
+            self.gfx.updatePath()
 
         if self.start_socket is not None:
             self.updatePositions()
@@ -128,17 +77,6 @@ class QD_Edge(QD_Serializable):
             edge_class = GfxEdgeDirect
         return edge_class
 
-    def getOtherSocket(self, known_socket: 'QD_Socket'):
-        """
-        Returns the oposite socket on this ``QD_Edge``
-
-        :param known_socket: Provide known :class:`socket.QD_Socket` to be able to determine the oposite one.
-        :type known_socket: :class:`socket.QD_Socket`
-        :return: The oposite socket on this ``QD_Edge`` or ``None``
-        :rtype: :class:`socket.QD_Socket` or ``None``
-        """
-        return self.start_socket if known_socket == self.end_socket else self.end_socket
-
     def doSelect(self, new_state: bool = True):
         """
         Provide the safe selecting/deselecting operation. In the background it takes care about the flags, norifications
@@ -149,28 +87,28 @@ class QD_Edge(QD_Serializable):
         """
         self.gfx.doSelect(new_state)
 
+    def releaseGfx(self):
+        """Takes the graphics item out of the scene and hands it over to the scene's gfx pool"""
+        # ugly hack, since I noticed that even when you remove gfx from scene,
+        # sometimes it stays there! How dare you Qt!
+        self.gfx.hide()
+        self.scene.gfx.removeItem(self.gfx)
+        self.scene.gfxPool.release(self.gfx.__class__, self.gfx)
+        self.gfx = None
+
     def updatePositions(self):
         """
         Updates the internal `Graphics QD_Edge` positions according to the start and end :class:`socket.QD_Socket`.
         This should be called if you update ``QD_Edge`` positions.
         """
         source_pos = self.start_socket.getSocketPosition() + self.start_socket.node.gfx.pos()
-        self.gfx.setSource(source_pos.x(), source_pos.y())
-
+        end_pos = source_pos
         if self.end_socket is not None:
             end_pos = self.end_socket.getSocketPosition() + self.end_socket.node.gfx.pos()
-            self.gfx.setDestination(end_pos.x(), end_pos.y())
-        else:
-            self.gfx.setDestination(source_pos.x(), source_pos.y())
 
-        self.gfx.update()
+        self.gfx.setPositions(source_pos.x(), source_pos.y(), end_pos.x(), end_pos.y())
 
-    def remove_from_sockets(self):
-        """
-        Helper function which sets start and end :class:`socket.QD_Socket` to ``None``
-        """
-        self.end_socket = None
-        self.start_socket = None
+        self.gfx.update()
 
     def remove(self, silent_for_socket: 'QD_Socket' = None, silent=False):
         """Safely remove this QD_Edge.
@@ -189,21 +127,16 @@ class QD_Edge(QD_Serializable):
         :param silent: ``True`` if no events should be triggered during removing
         :type silent: ``bool``
         """
-        old_sockets = [self.start_socket, self.end_socket]
+        if self.gfx is None:
+            # removed already, e.g. along with its node before its own turn in a deletion
+            return
 
-        # ugly hack, since I noticed that even when you remove gfx from scene,
-        # sometimes it stays there! How dare you Qt!
-        if confg.DEBUG:
-            print(" - hide gfx")
-        self.gfx.hide()
-
-        if confg.DEBUG:
-            print(" - remove gfx", self.gfx)
+        old_sockets = [self.start_socket, self.end_socket]
 
-        self.scene.gfx.removeItem(self.gfx)
         if confg.DEBUG:
-            print("   gfx:", self.gfx)
+            print(" - release gfx", self.gfx)
 
+        self.releaseGfx()
         self.scene.gfx.update()
 
         if confg.DEBUG:
@@ -236,21 +169,7 @@ class QD_Edge(QD_Serializable):
 
                     # notify QD_Socket's QD_OpNode
                     socket.node.onEdgeConnectionChanged(self)
-                    if socket.is_input: socket.node.onInputChanged(socket)
+                    if socket.is_input: self.scene.notifyInputChanged(socket)
 
         except Exception as e:
             utils.dumpExcept(e)
-
-    def serialize(self) -> dict:
-        return {
-            'id': self.id,
-            'edge_type': self.edge_type,
-            'start': self.start_socket.id if self.start_socket is not None else None,
-            'end': self.end_socket.id if self.end_socket is not None else None,
-        }
-
-    def deserialize(self, data: dict, hashmap: dict = {}, restore_id: bool = True) -> bool:
-        if restore_id: self.id = data['id']
-        self.start_socket = hashmap[data['start']]
-        self.end_socket = hashmap[data['end']]
-        self.edge_type = data['edge_type']
@@ -3,11 +3,14 @@
 A module containing Graphics representation of QD_Edge
 """
 import math
+import weakref
+
 from PySide6.QtWidgets import *
 from PySide6.QtCore import *
 from PySide6.QtGui import *
 
 EDGE_CP_ROUNDNESS = 100  #: Bezier controll point distance on the line
+EDGE_HIT_WIDTH = 12.0  #: Width of the band around the line which hovers and clicks the edge
 
 
 class QD_EdgeGfx(QGraphicsPathItem):
@@ -25,10 +28,14 @@ class QD_EdgeGfx(QGraphicsPathItem):
             - **edge** - reference to :class:`qdedge.QD_Edge`
             - **posSource** - ``[x, y]`` source position in the `QD_StateScene`
             - **posDestination** - ``[x, y]`` destination position in the `QD_StateScene`
+
+        The path is kept until its ends move. The outline of the path stroked :attr:`hitWidth` wide is set as
+        this item's own ``QGraphicsPathItem`` path, so Qt culls and hit tests against it in C++ without calling
+        back into Python, see :meth:`updatePath`.
         """
         super().__init__(parent)
 
-        self.edge = edge
+        self._edge = weakref.ref(edge)
 
         # init our flags
         self._last_selected_state = False
@@ -38,14 +45,36 @@ class QD_EdgeGfx(QGraphicsPathItem):
         self.posSource = [0, 0]
         self.posDestination = [200, 100]
 
+        self._path = None
+        self._hitWidth = EDGE_HIT_WIDTH
+
         self.initAssets()
         self.initUI()
+        self.updatePath()
+
+    def rebind(self, edge: 'QD_Edge'):
+        """Reuses this item released by a removed edge for ``edge``, the caller adds it back to the scene"""
+        self._edge = weakref.ref(edge)
+
+        self._last_selected_state = False
+        self.hovered = False
+
+        self.setSelected(False)
+        self.show()
+        self.updatePath()
+
+    @property
+    def edge(self) -> 'QD_Edge':
+        """The edge owning this item, ``None`` once the edge has been freed"""
+        return self._edge()
 
     def initUI(self):
         """Set up this ``QGraphicsPathItem``"""
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable)
         self.setAcceptHoverEvents(True)
         self.setZValue(-1)
+        # the item's own path is the hit outline, it is only tested, paint() draws the edge with its own pens
+        self.setPen(Qt.PenStyle.NoPen)
 
     def initAssets(self):
         """Initialize ``QObjects`` like ``QColor``, ``QPen`` and ``QBrush``"""
@@ -104,14 +133,16 @@ class QD_EdgeGfx(QGraphicsPathItem):
             self.onSelected()
 
     def hoverEnterEvent(self, event: 'QGraphicsSceneHoverEvent') -> None:
-        """Handle hover effect"""
+        """Handle hover effect, only a connected edge is drawn hovered and needs a repaint"""
         self.hovered = True
-        self.update()
+        if self.edge.end_socket is not None:
+            self.update()
 
     def hoverLeaveEvent(self, event: 'QGraphicsSceneHoverEvent') -> None:
-        """Handle hover effect"""
+        """Handle hover effect, only a connected edge is drawn hovered and needs a repaint"""
         self.hovered = False
-        self.update()
+        if self.edge.end_socket is not None:
+            self.update()
 
     def setSource(self, x: float, y: float):
         """ Set source point
@@ -121,7 +152,9 @@ class QD_EdgeGfx(QGraphicsPathItem):
         :param y: y position
         :type y: ``float``
         """
-        self.posSource = [x, y]
+        if self.posSource != [x, y]:
+            self.posSource = [x, y]
+            self.updatePath()
 
     def setDestination(self, x: float, y: float):
         """ Set destination point
@@ -131,29 +164,65 @@ class QD_EdgeGfx(QGraphicsPathItem):
         :param y: y position
         :type y: ``float``
         """
-        self.posDestination = [x, y]
-
-    def boundingRect(self) -> QRectF:
-        """Defining Qt' bounding rectangle"""
-        return self.shape().boundingRect()
+        if self.posDestination != [x, y]:
+            self.posDestination = [x, y]
+            self.updatePath()
+
+    def setPositions(self, sx: float, sy: float, dx: float, dy: float):
+        """ Set source and destination points, the path is rebuilt once for both
+
+        :param sx: source x position
+        :type sx: ``float``
+        :param sy: source y position
+        :type sy: ``float``
+        :param dx: destination x position
+        :type dx: ``float``
+        :param dy: destination y position
+        :type dy: ``float``
+        """
+        if self.posSource != [sx, sy] or self.posDestination != [dx, dy]:
+            self.posSource = [sx, sy]
+            self.posDestination = [dx, dy]
+            self.updatePath()
 
-    def shape(self) -> QPainterPath:
-        """Returns ``QPainterPath`` representation of this `QD_Edge`
+    def updatePath(self):
+        """Rebuilds the path and its hit outline, call it after anything :meth:`calcPath` depends on changed
 
-        :return: path representation
-        :rtype: ``QPainterPath``
+        Stroking a curve costs about as much as building it. The outline is at least as wide as the hovered
+        pen, so it also bounds everything :meth:`paint` draws.
         """
-        return self.calcPath()
+        self._path = self.calcPath()
+
+        stroker = QPainterPathStroker()
+        stroker.setWidth(max(self._hitWidth, self._pen_hovered.widthF()))
+        stroker.setCapStyle(Qt.PenCapStyle.RoundCap)
+        # setPath() tells the scene about the geometry change
+        self.setPath(stroker.createStroke(self._path))
+
+    @property
+    def hitWidth(self) -> float:
+        """Width of the band around the line in which the mouse hovers and clicks this edge"""
+        return self._hitWidth
+
+    @hitWidth.setter
+    def hitWidth(self, value: float):
+        if self._hitWidth != value:
+            self._hitWidth = value
+            self.updatePath()
+
+    def edgePath(self) -> QPainterPath:
+        """Returns the ``QPainterPath`` of this `QD_Edge`, built by :meth:`calcPath` when its ends last moved"""
+        return self._path
 
     def paint(self, painter, option: QStyleOptionGraphicsItem, widget=None):
         """Qt's overriden method to paint this Graphics QD_Edge. Path calculated in :func:`qdedgegfx.QD_EdgeGfx.calcPath` method"""
-        self.setPath(self.calcPath())
+        path = self.edgePath()
 
         painter.setBrush(Qt.BrushStyle.NoBrush)
 
         if self.hovered and self.edge.end_socket is not None:
             painter.setPen(self._pen_hovered)
-            painter.drawPath(self.path())
+            painter.drawPath(path)
 
         if self.edge.end_socket is None:
             painter.setPen(self._pen_dragging)
@@ -165,7 +234,7 @@ class QD_EdgeGfx(QGraphicsPathItem):
             else:
                 painter.setPen(self._pen)
 
-        painter.drawPath(self.path())
+        painter.drawPath(path)
 
     def intersectsWith(self, p1: QPointF, p2: QPointF) -> bool:
         """Does this Graphics QD_Edge intersect with line between point A and point B ?
@@ -179,8 +248,7 @@ class QD_EdgeGfx(QGraphicsPathItem):
         """
         cutpath = QPainterPath(p1)
         cutpath.lineTo(p2)
-        path = self.calcPath()
-        return cutpath.intersects(path)
+        return cutpath.intersects(self.edgePath())
 
     def calcPath(self) -> QPainterPath:
         """Will handle drawing QPainterPath from Point A to B
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+A module containing the memoized results of node evaluations
+"""
+import json
+import weakref
+from collections import Counter
+from typing import NamedTuple
+
+
+class QD_EvalCacheEntry(NamedTuple):
+    key: tuple
+    value: object
+
+
+class QD_EvalCache():
+    """Last result of every node together with the key it was computed for
+
+    The key is the content of the node, see ``QD_Node.evalContentKey``, plus id and result version of each input.
+    The result version of a node only grows when its value actually changes, so a node whose inputs got evaluated
+    again to the same values finds its key unchanged and takes the cached value instead of evaluating.
+    Failed and invalid evaluations are not cached. Nodes are referred to weakly.
+
+    :Instance Attributes:
+
+    - **hits** - ``Counter`` of node type name -> evaluations skipped
+    - **misses** - ``Counter`` of node type name -> evaluations run
+    """
+
+    def __init__(self):
+        self._entries = weakref.WeakKeyDictionary()
+        self._resultVersions = weakref.WeakKeyDictionary()
+
+        self.hits = Counter()
+        self.misses = Counter()
+
+    def clear(self):
+        self._entries.clear()
+
+    def resetStats(self):
+        self.hits.clear()
+        self.misses.clear()
+
+    def resultVersion(self, node: 'QD_Node') -> int:
+        return self._resultVersions.get(node, 0)
+
+    def makeKey(self, node: 'QD_Node') -> tuple:
+        inputs = node.getInputs() or ()
+        return (node.evalContentKey(), tuple((other.id, self.resultVersion(other)) for other in inputs))
+
+    def restore(self, node: 'QD_Node', key: tuple) -> bool:
+        """Applies the cached result of ``node`` if it was computed for ``key``, returns ``False`` on a miss"""
+        entry = self._entries.get(node)
+        if entry is None or entry.key != key:
+            self.misses[node.typeName] += 1
+            return False
+
+        self.hits[node.typeName] += 1
+        node.onEvalFinished(entry.value)
+        return True
+
+    def store(self, node: 'QD_Node', key: tuple, value):
+        entry = self._entries.get(node)
+        if entry is None or entry.value != value:
+            self._resultVersions[node] = self.resultVersion(node) + 1
+        self._entries[node] = QD_EvalCacheEntry(key, value)
+
+    def discard(self, node: 'QD_Node'):
+        """Drops the result of ``node`` after it failed, nodes reading it get evaluated again"""
+        if self._entries.pop(node, None) is not None:
+            self._resultVersions[node] = self.resultVersion(node) + 1
+
+    @staticmethod
+    def contentKey(data: dict) -> str:
+        """Key of serialized node ``data`` without its id and position, sockets count by their types only"""
+        content = {key: value for key, value in data.items() if key not in ('id', 'position', 'sockets')}
+        content['sockets'] = sorted(sockData['type'] for sockData in data.get('sockets', ()))
+        return json.dumps(content, sort_keys=True, default=str)
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+A module containing the panel showing evaluation cache hits and misses of the current scene
+"""
+from PySide6.QtGui import *
+from PySide6.QtCore import *
+from PySide6.QtWidgets import *
+
+
+class QD_EvalCachePanel(QWidget):
+    """Table of cache hits and misses per node type, refreshed while the panel is visible"""
+
+    REFRESH_MS = 500
+
+    def __init__(self, currentScene: 'function', parent: QWidget = None):
+        """
+        :param currentScene: returns the :class:`qdscene.QD_Scene` to show or ``None``
+        :param parent: parent widget
+        """
+        super().__init__(parent)
+        self.currentScene = currentScene
+        self.initUI()
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.refresh)
+
+    def initUI(self):
+        self.table = QTableWidget(0, 4)
+        self.table.setHorizontalHeaderLabels(['Node type', 'Hits', 'Misses', 'Hit rate'])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+
+        self.summary = QLabel()
+
+        self.resetButton = QPushButton('Reset')
+        self.resetButton.clicked.connect(self.onReset)
+
+        hbox = QHBoxLayout()
+        hbox.addWidget(self.summary, 1)
+        hbox.addWidget(self.resetButton)
+
+        vbox = QVBoxLayout(self)
+        vbox.setContentsMargins(4, 4, 4, 4)
+        vbox.addWidget(self.table)
+        vbox.addLayout(hbox)
+
+    def showEvent(self, event: QShowEvent):
+        self.refresh()
+        self._timer.start(self.REFRESH_MS)
+        super().showEvent(event)
+
+    def hideEvent(self, event: QHideEvent):
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def onReset(self):
+        scene = self.currentScene()
+        if scene is not None:
+            scene.evaluator.cache.resetStats()
+        self.refresh()
+
+    def refresh(self):
+        scene = self.currentScene()
+        if scene is None:
+            self.table.setRowCount(0)
+            self.summary.setText('No scene')
+            return
+
+        cache = scene.evaluator.cache
+        typeNames = sorted(set(cache.hits) | set(cache.misses), key=str)
+
+        self.table.setRowCount(len(typeNames))
+        for row, typeName in enumerate(typeNames):
+            hits, misses = cache.hits[typeName], cache.misses[typeName]
+            cells = [str(typeName), str(hits), str(misses), '%.0f%%' % (100.0 * hits / (hits + misses)) if hits + misses else '-']
+            for column, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if column > 0:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(row, column, item)
+
+        hits, misses = cache.hits.total(), cache.misses.total()
+        self.summary.setText('%d hits, %d misses, %d passes' % (hits, misses, scene.evaluator.passes))
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+A module running node evaluations on a thread pool and handing their results back to the GUI thread
+"""
+import os
+import threading
+import traceback
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import QObject, Signal
+
+
+# one pool for all scenes, created on first use
+_executor = None
+
+
+def _getExecutor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4), thread_name_prefix='QD_Eval')
+    return _executor
+
+
+class QD_EvalJob():
+    """One submitted evaluation of a node
+
+    :Instance Attributes:
+
+    - **key** - cache key of the node when the job was submitted, see :class:`qdevalcache.QD_EvalCache`
+    - **inputs** - what ``evalInputs()`` returned on the GUI thread
+    - **cancelled** - ``threading.Event`` set once the result is no longer wanted, ``evalCompute`` may poll it
+    - **future** - ``concurrent.futures.Future`` of the ``evalCompute`` call
+    """
+
+    def __init__(self, node: 'QD_Node', key: tuple, inputs):
+        self._node = weakref.ref(node)
+        self.key = key
+        self.inputs = inputs
+        self.cancelled = threading.Event()
+        self.future = None
+
+    @property
+    def node(self) -> 'QD_Node':
+        return self._node()
+
+    def cancel(self):
+        self.cancelled.set()
+        self.future.cancel()
+
+
+class QD_EvalPool(QObject):
+    """Runs ``evalCompute`` of nodes with ``evalInThread`` set on worker threads
+
+    Inputs are collected on the GUI thread by ``evalInputs()`` before the job starts, the result goes back
+    through a queued signal and is applied by ``onEvalFinished`` or ``onEvalFailed`` on the GUI thread, then
+    the children of the node get scheduled. Submitting a node again cancels its running job: the job's
+    ``cancelled`` event gets set and its result is dropped even if it still finishes.
+
+    :Instance Attributes:
+
+    - **submitted** - number of jobs submitted so far
+    - **cancelledJobs** - number of jobs cancelled so far
+    - **applied** - number of results applied so far
+    """
+
+    jobDone = Signal(object)
+
+    def __init__(self, scheduler: 'QD_EvalScheduler'):
+        super().__init__()
+        self.scheduler = scheduler
+
+        # node -> its current QD_EvalJob
+        self._jobs = {}
+
+        self.submitted = 0
+        self.cancelledJobs = 0
+        self.applied = 0
+
+        # emitted from worker threads, delivered on the thread owning this object
+        self.jobDone.connect(self.onJobDone)
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._jobs)
+
+    def isRunning(self, node: 'QD_Node') -> bool:
+        return node in self._jobs
+
+    def submit(self, node: 'QD_Node', key: tuple):
+        self.cancel(node)
+
+        job = QD_EvalJob(node, key, node.evalInputs())
+        self._jobs[node] = job
+        self.submitted += 1
+
+        job.future = _getExecutor().submit(node.evalCompute, job.inputs, job.cancelled)
+        job.future.add_done_callback(lambda future: self.jobDone.emit(job))
+
+    def cancel(self, node: 'QD_Node'):
+        job = self._jobs.pop(node, None)
+        if job is not None:
+            job.cancel()
+            self.cancelledJobs += 1
+
+    def cancelAll(self):
+        for node in list(self._jobs):
+            self.cancel(node)
+
+    def onJobDone(self, job: QD_EvalJob):
+        node = job.node
+        if node is None or self._jobs.get(node) is not job:
+            return
+
+        del self._jobs[node]
+        if not self.scheduler.scene.hasNode(node):
+            return
+
+        self.applied += 1
+        self.scheduler.onEvaluated(node)
+
+        error = job.future.exception()
+        if error is None:
+            node.onEvalFinished(job.future.result())
+            self.scheduler.cache.store(node, job.key, job.future.result())
+        else:
+            if not isinstance(error, ValueError):
+                traceback.print_exception(error)
+            self.scheduler.cache.discard(node)
+            node.onEvalFailed(error)
+
+        self.scheduler.schedule(*node.getChildrenNodes())
+        self.scheduler.run()
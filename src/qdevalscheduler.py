@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+A module containing the evaluation scheduler of a scene
+"""
+import math
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+
+from PySide6.QtCore import Qt, QTimer
+
+from qdevalcache import QD_EvalCache
+from qdevalpool import QD_EvalPool
+
+
+class QD_EvalScheduler():
+    """Evaluates scheduled nodes and all their descendants in passes, each node at most once per pass
+
+    A pass takes every scheduled node plus everything reachable through ``getChildrenNodes()``, marks them dirty
+    and calls ``eval()`` on them in the topological order of the scene, so inputs are evaluated before the nodes
+    reading them. Nothing recurses: ``evalChildren()`` called from inside a pass only schedules, children which
+    are part of the running pass are dropped, others are left for the next pass.
+
+    Content edits go through :meth:`scheduleDebounced` instead: the node waits until no edit came in for
+    ``delay`` milliseconds, so a burst of keystrokes ends in one pass. Nodes whose delays run out together share
+    that pass.
+
+    Nodes with ``evalInThread`` set are handed to :class:`qdevalpool.QD_EvalPool` instead of being evaluated
+    in place, their descendants leave the pass and get scheduled again once the result is back. A node whose
+    job is still running when it gets into another pass, itself or through one of its ancestors, has that job
+    cancelled.
+
+    :Instance Attributes:
+
+    - **passes** - number of passes run so far
+    - **evaluations** - number of ``evalImplementation`` calls so far
+    - **lastPass** - ``Counter`` of node -> ``evalImplementation`` calls during the last pass
+    - **contentChanges** - number of :meth:`scheduleDebounced` calls so far
+    - **pool** - :class:`qdevalpool.QD_EvalPool` running threaded evaluations
+    - **cache** - :class:`qdevalcache.QD_EvalCache` with the last result of each node
+    """
+
+    # nodes keep scheduling each other only if their ``getChildrenNodes`` changes while evaluating
+    MAX_PASSES = 100
+
+    def __init__(self, scene: 'QD_Scene'):
+        """
+        :param scene: Reference to the :class:`scene.QD_Scene`
+        :type scene: :class:`scene.QD_Scene`
+        """
+        self.scene = scene
+
+        self._pending = {}
+        self._batchDepth = 0
+        self._running = False
+
+        # node -> time.monotonic() deadline
+        self._debounced = {}
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self.onDebounceTimeout)
+
+        self.pool = QD_EvalPool(self)
+        self.cache = QD_EvalCache()
+
+        self.passes = 0
+        self.evaluations = 0
+        self.lastPass = Counter()
+        self.contentChanges = 0
+
+    @property
+    def redundantEvaluations(self) -> int:
+        """Evaluations of the last pass beyond the first one of each node, ``0`` unless some node re-evaluates itself"""
+        return sum(count - 1 for count in self.lastPass.values() if count > 1)
+
+    @property
+    def running(self) -> bool:
+        """``True`` while a pass runs, its nodes and all their descendants have been marked dirty already"""
+        return self._running
+
+    @property
+    def hasDebouncedNodes(self) -> bool:
+        """``True`` while nodes wait in :meth:`scheduleDebounced`"""
+        return bool(self._debounced)
+
+    def schedule(self, *nodes: 'QD_Node'):
+        for node in nodes:
+            self._pending[node] = None
+
+    def scheduleDebounced(self, node: 'QD_Node', delay: int = 0):
+        """Schedules ``node`` once ``delay`` milliseconds passed since its last call, ``0`` waits for the next event loop turn"""
+        self.contentChanges += 1
+        self._debounced[node] = time.monotonic() + delay / 1000
+        self._startTimer()
+
+    def flush(self):
+        """Runs nodes waiting in :meth:`scheduleDebounced` right away"""
+        self._timer.stop()
+        self.schedule(*self._debounced)
+        self._debounced = {}
+        self.run()
+
+    def onDebounceTimeout(self):
+        # timers may fire a little early
+        now = time.monotonic() + 0.001
+        due = [node for node, deadline in self._debounced.items() if deadline <= now]
+        for node in due:
+            del self._debounced[node]
+
+        self.schedule(*due)
+        self.run()
+        self._startTimer()
+
+    def _startTimer(self):
+        if self._debounced:
+            wait = min(self._debounced.values()) - time.monotonic()
+            self._timer.start(max(0, math.ceil(wait * 1000)))
+
+    def onEvaluated(self, node: 'QD_Node'):
+        """Called by ``QD_Node.eval`` every time it runs ``evalImplementation``"""
+        self.evaluations += 1
+        self.lastPass[node] += 1
+
+    @staticmethod
+    def descendants(nodes) -> dict:
+        """Returns ``nodes`` and all nodes reachable from them through ``getChildrenNodes``, used as an ordered set"""
+        result = dict.fromkeys(nodes)
+        queue = deque(result)
+        while queue:
+            for child in queue.popleft().getChildrenNodes():
+                if child not in result:
+                    result[child] = None
+                    queue.append(child)
+        return result
+
+    @contextmanager
+    def batch(self):
+        """Collects everything scheduled inside the ``with`` block and runs it as one pass at the end"""
+        self._batchDepth += 1
+        try:
+            yield self
+        finally:
+            self._batchDepth -= 1
+        self.run()
+
+    def run(self) -> int:
+        """Runs passes until nothing is scheduled, returns number of evaluations, deferred inside :meth:`batch`"""
+        if self._running or self._batchDepth > 0:
+            return 0
+
+        self._running = True
+        evaluations = self.evaluations
+        try:
+            for _ in range(self.MAX_PASSES):
+                if not self._pending:
+                    break
+                self._runPass()
+            else:
+                self._pending = {}
+        finally:
+            self._running = False
+        return self.evaluations - evaluations
+
+    def _runPass(self):
+        nodes = self.descendants(node for node in self._pending if self.scene.hasNode(node))
+        self._pending = {}
+
+        self.passes += 1
+        self.lastPass = Counter()
+
+        passNodes = self.scene.topology.sortedNodes(nodes)
+        for node in passNodes:
+            node.markDirty(True)
+
+        # descendants of threaded nodes wait for their results
+        waiting = set()
+        for node in passNodes:
+            if node in waiting:
+                self.pool.cancel(node)
+            elif not self.scene.hasNode(node):
+                continue
+            elif node.evalInThread:
+                if node.isDirty() or node.isInvalid():
+                    key = self.cache.makeKey(node)
+                    if not self.cache.restore(node, key):
+                        self.pool.submit(node, key)
+                        waiting.update(self.descendants(node.getChildrenNodes()))
+            else:
+                node.eval()
+
+        for node in passNodes:
+            self._pending.pop(node, None)
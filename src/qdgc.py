@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+A module containing the garbage collector policy and the pause monitor
+
+Nodes, sockets, edges and their graphics items only refer to their owners weakly, so removed objects are freed
+by reference counting. What is left for the cyclic collector are the long-lived objects of loaded documents,
+:func:`loadingDocument` moves them out of its way with ``gc.freeze()`` once loading is done.
+"""
+import gc
+import time
+from contextlib import contextmanager
+
+
+@contextmanager
+def loadingDocument():
+    """
+    Wraps loading of a document: no collection runs while loading, afterwards everything alive gets frozen
+
+    Objects frozen after earlier loads are unfrozen first, so documents closed meanwhile can still be collected.
+    """
+    enabled = gc.isenabled()
+    gc.unfreeze()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.collect()
+        gc.freeze()
+        if enabled:
+            gc.enable()
+
+
+class QD_GCMonitor():
+    """Records the duration of every garbage collection through ``gc.callbacks``
+
+    :Instance Attributes:
+
+    - **pauses** - list of ``(generation, seconds, collected)`` tuples, one per collection
+    """
+
+    def __init__(self):
+        self.pauses = []
+        self._startTime = None
+
+    def start(self):
+        if self._callback not in gc.callbacks:
+            gc.callbacks.append(self._callback)
+
+    def stop(self):
+        if self._callback in gc.callbacks:
+            gc.callbacks.remove(self._callback)
+
+    def clear(self):
+        self.pauses = []
+
+    def _callback(self, phase: str, info: dict):
+        if phase == 'start':
+            self._startTime = time.perf_counter()
+        elif self._startTime is not None:
+            self.pauses.append((info['generation'], time.perf_counter() - self._startTime, info['collected']))
+            self._startTime = None
+
+    def report(self) -> str:
+        lines = ['gc pauses: %d' % len(self.pauses)]
+        for generation in range(3):
+            durations = [seconds for gen, seconds, _ in self.pauses if gen == generation]
+            if durations:
+                lines.append('  gen%d: %5d runs, total %8.2f ms, max %6.2f ms' % (generation, len(durations), sum(durations) * 1e3, max(durations) * 1e3))
+        return '\n'.join(lines)
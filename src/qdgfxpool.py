@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+A module containing the pool of graphics items and widgets released by removed nodes, sockets and edges
+"""
+
+
+class QD_GfxPool():
+    """Keeps graphics items of removed objects for reuse by new objects of the same kind
+
+    Items are kept per key: node items per node class, along with the content their proxy shows, widgets and
+    socket and edge items per their class. By default every released item is kept: a deletion releases
+    exactly what its undo needs again, and any fixed cap drops most of them since every node brings several
+    sockets. ``limit`` caps the items kept per key where memory matters more. Released items must be out of
+    the ``QGraphicsScene`` already, the new owner rebinds an acquired item and puts it back into the scene.
+    Undo and redo of large deletions remove and recreate the same kinds of objects over and over, with the
+    pool only the first deletion pays for building their graphics.
+    """
+
+    def __init__(self, limit: int = None):
+        self.limit = limit
+        self._free = {}
+
+    def release(self, key, item) -> bool:
+        """Keeps ``item`` for reuse, returns ``False`` if there is no room left and the item should be dropped"""
+        free = self._free.setdefault(key, [])
+        if self.limit is not None and len(free) >= self.limit:
+            return False
+
+        free.append(item)
+        return True
+
+    def acquire(self, key):
+        """Returns a released item kept under ``key``, ``None`` if there is none"""
+        free = self._free.get(key)
+        return free.pop() if free else None
+
+    def clear(self):
+        self._free.clear()
+
+    def __len__(self) -> int:
+        return sum(len(free) for free in self._free.values())
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+A module containing the per-document id allocator
+"""
+
+# files written before ids were allocated per document carry memory addresses as ids
+LEGACY_ID_MIN = 1 << 32
+
+
+class QD_IdAllocator():
+    """Hands out small sequential persistent ids for the scene, its nodes, sockets and edges
+
+    Ids restored from files or history stamps get reserved, so an id is never handed out twice in one document,
+    even after the object holding it has been removed and a new one created.
+    """
+
+    def __init__(self):
+        self._next = 1
+
+    def allocate(self) -> int:
+        objId = self._next
+        self._next += 1
+        return objId
+
+    def reserve(self, objId: int):
+        if objId >= self._next:
+            self._next = objId + 1
+
+
+def hasLegacyIds(data: dict) -> bool:
+    """Checks if serialized scene ``data`` uses address-style ids"""
+    if data['id'] >= LEGACY_ID_MIN:
+        return True
+
+    for nodeData in data['nodes']:
+        if nodeData['id'] >= LEGACY_ID_MIN or any(sockData['id'] >= LEGACY_ID_MIN for sockData in nodeData['sockets']):
+            return True
+    return any(edgeData['id'] >= LEGACY_ID_MIN for edgeData in data['edges'])
+
+
+def remapLegacyIds(data: dict) -> dict:
+    """
+    Returns serialized scene ``data`` with sequential ids, ``data`` itself is returned if it has no address-style ids
+
+    Ids are numbered from 1 in file order: scene, then each node followed by its sockets, then edges.
+    The input is not modified.
+    """
+    if not hasLegacyIds(data):
+        return data
+
+    idMap = {}
+
+    def remap(objId: int) -> int:
+        idMap[objId] = len(idMap) + 1
+        return idMap[objId]
+
+    sceneId = remap(data['id'])
+
+    nodes = []
+    for nodeData in data['nodes']:
+        nodeId = remap(nodeData['id'])
+        nodes.append(nodeData | {
+            'id': nodeId,
+            'sockets': [sockData | {'id': remap(sockData['id'])} for sockData in nodeData['sockets']],
+        })
+
+    edges = []
+    for edgeData in data['edges']:
+        edges.append(edgeData | {
+            'id': remap(edgeData['id']),
+            'start': idMap.get(edgeData['start'], edgeData['start']),
+            'end': idMap.get(edgeData['end'], edgeData['end']),
+        })
+
+    return data | {'id': sceneId, 'nodes': nodes, 'edges': edges}
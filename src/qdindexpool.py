@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+A module containing the allocator of small positive indices, like the player index of enter nodes
+"""
+import heapq
+
+
+class QD_IndexPool():
+    """Hands out the smallest index not in use, indices can also be taken explicitly, e.g. when loaded from file
+
+    An index may be taken more than once, it becomes free again after being released the same number of times.
+    Freed indices below the high-water mark are kept in a heap, so allocating costs O(1) amortized plus the heap pop.
+    """
+
+    def __init__(self, first: int = 1):
+        """
+        :param first: smallest index handed out
+        :type first: ``int``
+        """
+        self.first = first
+        self.clear()
+
+    def clear(self):
+        self._used = {}
+        self._freed = []
+        self._next = self.first
+
+    def isUsed(self, index: int) -> bool:
+        return index in self._used
+
+    def allocate(self) -> int:
+        """Takes and returns the smallest free index"""
+        while self._freed:
+            index = heapq.heappop(self._freed)
+            if index not in self._used:
+                self.acquire(index)
+                return index
+
+        while self._next in self._used:
+            self._next += 1
+
+        index = self._next
+        self.acquire(index)
+        return index
+
+    def acquire(self, index: int):
+        self._used[index] = self._used.get(index, 0) + 1
+
+    def release(self, index: int):
+        count = self._used.get(index, 0)
+        if count > 1:
+            self._used[index] = count - 1
+
+        elif count == 1:
+            del self._used[index]
+            if index < self._next:
+                heapq.heappush(self._freed, index)
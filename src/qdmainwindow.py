@@ -10,6 +10,7 @@ from qdstatewidget import QD_StateWidget
 from qdquestwidget import QD_QuestWidget
 from qddraglistbox import QD_DragListBox
 from qdluaeditor import QD_LuaEditor
+from qdevalcachepanel import QD_EvalCachePanel
 from qdutils import *
 
 # images for the dark skin
@@ -59,6 +60,7 @@ class QD_MainWindow(QMainWindow):
         # self.windowMapper.mapped[QWidget].connect(self.setActiveSubWindow)
 
         self.createActions()
+        self.createDockWidgets()
         self.createMenus()
         self.createToolBars()
         self.createStatusBar()
@@ -325,6 +327,7 @@ class QD_MainWindow(QMainWindow):
         self.windowMenu.clear()
 
         self.windowMenu.addAction(self.actOpenNodeEditWindow)
+        self.windowMenu.addAction(self.evalCacheDock.toggleViewAction())
         self.windowMenu.addSeparator()
 
         self.windowMenu.addAction(self.actClose)
@@ -363,6 +366,15 @@ class QD_MainWindow(QMainWindow):
         self.statusBar().addPermanentWidget(self.mousePosLabel)
 
 
+    def createDockWidgets(self):
+        self.evalCachePanel = QD_EvalCachePanel(lambda: getattr(self.getCurrentStateNodeWidget(), 'scene', None))
+
+        self.evalCacheDock = QDockWidget("Evaluation Cache", self)
+        self.evalCacheDock.setWidget(self.evalCachePanel)
+        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.evalCacheDock)
+        self.evalCacheDock.hide()
+
+
     def createMdiChild(self, childWidget=None):
         if childWidget is None:
             childWidget = QD_QuestWidget()
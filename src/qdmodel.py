@@ -0,0 +1,639 @@
+# -*- coding: utf-8 -*-
+"""
+A module containing the headless graph model: scene, nodes, sockets and edges without any Qt dependency
+
+The model reads and writes the same json format as the editor, so batch tools can load, check and transform
+quest files without a ``QApplication``. The scene owns its nodes and edges and nodes own their sockets, the
+back-references ``node.scene``, ``socket.node`` and ``edge.scene`` are weak, so removed objects get freed by
+reference counting without waiting for the cyclic garbage collector. :class:`qdscene.QD_Scene`, :class:`qdnode.QD_Node`, :class:`qdsocket.QD_Socket`
+and :class:`qdedge.QD_Edge` derive from these classes and add the ``QGraphicsScene`` binding on top.
+"""
+import json
+import weakref
+from enum import Enum, unique
+
+from qdserializable import QD_Serializable
+from qdidallocator import QD_IdAllocator, remapLegacyIds
+from qdsockettype import SocketType
+from qdscenecomponents import QD_SceneComponents
+from qdscenereachability import QD_SceneReachability
+from qdscenetopology import QD_SceneTopology
+from qdscenesnapshot import QD_SceneSnapshotter, QD_SceneSnapshot
+from qdscenechanges import QD_SceneChangeLog, ChangeType
+
+
+@unique
+class EdgeType(int, Enum):
+    Direct = 0
+    Bezier = 1
+
+
+class QD_ModelSocket(QD_Serializable):
+    __slots__ = ('_node', 'type', 'edges', '__weakref__')
+
+    def __init__(self, node: 'QD_ModelNode', socktype: SocketType):
+        super().__init__(node.scene.ids.allocate())
+
+        self._node = weakref.ref(node)
+        self.type = socktype
+
+        # connected edges, an insertion-ordered dict used as set
+        self.edges = {}
+
+        self.node.scene.addSocket(self)
+
+    def onIdChanged(self, oldId):
+        self.node.scene.reindexObject(self, oldId)
+        self.node.scene.onSocketChanged(self)
+
+    @property
+    def node(self) -> 'QD_ModelNode':
+        """Owning node, ``None`` once the node has been freed"""
+        return self._node()
+
+    def __str__(self):
+        return "<%s %s %s>" % (self.__class__.__name__, id(self), self.type.name)
+
+    @property
+    def is_multi_edges(self) -> bool:
+        return self.type in [SocketType.In, SocketType.PulseIn, SocketType.PulseOut]
+
+    @property
+    def is_input(self) -> bool:
+        return self.type.is_in
+
+    @property
+    def is_output(self) -> bool:
+        return self.type.is_out
+
+    def delete(self):
+        self.node.scene.removeSocket(self)
+
+    def changeSocketType(self, socktype: SocketType):
+        if self.type is not socktype:
+            oldType = self.type
+            self.type = socktype
+            self.node.onSocketTypeChanged(self, oldType)
+
+    def hasEdge(self) -> bool:
+        return len(self.edges) > 0
+
+    def isConnected(self, edge: 'QD_ModelEdge') -> bool:
+        return edge in self.edges
+
+    def addEdge(self, edge: 'QD_ModelEdge'):
+        self.edges[edge] = None
+
+    def removeEdge(self, edge: 'QD_ModelEdge'):
+        self.edges.pop(edge, None)
+
+    def removeAllEdges(self, silent=False):
+        while self.edges:
+            edge, _ = self.edges.popitem()
+            edge.remove(silent_for_socket=(self if silent else None))
+
+    def serialize(self) -> dict:
+        return super().serialize() | {
+            'type': self.type,
+        }
+
+    def deserialize(self, data: dict, hashmap: dict = {}, restoreId: bool = True):
+        super().deserialize(data, hashmap, restoreId)
+        self.changeSocketType(SocketType(data['type']))
+
+
+class QD_ModelEdge(QD_Serializable):
+    """Edge between two sockets, the scene gets notified whenever the edge gets connected or disconnected"""
+
+    __slots__ = ('_scene', 'version', '_start_socket', '_end_socket', '_edge_type', '__weakref__')
+
+    def __init__(self, scene: 'QD_ModelScene', start_socket: QD_ModelSocket = None, end_socket: QD_ModelSocket = None, edge_type=EdgeType.Direct):
+        super().__init__(scene.ids.allocate())
+        self._scene = weakref.ref(scene)
+
+        # serial of the last change log entry of this edge
+        self.version = 0
+
+        # default init
+        self._start_socket = None
+        self._end_socket = None
+
+        # registered first, so the change log sees the edge added before it gets connected
+        self.scene.addEdge(self)
+
+        self.start_socket = start_socket
+        self.end_socket = end_socket
+        self.edge_type = edge_type
+
+    def onIdChanged(self, oldId):
+        self.scene.reindexObject(self, oldId)
+        self.scene.onEdgeChanged(self)
+
+    @property
+    def scene(self) -> 'QD_ModelScene':
+        """Owning scene, ``None`` once the scene has been freed"""
+        return self._scene()
+
+    def __str__(self):
+        return "<%s %s..%s -- S:%s E:%s>" % (self.__class__.__name__, hex(id(self))[2:5], hex(id(self))[-3:], self.start_socket, self.end_socket)
+
+    @property
+    def start_socket(self):
+        """
+        Start socket
+
+        :getter: Returns start :class:`QD_ModelSocket`
+        :setter: Sets start :class:`QD_ModelSocket` safely
+        :type: :class:`QD_ModelSocket`
+        """
+        return self._start_socket
+
+    @start_socket.setter
+    def start_socket(self, value):
+        if value is self._start_socket:
+            return
+
+        if self.isConnected():
+            self.scene.onEdgeDisconnected(self)
+
+        # if we were assigned to some socket before, delete us from the socket
+        if self._start_socket is not None:
+            self._start_socket.removeEdge(self)
+
+        # assign new start socket
+        self._start_socket = value
+        # addEdge to the QD_Socket class
+        if self.start_socket is not None:
+            self.start_socket.addEdge(self)
+
+        if self.isConnected():
+            self.scene.onEdgeConnected(self)
+
+    @property
+    def end_socket(self):
+        """
+        End socket
+
+        :getter: Returns end :class:`QD_ModelSocket` or ``None`` if not set
+        :setter: Sets end :class:`QD_ModelSocket` safely
+        :type: :class:`QD_ModelSocket` or ``None``
+        """
+        return self._end_socket
+
+    @end_socket.setter
+    def end_socket(self, value):
+        if value is self._end_socket:
+            return
+
+        if self.isConnected():
+            self.scene.onEdgeDisconnected(self)
+
+        # if we were assigned to some socket before, delete us from the socket
+        if self._end_socket is not None:
+            self._end_socket.removeEdge(self)
+
+        # assign new end socket
+        self._end_socket = value
+        # addEdge to the QD_Socket class
+        if self.end_socket is not None:
+            self.end_socket.addEdge(self)
+
+        if self.isConnected():
+            self.scene.onEdgeConnected(self)
+
+    def isConnected(self) -> bool:
+        """``True`` if both start and end sockets are assigned"""
+        return self._start_socket is not None and self._end_socket is not None
+
+    @property
+    def edge_type(self):
+        return self._edge_type
+
+    @edge_type.setter
+    def edge_type(self, value):
+        self._edge_type = value
+        self.scene.onEdgeChanged(self)
+
+    def getOtherSocket(self, known_socket: QD_ModelSocket):
+        """
+        Returns the oposite socket on this edge
+
+        :param known_socket: Provide known :class:`QD_ModelSocket` to be able to determine the oposite one.
+        :type known_socket: :class:`QD_ModelSocket`
+        :return: The oposite socket on this edge or ``None``
+        :rtype: :class:`QD_ModelSocket` or ``None``
+        """
+        return self.start_socket if known_socket == self.end_socket else self.end_socket
+
+    def remove_from_sockets(self):
+        """
+        Helper function which sets start and end :class:`QD_ModelSocket` to ``None``
+        """
+        self.end_socket = None
+        self.start_socket = None
+
+    def remove(self, silent_for_socket: QD_ModelSocket = None, silent=False):
+        self.remove_from_sockets()
+        self.scene.removeEdge(self)
+
+    def serialize(self) -> dict:
+        return {
+            'id': self.id,
+            'edge_type': self.edge_type,
+            'start': self.start_socket.id if self.start_socket is not None else None,
+            'end': self.end_socket.id if self.end_socket is not None else None,
+        }
+
+    def deserialize(self, data: dict, hashmap: dict = {}, restore_id: bool = True) -> bool:
+        if restore_id: self.id = data['id']
+        self.start_socket = hashmap[data['start']]
+        self.end_socket = hashmap[data['end']]
+        self.edge_type = data['edge_type']
+        return True
+
+
+class QD_ModelNode(QD_Serializable):
+    """Node with its sockets, position and the rest of its saved fields kept as they were loaded
+
+    :Instance Attributes:
+
+    - **scene** - the owning :class:`QD_ModelScene`
+    - **sockets** - sockets in creation order
+    - **fields** - saved fields this class doesn't know about, written back unchanged by :meth:`serialize`
+    """
+
+    Socket_class = QD_ModelSocket
+
+    # editor nodes write all their fields themselves and must not echo what they have loaded
+    keepUnknownFields = True
+
+    def __init__(self, scene: 'QD_ModelScene', typeName: str = None):
+        super().__init__(scene.ids.allocate())
+        self._scene = weakref.ref(scene)
+
+        # serial of the last change log entry of this node
+        self.version = 0
+
+        # sockets in creation order, plus socket type -> sockets of that type and number of distinct in/out types
+        self.sockets = []
+        self._socketsOfType = {}
+        self._inSocketCount = 0
+        self._outSocketCount = 0
+
+        self._typeName = typeName
+        self._position = (0.0, 0.0)
+        self.fields = {}
+
+    def onIdChanged(self, oldId):
+        self.scene.reindexObject(self, oldId)
+        self.scene.onNodeChanged(self)
+
+    @property
+    def scene(self) -> 'QD_ModelScene':
+        """Owning scene, ``None`` once the scene has been freed"""
+        return self._scene()
+
+    @property
+    def typeName(self) -> str:
+        """Node class name as saved in the ``type`` field, ``None`` for files written before it was saved"""
+        return self._typeName
+
+    @property
+    def position(self) -> tuple:
+        return self._position
+
+    def setPos(self, x: float, y: float):
+        self._position = (x, y)
+        self.scene.onNodeMoved(self)
+
+    def addSocket(self, socket: QD_ModelSocket) -> QD_ModelSocket:
+        self.sockets.append(socket)
+        self._addSocketType(socket, socket.type)
+        self.scene.onNodeChanged(self)
+        return socket
+
+    def removeSocket(self, socket: QD_ModelSocket):
+        self.sockets.remove(socket)
+        self._removeSocketType(socket, socket.type)
+        self.scene.onNodeChanged(self)
+
+    def onSocketTypeChanged(self, socket: QD_ModelSocket, oldType: SocketType):
+        if socket in self._socketsOfType.get(oldType, ()):
+            self._removeSocketType(socket, oldType)
+            self._addSocketType(socket, socket.type)
+        self.scene.onNodeChanged(self)
+
+    def _addSocketType(self, socket: QD_ModelSocket, socktype: SocketType):
+        if socktype not in self._socketsOfType:
+            self._socketsOfType[socktype] = []
+            if socktype.is_in:
+                self._inSocketCount += 1
+            else:
+                self._outSocketCount += 1
+        self._socketsOfType[socktype].append(socket)
+
+    def _removeSocketType(self, socket: QD_ModelSocket, socktype: SocketType):
+        sockets = self._socketsOfType[socktype]
+        sockets.remove(socket)
+
+        if not sockets:
+            del self._socketsOfType[socktype]
+            if socktype.is_in:
+                self._inSocketCount -= 1
+            else:
+                self._outSocketCount -= 1
+
+    def getSocket(self, socktype: SocketType) -> [QD_ModelSocket, None]:
+        sockets = self._socketsOfType.get(socktype)
+        return sockets[0] if sockets else None
+
+    def getSocketTypeSet(self):
+        """Read-only set-like view of socket types of this node"""
+        return self._socketsOfType.keys()
+
+    def getOutSocketCount(self):
+        return self._outSocketCount
+
+    def getInSocketCount(self):
+        return self._inSocketCount
+
+    def getInputs(self):
+        sockin = self.getSocket(SocketType.In)
+        if sockin is None:
+            return None
+        return [edge.getOtherSocket(sockin).node for edge in sockin.edges if hasattr(edge.getOtherSocket(sockin), 'node')]
+
+    def remove(self):
+        for socket in self.sockets:
+            for edge in socket.edges.copy():
+                edge.remove()
+            self.scene.removeSocket(socket)
+        self.scene.removeNode(self)
+
+    def serialize(self) -> dict:
+        data = self.fields | super().serialize()
+        if self.typeName is not None:
+            data['type'] = self.typeName
+
+        return data | {
+            'position': self.position,
+            'sockets': [sock.serialize() for sock in self.sockets],
+        }
+
+    def deserialize(self, data: dict, hashmap: dict = {}, restoreId: bool = True):
+        super().deserialize(data, hashmap, restoreId)
+        self.setPos(*data['position'])
+
+        if self.keepUnknownFields:
+            self._typeName = data.get('type')
+            self.fields = {key: value for key, value in data.items() if key not in ('id', 'type', 'position', 'sockets')}
+
+        index = 0
+        for sockData in data['sockets']:
+            if index >= len(self.sockets):
+                self.addSocket(self.__class__.Socket_class(self, SocketType(sockData['type'])))
+
+            self.sockets[index].deserialize(sockData, hashmap, restoreId)
+            index += 1
+
+        self.scene.onNodeChanged(self)
+
+
+class QD_ModelScene(QD_Serializable):
+    """Graph of nodes and edges with id lookup, per-type node index, connected components and topological order
+
+    Nodes and edges register themselves through :meth:`addNode`/:meth:`addEdge` and friends, edges report
+    connection changes through :meth:`onEdgeConnected`/:meth:`onEdgeDisconnected`.
+    """
+
+    Node_class = QD_ModelNode
+    Edge_class = QD_ModelEdge
+
+    def __init__(self):
+        # persistent ids of this document, see QD_IdAllocator
+        self.ids = QD_IdAllocator()
+        super().__init__(self.ids.allocate())
+
+        # nodes and edges are kept in insertion-ordered dicts used as ordered sets,
+        # _objects maps the persistent id of every node, edge and socket to the object
+        self._nodes = {}
+        self._edges = {}
+        self._objects = {}
+
+        # class name -> ordered set of nodes of exactly that class
+        self._nodesOfType = {}
+
+        # connected components, kept up to date when nodes and edges get added or removed
+        self.components = QD_SceneComponents(self)
+
+        # topological order of nodes along non-pulse edges, see QD_SceneTopology.sortedNodes()
+        self.topology = QD_SceneTopology(self)
+
+        # reachability from enter nodes and to exit nodes along all edges, see QD_SceneReachability.isDead()
+        self.reachability = QD_SceneReachability(self)
+
+        # every mutation of nodes and edges gets logged here, see QD_SceneChangeLog
+        self.changes = QD_SceneChangeLog()
+
+        # records of changed objects for takeSnapshot(), unchanged records are shared between snapshots
+        self.snapshotter = QD_SceneSnapshotter(self)
+
+        self.scene_width = 64000
+        self.scene_height = 64000
+
+    @classmethod
+    def fromFile(cls, filename: str) -> 'QD_ModelScene':
+        """Loads the scene of a saved quest file, other top-level entries of the file are kept in ``fileData``"""
+        with open(filename, "r", encoding='utf-8') as f:
+            data = json.load(f)
+
+        scene = cls()
+        scene.fileData = {key: value for key, value in data.items() if key != 'scene'}
+        scene.deserialize(data['scene'])
+        return scene
+
+    def saveToFile(self, filename: str):
+        with open(filename, "w", encoding='utf-8', newline='\n') as f:
+            json.dump(getattr(self, 'fileData', {}) | {'scene': self.serialize()}, f, ensure_ascii=False, indent=4)
+
+    @property
+    def nodes(self) -> list:
+        return list(self._nodes)
+
+    @property
+    def edges(self) -> list:
+        return list(self._edges)
+
+    def nodesOfType(self, nodeType) -> list:
+        """
+        Returns nodes of given type in insertion order, subclasses are not included
+
+        :param nodeType: node class or its name, i.e. ``'StateNode_enter'``
+        """
+        if not isinstance(nodeType, str):
+            nodeType = nodeType.__name__
+        return list(self._nodesOfType.get(nodeType, ()))
+
+    def hasNode(self, node: QD_ModelNode) -> bool:
+        return node in self._nodes
+
+    def hasEdge(self, edge: QD_ModelEdge) -> bool:
+        return edge in self._edges
+
+    def getObjectById(self, objId):
+        """Returns the node, edge or socket with given persistent id, or ``None``"""
+        return self._objects.get(objId)
+
+    def getNodeById(self, nodeId):
+        node = self._objects.get(nodeId)
+        return node if node in self._nodes else None
+
+    def getEdgeById(self, edgeId):
+        edge = self._objects.get(edgeId)
+        return edge if edge in self._edges else None
+
+    def getSocketById(self, socketId):
+        socket = self._objects.get(socketId)
+        return socket if isinstance(socket, QD_ModelSocket) else None
+
+    def onIdChanged(self, oldId):
+        self.ids.reserve(self.id)
+
+    def reindexObject(self, obj, oldId):
+        """Called by nodes, edges and sockets when their persistent id has been changed"""
+        if self._objects.get(oldId) is obj:
+            del self._objects[oldId]
+        self._objects[obj.id] = obj
+        self.ids.reserve(obj.id)
+
+    def _unindexObject(self, obj):
+        if self._objects.get(obj.id) is obj:
+            del self._objects[obj.id]
+
+    def addNode(self, node: QD_ModelNode):
+        self._nodes[node] = None
+        self._objects[node.id] = node
+        self._nodesOfType.setdefault(node.typeName, {})[node] = None
+        self.components.addNode(node)
+        self.topology.addNode(node)
+        self.reachability.addNode(node)
+        self.changes.append(ChangeType.NodeAdded, node)
+
+    def addEdge(self, edge: QD_ModelEdge):
+        self._edges[edge] = None
+        self._objects[edge.id] = edge
+        self.changes.append(ChangeType.EdgeAdded, edge)
+
+    def addSocket(self, socket: QD_ModelSocket):
+        self._objects[socket.id] = socket
+
+    def removeNode(self, node: QD_ModelNode):
+        if node in self._nodes:
+            del self._nodes[node]
+            self._unindexObject(node)
+            del self._nodesOfType[node.typeName][node]
+            self.components.removeNode(node)
+            self.topology.removeNode(node)
+            self.reachability.removeNode(node)
+            self.changes.append(ChangeType.NodeRemoved, node)
+
+    def removeEdge(self, edge: QD_ModelEdge):
+        if edge in self._edges:
+            del self._edges[edge]
+            self._unindexObject(edge)
+            self.changes.append(ChangeType.EdgeRemoved, edge)
+
+    def removeSocket(self, socket: QD_ModelSocket):
+        self._unindexObject(socket)
+
+    def onEdgeConnected(self, edge: QD_ModelEdge):
+        """Called by ``edge`` after it has been attached to its start and end sockets"""
+        self.components.onEdgeConnected(edge)
+        self.topology.onEdgeConnected(edge)
+        self.reachability.onEdgeConnected(edge)
+        self.changes.append(ChangeType.EdgeConnected, edge)
+
+    def onEdgeDisconnected(self, edge: QD_ModelEdge):
+        """Called by ``edge`` right before it gets detached from its start or end socket"""
+        self.components.onEdgeDisconnected(edge)
+        self.topology.onEdgeDisconnected(edge)
+        self.reachability.onEdgeDisconnected(edge)
+        self.changes.append(ChangeType.EdgeDisconnected, edge)
+
+    def onReachabilityChanged(self, nodes: set):
+        """Called with the nodes which became dead or alive, see :meth:`QD_SceneReachability.isDead`"""
+        pass
+
+    def onNodeMoved(self, node: QD_ModelNode):
+        self.changes.append(ChangeType.NodeMoved, node)
+
+    def onNodeChanged(self, node: QD_ModelNode):
+        """Called when sockets, id or any saved data of ``node`` have been changed"""
+        self.changes.append(ChangeType.NodeContentChanged, node)
+
+    def onEdgeChanged(self, edge: QD_ModelEdge):
+        """Called when type or id of ``edge`` have been changed, connection changes come through :meth:`onEdgeConnected`"""
+        self.changes.append(ChangeType.EdgeChanged, edge)
+
+    def onSocketChanged(self, socket: QD_ModelSocket):
+        """Called when id of ``socket`` has been changed, node and edge records refer to sockets by id"""
+        self.onNodeChanged(socket.node)
+        for edge in socket.edges:
+            self.onEdgeChanged(edge)
+
+    def takeSnapshot(self) -> QD_SceneSnapshot:
+        """Returns an immutable copy of nodes and edges which can be read from other threads, see :class:`QD_SceneSnapshot`"""
+        return self.snapshotter.take()
+
+    def clear(self):
+        for node in self.nodes:
+            node.remove()
+
+    def validate(self) -> list:
+        """Returns list of messages for rule violations the editor refuses to create, empty if the graph is valid"""
+        errors = []
+        for component in self.components.components():
+            if len(component.enterNodes) > 1:
+                errors.append('Graph with %d enter nodes' % len(component.enterNodes))
+            if len(component.exitNodes) > 1:
+                errors.append('Graph with %d exit nodes' % len(component.exitNodes))
+
+        if self.topology.hasCycle():
+            errors.append('Graph contains a loop')
+
+        for edge in self._edges:
+            if not edge.isConnected():
+                errors.append('Edge %s is not connected' % edge.id)
+            elif edge.start_socket.type.is_pulse and self.components.sameComponent(edge.start_socket.node, edge.end_socket.node):
+                errors.append('Pulse edge %s sends signal inside its own graph' % edge.id)
+        return errors
+
+    def serialize(self) -> dict:
+        nodes, edges = [], []
+        for node in self._nodes: nodes.append(node.serialize())
+        for edge in self._edges: edges.append(edge.serialize())
+        return {
+            'id': self.id,
+            'scene_width': self.scene_width,
+            'scene_height': self.scene_height,
+            'nodes': nodes,
+            'edges': edges,
+        }
+
+    def deserialize(self, data: dict, hashmap: dict = {}, restore_id: bool = True) -> bool:
+        hashmap = {}
+        data = remapLegacyIds(data)
+        self.clear()
+
+        if restore_id: self.id = data['id']
+        self.scene_width = data.get('scene_width', self.scene_width)
+        self.scene_height = data.get('scene_height', self.scene_height)
+
+        for node_data in data['nodes']:
+            node = self.__class__.Node_class(self, node_data.get('type'))
+            node.deserialize(node_data, hashmap, restore_id)
+            self.addNode(node)
+
+        for edge_data in data['edges']:
+            self.__class__.Edge_class(self).deserialize(edge_data, hashmap, restore_id)
+        return True
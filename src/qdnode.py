@@ -1,21 +1,43 @@
 # -*- coding: utf-8 -*-
+from collections import deque
+
 from PySide6.QtCore import QPointF
 
 from qdsocket import QD_Socket
 from qdsocketgfx import QD_SocketGfx, SocketType
-from qdserializable import QD_Serializable
+from qdmodel import QD_ModelNode
 
 from qdutils import *
 
-class QD_Node(QD_Serializable):
+class QD_Node(QD_ModelNode):
     Socket_class = QD_Socket
+    keepUnknownFields = False
+
+    # milliseconds onContentChanged waits for further edits before evaluating, 0 waits for the next event loop turn
+    evalDebounceMs = 0
+
+    # evaluate with evalCompute on the thread pool instead of eval on the GUI thread, see QD_EvalPool
+    evalInThread = False
 
 
     def __init__(self, scene: 'QD_Scene'):
-        super().__init__()
-        self.scene = scene
+        super().__init__(scene)
         self._iconIndex = 0
 
+        # result of the last evaluation
+        self.value = None
+
+
+    @property
+    def typeName(self) -> str:
+        """Name of the node class, saved as ``type`` so files can be loaded without the node classes, see :mod:`qdmodel`"""
+        return self.__class__.__name__
+
+
+    @property
+    def position(self) -> tuple:
+        return (self.gfx.scenePos().x(), self.gfx.scenePos().y())
+
 
     def updateConnectedEdges(self):
         for sock in self.sockets:
@@ -41,9 +63,12 @@ class QD_Node(QD_Serializable):
 
 
     def markDescendantsDirty(self, new_value: bool = True):
-        for other_node in self.getChildrenNodes():
+        # a running pass holds every descendant and marks it itself, see QD_EvalScheduler
+        if self.scene.evaluator.running:
+            return
+
+        for other_node in self.scene.evaluator.descendants(self.getChildrenNodes()):
             other_node.markDirty(new_value)
-            other_node.markChildrenDirty(new_value)
 
 
     def markChildrenDirty(self, new_value: bool = True):
@@ -60,32 +85,6 @@ class QD_Node(QD_Serializable):
         return other_nodes
 
 
-    def getSocket(self, socktype: SocketType) -> [QD_Socket, None]:
-        for sock in self.sockets:
-            if sock.type is socktype:
-                return sock
-        return None
-
-    def getSocketTypeSet(self):
-        return set([sock.type for sock in self.sockets])
-
-
-    def getOutSocketCount(self):
-        count = 0
-        for socktype in self.getSocketTypeSet():
-            if socktype.is_out:
-                count += 1
-        return count
-
-
-    def getInSocketCount(self):
-        count = 0
-        for socktype in self.getSocketTypeSet():
-            if socktype.is_in:
-                count += 1
-        return count
-
-
     def getSocketPosition(self, socktype: SocketType) -> QPointF:
         assert socktype in SocketType
         assert socktype in self.getSocketTypeSet()
@@ -111,20 +110,13 @@ class QD_Node(QD_Serializable):
             return QPointF(self.gfx.width, self.gfx.title_height + (self.gfx.height - self.gfx.title_height - y_out_spacing) / 2 + y_out_spacing)
 
 
-    def getInputs(self):
-        sockin = self.getSocket(SocketType.In)
-        if sockin is None:
-            return None
-        return [edge.getOtherSocket(sockin).node for edge in sockin.edges if hasattr(edge.getOtherSocket(sockin), 'node')]
-
-
     def getOutput(self, socktype: SocketType):
         sockout = self.getSocket(socktype)
         if sockout is None:
             return None
 
         if sockout.edges:
-            return sockout.edges[0].getOtherSocket(sockout).node
+            return next(iter(sockout.edges)).getOtherSocket(sockout).node
         return None
 
 
@@ -144,14 +136,18 @@ class QD_Node(QD_Serializable):
            so for node-4, it has two roots now: node-1 and node-3
         """
         result = []
-        nextNodes = [self]
+        nextNodes = deque([self])
+        visitedNodes = {self}
 
         while nextNodes:
-            currNode = nextNodes.pop(0)
+            currNode = nextNodes.popleft()
             inputs = currNode.getInputs()
 
             if inputs:
-                nextNodes += inputs
+                for node in inputs:
+                    if node not in visitedNodes:
+                        visitedNodes.add(node)
+                        nextNodes.append(node)
             else:
                 result.append(currNode)
         return result
@@ -159,11 +155,11 @@ class QD_Node(QD_Serializable):
 
     def findNodes(self, ignorePulseEdge: bool, func):
         result = set()
-        nextNodes = [self]
+        nextNodes = deque([self])
         visitedNodes = set()
 
         while nextNodes:
-            currNode = nextNodes.pop(0)
+            currNode = nextNodes.popleft()
             if currNode in visitedNodes:
                 continue
 
@@ -191,10 +187,38 @@ class QD_Node(QD_Serializable):
         pass
 
 
+    def onDeserialized(self, data: dict):
+        pass
+
+
     def onInputChanged(self, socket: 'QD_Socket'):
-        self.markDirty()
-        self.markDescendantsDirty()
-        self.eval()
+        # this node and all its descendants get re-evaluated, each once, see QD_EvalScheduler
+        self.scene.evaluator.schedule(self)
+        self.scene.evaluator.run()
+
+
+    def acquireGfx(self, gfxClass: type) -> 'QD_NodeGfx':
+        """Returns the item released by a removed node of this class rebound to this node, a new ``gfxClass`` item if there is none"""
+        gfx = self.scene.gfxPool.acquire(self.__class__)
+        if gfx is None:
+            return gfxClass(self)
+
+        gfx.rebind(self)
+        return gfx
+
+
+    def releaseGfx(self):
+        """Takes the graphics item out of the scene and hands it over to the scene's gfx pool, see :meth:`acquireGfx`"""
+        self.scene.gfx.removeItem(self.gfx)
+        self.scene.gfxPool.release(self.__class__, self.gfx)
+        self.gfx = None
+
+
+    def onContentChanged(self, *args):
+        """Logs the edit as ``NodeContentChanged`` and re-evaluates this node once its content stops changing for
+        ``evalDebounceMs``, signal arguments are ignored"""
+        self.scene.onNodeChanged(self)
+        self.scene.evaluator.scheduleDebounced(self, self.__class__.evalDebounceMs)
 
 
     def eval(self):
@@ -209,16 +233,17 @@ class QD_Node(QD_Serializable):
             print(" - remove all edges from sockets")
 
         for socket in self.sockets:
-            for edge in socket.edges:
+            for edge in socket.edges.copy():
                 if confg.DEBUG:
                     print("    - removing from socket:", socket, "edge:", edge)
                 edge.remove()
+            socket.releaseGfx()
+            self.scene.removeSocket(socket)
 
         if confg.DEBUG:
             print(" - remove gfx")
 
-        self.scene.gfx.removeItem(self.gfx)
-        self.gfx = None
+        self.releaseGfx()
 
         if confg.DEBUG:
             print(" - remove node from the scene")
@@ -242,9 +267,12 @@ class QD_Node(QD_Serializable):
             other_node.markInvalid(new_value)
 
     def markDescendantsInvalid(self, new_value: bool = True):
-        for other_node in self.getChildrenNodes():
+        # descendants in a running pass get evaluated and set their own flag
+        if self.scene.evaluator.running:
+            return
+
+        for other_node in self.scene.evaluator.descendants(self.getChildrenNodes()):
             other_node.markInvalid(new_value)
-            other_node.markChildrenInvalid(new_value)
 
 
     def evalOperation(self, input1, input2):
@@ -255,7 +283,6 @@ class QD_Node(QD_Serializable):
         inputs = self.getInputs()
         if not inputs:
             self.markInvalid()
-            self.markDescendantsDirty()
             self.gfx.setToolTip('Node has no input connected')
             return None
 
@@ -268,32 +295,74 @@ class QD_Node(QD_Serializable):
         self.markInvalid(False)
         self.gfx.setToolTip("")
 
-        self.markDescendantsDirty()
         self.evalChildren()
 
         return val
 
     def eval(self):
         if not self.isDirty() and not self.isInvalid():
-            print(" _> returning cached %s value:" % self.__class__.__name__, 12)
-            return 12
+            if confg.DEBUG:
+                print(" _> returning cached %s value:" % self.__class__.__name__, self.value)
+            return self.value
 
-        try:
+        # nothing this node reads changed since the cached result was computed
+        cache = self.scene.evaluator.cache
+        key = cache.makeKey(self)
+        if cache.restore(self, key):
+            return self.value
 
+        try:
+            self.scene.evaluator.onEvaluated(self)
             val = self.evalImplementation()
+            if self.isInvalid():
+                cache.discard(self)
+            else:
+                cache.store(self, key, val)
             return val
         except ValueError as e:
+            cache.discard(self)
             self.markInvalid()
             self.gfx.setToolTip(str(e))
             self.markDescendantsDirty()
         except Exception as e:
+            cache.discard(self)
             self.markInvalid()
             self.gfx.setToolTip(str(e))
             utils.dumpExcept(e)
 
+    def evalContentKey(self) -> str:
+        """Everything besides the inputs the value of this node depends on, its serialized content by default"""
+        return self.scene.evaluator.cache.contentKey(self.serialize())
+
+    def evalInputs(self):
+        """Collects on the GUI thread what ``evalCompute`` needs, the result must not share mutable objects with the scene"""
+        return tuple(node.value for node in self.getInputs() or ())
+
+    def evalCompute(self, inputs, cancelled: 'threading.Event'):
+        """
+        Computes the value of this node on a worker thread, only ``inputs`` may be read
+
+        Raise ``ValueError`` to mark the node invalid. Long computations should return early once ``cancelled`` is set,
+        their result gets dropped anyway.
+        """
+        return None
+
+    def onEvalFinished(self, value):
+        """Applies the result of ``evalCompute`` on the GUI thread"""
+        self.value = value
+        self.markDirty(False)
+        self.markInvalid(False)
+        self.gfx.setToolTip("")
+
+    def onEvalFailed(self, error: Exception):
+        self.markInvalid()
+        self.gfx.setToolTip(str(error))
+        self.markDescendantsDirty()
+
     def evalChildren(self):
-        for node in self.getChildrenNodes():
-            node.eval()
+        # children evaluated in the running pass anyway get dropped, nothing recurses
+        self.scene.evaluator.schedule(*self.getChildrenNodes())
+        self.scene.evaluator.run()
 
 
     def onMarkedDirty(self):
@@ -311,6 +380,9 @@ class QD_Node(QD_Serializable):
 
     @property
     def iconIndex(self):
+        """Index of the state icon, valid nodes no enter node reaches or which reach no exit node show as invalid"""
+        if self._iconIndex == 0 and self.scene.reachability.isDead(self):
+            return 2
         return self._iconIndex
 
 
@@ -327,23 +399,3 @@ class QD_Node(QD_Serializable):
     def setValid():
         self._iconIndex = 0
         self.gfx.setToolTip("")
-
-
-    def serialize(self) -> dict:
-        return super().serialize() | {
-            'position': (self.gfx.scenePos().x(), self.gfx.scenePos().y()),
-            'sockets': [sock.serialize() for sock in self.sockets],
-        }
-
-
-    def deserialize(self, data: dict, hashmap: dict = {}, restoreId: bool = True):
-        super().deserialize(data, hashmap, restoreId)
-        self.setPos(*data['position'])
-
-        index = 0
-        for sockData in data['sockets']:
-            if index >= len(self.sockets):
-                self.sockets.append(QD_Socket(self, SocketType.In))
-
-            self.sockets[index].deserialize(sockData, hashmap, restoreId)
-            index += 1
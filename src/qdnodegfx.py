@@ -1,8 +1,38 @@
 # -*- coding: utf-8 -*-
+import weakref
+
 from PySide6.QtWidgets import QGraphicsObject, QGraphicsItem
 
 
 class QD_NodeGfx(QGraphicsObject):
     def __init__(self, node: 'QD_Node', parent: QGraphicsItem = None):
         super().__init__(parent)
-        self.node = node
+        self._node = weakref.ref(node)
+
+        # position changes are reported to the scene, see itemChange()
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges)
+
+
+    def rebind(self, node: 'QD_Node'):
+        """Reuses this item released by a removed node for ``node``, the caller adds it back to the scene"""
+        # back where a new item starts, not reported since the node isn't in its scene yet
+        self._node = None
+        self.setPos(0, 0)
+        self._node = weakref.ref(node)
+
+        self.hovered = False
+        self._was_moved = False
+        self._last_selected_state = False
+        self.setSelected(False)
+
+
+    @property
+    def node(self) -> 'QD_Node':
+        """The node owning this item, ``None`` once the node has been freed or while the item is rebound"""
+        return self._node() if self._node is not None else None
+
+
+    def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value):
+        if change == QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged and self.node is not None:
+            self.node.scene.onNodeMoved(self.node)
+        return super().itemChange(change, value)
@@ -28,9 +28,14 @@ class QD_OpNode(QD_Node):
         self.content = None
         self.gfx = None
 
-        self.sockets = []
-
-        self.initInnerClasses()
+        # content and item of a removed node of this class come with their widgets and connections
+        pooled = self.scene.gfxPool.acquire(self.__class__)
+        if pooled is None:
+            self.initInnerClasses()
+        else:
+            self.gfx, self.content = pooled
+            self.content.rebind(self)
+            self.gfx.rebind(self)
         self.initSettings()
 
         self.title = self.__class__.opTitle
@@ -77,14 +82,23 @@ class QD_OpNode(QD_Node):
         self._max_socket_out_spacing = 30
 
 
+    def releaseGfx(self):
+        """Hands the graphics item over to the scene's gfx pool together with the content its proxy shows"""
+        self.scene.gfx.removeItem(self.gfx)
+        self.scene.gfxPool.release(self.__class__, (self.gfx, self.content))
+        self.gfx = None
+        self.content = None
+
+
     def initSockets(self, sockets, reset: bool = True):
         if reset:
-            for sock in self.sockets:
+            for sock in self.sockets.copy():
                 self.scene.gfx.removeItem(sock.gfx)
-            self.sockets = []
+                self.scene.removeSocket(sock)
+                self.removeSocket(sock)
 
         for type in sockets:
-            self.sockets.append(self.__class__.Socket_class(node=self, socktype=type))
+            self.addSocket(self.__class__.Socket_class(node=self, socktype=type))
 
         self.updateSockets()
 
@@ -156,15 +170,10 @@ class QD_OpNode(QD_Node):
             self.title = data['title']
 
             for sockdata in data['sockets']:
-                found = None
-                for sock in self.sockets:
-                    if sock.type == sockdata['type']:
-                        found = sock
-                        break
-
+                found = self.getSocket(SocketType(sockdata['type']))
                 if found is None:
                     found = self.__class__.Socket_class(node=self, socktype=SocketType(sockdata['type']))
-                    self.sockets.append(found)
+                    self.addSocket(found)
 
                 found.deserialize(sockdata, hashmap, restore_id)
 
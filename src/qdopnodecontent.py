@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import weakref
+
 from qdserializable import QD_Serializable
 from qdopnodecontentgfx import QD_OpNodeContentGfx
 
@@ -12,14 +14,37 @@ class QD_OpNodeContent(QD_Serializable):
 
         # node can be None which means this content is not bound to any node
         # used for adding sub-nodes in container nodes
-        self.node = node
+        self._node = weakref.ref(node) if node is not None else None
         self.initInnerClasses()
 
+        # a content reused for another node starts over from here, see rebind()
+        # only registered contents can serialize, see @opNodeRegister
+        self._initialData = self.serialize() if hasattr(self.__class__, 'op_code') else None
+
+
+    def rebind(self, node: 'QD_OpNode'):
+        """Reuses this content released by a removed node for ``node``, widgets are reset through :meth:`deserialize`"""
+        self._node = None
+        if self._initialData is not None:
+            self.deserialize(self._initialData)
+        self._node = weakref.ref(node)
+
+
+    @property
+    def node(self) -> 'QD_OpNode':
+        return self._node() if self._node is not None else None
+
 
     def initInnerClasses(self):
         self.gfx = self.NodeContentGfx_class(self)
 
 
+    def onContentChanged(self, *args):
+        """Forwards widget edits to the node owning this content now, connect widget signals here instead of to the node"""
+        if self.node is not None:
+            self.node.onContentChanged()
+
+
     def serialize(self) -> dict:
         return {'op_code': self.__class__.op_code} # added by @opNodeRegister
 
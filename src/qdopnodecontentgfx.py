@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import weakref
+
 from qdserializable import QD_Serializable
 from PySide6.QtWidgets import *
 
@@ -7,11 +9,18 @@ class QD_OpNodeContentGfx(QWidget):
     def __init__(self, content: 'QD_OpNodeContent', parent: QWidget = None):
         super().__init__(parent)
 
-        self.content = content
-        self.node = content.node
+        self._content = weakref.ref(content)
 
         self.resize(0, 0)
         self.initUI()
 
+    @property
+    def content(self) -> 'QD_OpNodeContent':
+        return self._content()
+
+    @property
+    def node(self) -> 'QD_OpNode':
+        return self.content.node
+
     def initUI(self):
         raise NotImplementedError()
@@ -3,9 +3,19 @@ from PySide6.QtWidgets import *
 from PySide6.QtCore import *
 from PySide6.QtGui import *
 
+from qdassets import assets
+from qdutils import utils
 from qdnodegfx import QD_NodeGfx
 
 
+class QD_OpNodeTitleGfx(QGraphicsTextItem):
+    """Title text of an op node, ``node`` is looked up through the parent item instead of being stored"""
+
+    @property
+    def node(self) -> 'QD_OpNode':
+        return self.parentItem().node
+
+
 class QD_OpNodeGfx(QD_NodeGfx):
     def __init__(self, node: 'QD_OpNode', parent: QGraphicsItem = None):
         super().__init__(node, parent)
@@ -99,8 +109,6 @@ class QD_OpNodeGfx(QD_NodeGfx):
         self._brush_title = QBrush(QColor("#FF313131"))
         self._brush_background = QBrush(QColor("#E3212121"))
 
-        self._icons = QImage("icons/status_icons.png")
-
     def onSelected(self):
         """Our event handling when the node was selected"""
         self.node.scene.gfx.itemSelected.emit()
@@ -171,8 +179,7 @@ class QD_OpNodeGfx(QD_NodeGfx):
 
     def initTitle(self):
         """Set up the title Graphics representation: font, color, position, etc."""
-        self.title_item = QGraphicsTextItem(self)
-        self.title_item.node = self.node
+        self.title_item = QD_OpNodeTitleGfx(self)
         self.title_item.setDefaultTextColor(self._title_color)
         self.title_item.setPos(self.title_horizontal_padding, 0)
         self.title_item.setTextWidth(self.width - 2 * self.title_horizontal_padding)
@@ -192,41 +199,31 @@ class QD_OpNodeGfx(QD_NodeGfx):
 
     def paint(self, painter, option: QStyleOptionGraphicsItem, widget=None):
         """Painting the rounded rectanglar `QD_OpNode`"""
+        path_title, path_content, path_outline = utils.titledNodePaths(self.width, self.height, self.title_height, self.edge_roundness)
+
         # title
-        path_title = QPainterPath()
-        path_title.setFillRule(Qt.FillRule.WindingFill)
-        path_title.addRoundedRect(0, 0, self.width, self.title_height, self.edge_roundness, self.edge_roundness)
-        path_title.addRect(0, self.title_height - self.edge_roundness, self.edge_roundness, self.edge_roundness)
-        path_title.addRect(self.width - self.edge_roundness, self.title_height - self.edge_roundness, self.edge_roundness, self.edge_roundness)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.setBrush(self._brush_title)
-        painter.drawPath(path_title.simplified())
+        painter.drawPath(path_title)
 
         # content
-        path_content = QPainterPath()
-        path_content.setFillRule(Qt.FillRule.WindingFill)
-        path_content.addRoundedRect(0, self.title_height, self.width, self.height - self.title_height, self.edge_roundness, self.edge_roundness)
-        path_content.addRect(0, self.title_height, self.edge_roundness, self.edge_roundness)
-        path_content.addRect(self.width - self.edge_roundness, self.title_height, self.edge_roundness, self.edge_roundness)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.setBrush(self._brush_background)
-        painter.drawPath(path_content.simplified())
+        painter.drawPath(path_content)
 
         # outline
-        path_outline = QPainterPath()
-        path_outline.addRoundedRect(-1, -1, self.width + 2, self.height + 2, self.edge_roundness, self.edge_roundness)
         painter.setBrush(Qt.BrushStyle.NoBrush)
         if self.hovered:
             painter.setPen(self._pen_hover_selected if self.isSelected() else self._pen_hovered)
-            painter.drawPath(path_outline.simplified())
+            painter.drawPath(path_outline)
             painter.setPen(self._pen_default)
-            painter.drawPath(path_outline.simplified())
+            painter.drawPath(path_outline)
         else:
             painter.setPen(self._pen_selected if self.isSelected() else self._pen_default)
-            painter.drawPath(path_outline.simplified())
+            painter.drawPath(path_outline)
 
         offset = 24.0
         if self.node.isDirty(): offset = 0.0
         if self.node.isInvalid(): offset = 48.0
 
-        painter.drawImage(QRectF(-10, -10, 24.0, 24.0), self._icons, QRectF(offset, 0, 24.0, 24.0))
+        assets.drawImage(painter, QRectF(-10, -10, 24.0, 24.0), 'icons/status_icons.png', QRectF(offset, 0, 24.0, 24.0))
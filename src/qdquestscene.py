@@ -1,7 +1,13 @@
 # -*- coding: utf-8 -*-
 from qdscene import QD_Scene
 from qdquestscenegfx import QD_QuestSceneGfx
+from qdindexpool import QD_IndexPool
 
 
 class QD_QuestScene(QD_Scene):
     SceneGfx_class = QD_QuestSceneGfx
+
+    def __init__(self):
+        # player index of every StateNode_enter is taken from here, the smallest free one goes to a new node
+        self.playerIndices = QD_IndexPool(1)
+        super().__init__()
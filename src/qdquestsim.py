@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+"""
+A module simulating players walking through the state machine of a quest, sharded over a process pool
+
+Only this module and the ones it imports need NumPy, the editor itself runs without it.
+"""
+import json
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from qdidallocator import remapLegacyIds
+from qdscenecsr import QD_SceneCSR
+from qdsockettype import SocketType
+
+
+def parseTimeout(text) -> float:
+    """Seconds of a saved ``timeout`` field, ``inf`` if empty, not positive or ``无限制``"""
+    try:
+        seconds = float(text)
+    except (TypeError, ValueError):
+        return math.inf
+    return seconds if seconds > 0 else math.inf
+
+
+class QD_QuestSimModel():
+    """Transition table of a quest for :class:`QD_QuestSimulator`, plain NumPy arrays so it pickles cheaply
+
+    Players start at a ``StateNode_enter`` and leave every node through one of its connected output sockets,
+    ``Out_True``, ``Out_False``, index outputs and pulse outputs alike. Each socket type gets a weight, from
+    ``branchWeights`` of the node or :attr:`DEFAULT_WEIGHTS`, split evenly over the edges of that socket. A player
+    reaching a ``StateNode_exit`` completes the quest, a player reaching any other node without connected outputs
+    is stuck in a dead end.
+
+    Only ``StateNode_act`` nodes take time, see :meth:`QD_QuestSimulator.simulate`. A player times out if the
+    time spent in one act exceeds its timeout or the time since entering the quest exceeds the quest timeout.
+    Timeouts are the ``timeout`` field of the state config of a node, saved as ``confg`` next to its fields or
+    passed in ``timeouts``, and of the quest config. They count in seconds.
+
+    :Instance Attributes:
+
+    - **nodeIds** - ``int64[nodeCount]`` id of each node, nodes are numbered in id order like :class:`qdscenecsr.QD_SceneCSR`
+    - **startNodes** - ``int32[]`` indices of the enter nodes, players are spread evenly over them
+    - **exitMask** - ``bool[nodeCount]`` ``True`` for exit nodes
+    - **timedMask** - ``bool[nodeCount]`` ``True`` for act nodes
+    - **nodeTimeouts** - ``float64[nodeCount]`` seconds, ``inf`` without timeout
+    - **questTimeout** - seconds, ``inf`` without timeout
+    - **indptr** - ``int64[nodeCount + 1]`` offsets of the transitions of each node
+    - **targets** - ``int32[transitionCount]`` target node of each transition
+    - **thresholds** - ``float64[transitionCount]`` node index plus cumulative probability of each transition
+    """
+
+    # weight of each output socket type if the node has no branchWeights for it
+    DEFAULT_WEIGHTS = {
+        SocketType.Out_True: 1.0,
+        SocketType.Out_False: 1.0,
+        SocketType.PulseOut: 1.0,
+    } | {socktype: 1.0 for socktype in SocketType if socktype.is_index}
+
+    def __init__(self, csr: QD_SceneCSR, nodeTimeouts: dict = None, questTimeout: float = math.inf, branchWeights: dict = None):
+        """
+        :param csr: graph of the quest
+        :param nodeTimeouts: node id -> seconds
+        :param questTimeout: seconds
+        :param branchWeights: node id -> dict of output :class:`qdsockettype.SocketType` -> weight
+        """
+        nodeTimeouts = nodeTimeouts or {}
+        branchWeights = branchWeights or {}
+
+        self.nodeIds = csr.nodeIds
+        self.startNodes = np.flatnonzero(csr.nodeTypes == csr.typeCode('StateNode_enter')).astype(np.int32)
+        self.exitMask = csr.nodeTypes == csr.typeCode('StateNode_exit')
+        self.timedMask = csr.nodeTypes == csr.typeCode('StateNode_act')
+        self.nodeTimeouts = np.array([nodeTimeouts.get(nodeId, math.inf) for nodeId in self.nodeIds.tolist()], dtype=np.float64)
+        self.questTimeout = questTimeout
+
+        # weight of every edge: weight of its socket type split over the edges of that socket
+        weights = np.empty(csr.edgeCount, dtype=np.float64)
+        for index, nodeId in enumerate(self.nodeIds.tolist()):
+            start, end = csr.indptr[index], csr.indptr[index + 1]
+            labels = csr.edgeLabels[start:end].tolist()
+            nodeWeights = branchWeights.get(nodeId, {})
+            for position, label in enumerate(labels):
+                socktype = SocketType(label)
+                weights[start + position] = nodeWeights.get(socktype, self.DEFAULT_WEIGHTS.get(socktype, 0.0)) / labels.count(label)
+
+        # nodes whose weights are all zero have no way out
+        keep = weights > 0
+        sources = csr.edgeSources[keep]
+        self.targets = csr.indices[keep]
+        weights = weights[keep]
+
+        self.indptr = np.zeros(self.nodeCount + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=self.nodeCount), out=self.indptr[1:])
+
+        # node i owns thresholds in (i, i + 1], so one searchsorted over all of them picks a transition per player
+        cumulative = np.cumsum(weights / np.bincount(sources, weights, minlength=self.nodeCount)[sources])
+        rowStarts = np.concatenate([[0.0], cumulative])[self.indptr[:-1]]
+        self.thresholds = sources + np.minimum(cumulative - rowStarts[sources], 1.0)
+
+        lasts = self.indptr[1:][self.indptr[1:] > self.indptr[:-1]] - 1
+        self.thresholds[lasts] = sources[lasts] + 1.0
+
+    @classmethod
+    def fromData(cls, data: dict, questConfg: dict = None, timeouts: dict = None, branchWeights: dict = None) -> 'QD_QuestSimModel':
+        """
+        :param data: serialized scene
+        :param questConfg: serialized :class:`qdquestconfg.QD_QuestConfg`
+        :param timeouts: node id -> serialized :class:`qdstateconfg.QD_StateConfg` or seconds, overrides saved ones
+        """
+        data = remapLegacyIds(data)
+        csr = QD_SceneCSR.fromData(data)
+
+        nodeTimeouts = {node['id']: parseTimeout(node['confg'].get('timeout')) for node in data['nodes'] if 'confg' in node}
+
+        for nodeId, timeout in (timeouts or {}).items():
+            nodeTimeouts[nodeId] = parseTimeout(timeout['timeout'] if isinstance(timeout, dict) else timeout)
+
+        questTimeout = parseTimeout(questConfg.get('timeout')) if questConfg else math.inf
+        return cls(csr, nodeTimeouts, questTimeout, branchWeights)
+
+    @classmethod
+    def fromFile(cls, filename: str, timeouts: dict = None, branchWeights: dict = None) -> 'QD_QuestSimModel':
+        """Model of a saved quest file, with the timeout of its quest config"""
+        with open(filename, "r", encoding='utf-8') as f:
+            data = json.load(f)
+        return cls.fromData(data['scene'], data.get('confg'), timeouts, branchWeights)
+
+    @classmethod
+    def fromScene(cls, scene: 'QD_ModelScene', questConfg: dict = None, timeouts: dict = None, branchWeights: dict = None) -> 'QD_QuestSimModel':
+        """Model of a :class:`qdmodel.QD_ModelScene` or an editor scene"""
+        return cls.fromData(scene.serialize(), questConfg, timeouts, branchWeights)
+
+    @property
+    def nodeCount(self) -> int:
+        return len(self.nodeIds)
+
+    @property
+    def transitionCount(self) -> int:
+        return len(self.targets)
+
+
+class QD_QuestSimResult():
+    """Outcome of a simulation, per node counts are ``int64[nodeCount]`` arrays in the node order of the model
+
+    :Instance Attributes:
+
+    - **nodeIds** - ``int64[nodeCount]`` id of each node
+    - **players** - number of simulated players
+    - **visits** - players entering each node, once per visit
+    - **completions** - players completing the quest at each exit node
+    - **deadEnds** - players stuck at each node without a way out
+    - **timeouts** - players timing out at each node
+    - **unfinished** - players still walking after ``maxSteps`` steps
+    - **seconds** - wall time of the simulation
+    """
+
+    def __init__(self, nodeIds: np.ndarray):
+        self.nodeIds = nodeIds
+        self.players = 0
+        self.visits = np.zeros(len(nodeIds), dtype=np.int64)
+        self.completions = np.zeros(len(nodeIds), dtype=np.int64)
+        self.deadEnds = np.zeros(len(nodeIds), dtype=np.int64)
+        self.timeouts = np.zeros(len(nodeIds), dtype=np.int64)
+        self.unfinished = 0
+        self.seconds = 0.0
+
+    def merge(self, other: 'QD_QuestSimResult'):
+        """Adds the counts of another shard, wall time is left to the caller"""
+        self.players += other.players
+        self.visits += other.visits
+        self.completions += other.completions
+        self.deadEnds += other.deadEnds
+        self.timeouts += other.timeouts
+        self.unfinished += other.unfinished
+
+    @property
+    def completed(self) -> int:
+        return int(self.completions.sum())
+
+    @property
+    def completionRate(self) -> float:
+        return self.completed / self.players if self.players else 0.0
+
+    @property
+    def playersPerSecond(self) -> float:
+        return self.players / self.seconds if self.seconds else 0.0
+
+    def perNode(self, counts: np.ndarray) -> dict:
+        """Node id -> count of the nodes with a non-zero count"""
+        return {int(self.nodeIds[index]): int(counts[index]) for index in np.flatnonzero(counts)}
+
+    def summary(self) -> dict:
+        return {
+            'players': self.players,
+            'completionRate': self.completionRate,
+            'completions': self.perNode(self.completions),
+            'deadEnds': self.perNode(self.deadEnds),
+            'timeouts': self.perNode(self.timeouts),
+            'unfinished': self.unfinished,
+            'playersPerSecond': self.playersPerSecond,
+        }
+
+
+def _simulateShard(model: QD_QuestSimModel, players: int, seed, meanStepTime: float, maxSteps: int) -> QD_QuestSimResult:
+    """Walks ``players`` players at once, every step advances all players still walking by one node"""
+    result = QD_QuestSimResult(model.nodeIds)
+    result.players = players
+    if players == 0:
+        return result
+
+    if model.startNodes.size == 0:
+        result.unfinished = players
+        return result
+
+    rng = np.random.default_rng(seed)
+    nodeCount = model.nodeCount
+    outDegrees = np.diff(model.indptr)
+
+    # indices of the players still walking, their node and time since entering the quest
+    walking = np.arange(players)
+    current = model.startNodes[rng.integers(0, model.startNodes.size, players)]
+    elapsed = np.zeros(players, dtype=np.float64)
+
+    for _ in range(maxSteps):
+        if walking.size == 0:
+            break
+
+        nodes = current[walking]
+        result.visits += np.bincount(nodes, minlength=nodeCount)
+
+        done = model.exitMask[nodes]
+        result.completions += np.bincount(nodes[done], minlength=nodeCount)
+
+        timedOut = np.zeros(walking.size, dtype=bool)
+        timed = np.flatnonzero(model.timedMask[nodes] & ~done)
+        if timed.size:
+            durations = rng.exponential(meanStepTime, timed.size)
+            elapsed[walking[timed]] += durations
+            timedOut[timed] = (durations > model.nodeTimeouts[nodes[timed]]) | (elapsed[walking[timed]] > model.questTimeout)
+        result.timeouts += np.bincount(nodes[timedOut], minlength=nodeCount)
+
+        deadEnd = (outDegrees[nodes] == 0) & ~done & ~timedOut
+        result.deadEnds += np.bincount(nodes[deadEnd], minlength=nodeCount)
+
+        moving = ~(done | timedOut | deadEnd)
+        walking, nodes = walking[moving], nodes[moving]
+        transitions = np.searchsorted(model.thresholds, nodes + rng.random(walking.size), side='right')
+
+        # node + u may round up to node + 1 for u close to 1
+        transitions = np.minimum(transitions, model.indptr[nodes + 1] - 1)
+        current[walking] = model.targets[transitions]
+    else:
+        result.unfinished = walking.size
+
+    return result
+
+
+class QD_QuestSimulator():
+    """Runs many players through a :class:`QD_QuestSimModel`, sharded over worker processes
+
+    Each shard walks all its players at once with NumPy, one step per node visited. Workers are started with
+    the ``spawn`` method, so they do not inherit the Qt state of the editor process.
+    """
+
+    # players walked together in one array, bounds the memory of a shard
+    SHARD_SIZE = 1 << 20
+
+    def __init__(self, model: QD_QuestSimModel, processes: int = None):
+        """
+        :param processes: worker processes, ``os.cpu_count()`` by default, ``1`` runs in this process
+        """
+        self.model = model
+        self.processes = processes or os.cpu_count() or 1
+
+    def simulate(self, players: int, seed: int = None, meanStepTime: float = 60.0, maxSteps: int = 1000) -> QD_QuestSimResult:
+        """
+        :param players: number of players to simulate
+        :param seed: seed of the random numbers, the same seed and process count give the same result
+        :param meanStepTime: mean seconds spent in an act node, durations are exponentially distributed
+        :param maxSteps: nodes a player may visit before counting as unfinished, ends walks around loops
+        """
+        start = time.perf_counter()
+
+        shardCount = max(self.processes, math.ceil(players / self.SHARD_SIZE))
+        shards = [players // shardCount + (index < players % shardCount) for index in range(shardCount)]
+        seeds = np.random.SeedSequence(seed).spawn(shardCount)
+        args = (meanStepTime, maxSteps)
+
+        result = QD_QuestSimResult(self.model.nodeIds)
+        if self.processes == 1:
+            for count, shardSeed in zip(shards, seeds):
+                result.merge(_simulateShard(self.model, count, shardSeed, *args))
+        else:
+            with ProcessPoolExecutor(self.processes, mp_context=multiprocessing.get_context('spawn')) as executor:
+                futures = [executor.submit(_simulateShard, self.model, count, shardSeed, *args) for count, shardSeed in zip(shards, seeds)]
+                for future in futures:
+                    result.merge(future.result())
+
+        result.seconds = time.perf_counter() - start
+        return result
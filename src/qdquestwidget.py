@@ -14,6 +14,7 @@ from qdstatenode import QD_StateNode
 from qdedge import *
 from qdviewgfx import MODE_EDGE_DRAG, QD_ViewGfx  # , MODE_EDGES_REROUTING
 from qdutils import *
+from qdgc import loadingDocument
 from qdsocketgfx import SocketType
 
 
@@ -50,15 +51,16 @@ class QD_QuestWidget(QSplitter):
 
 
     def getNodeClassFromData(self, data):
-        if 'op_code' not in data:
-            return QD_OpNode
-        return utils.getOpNodeType(data['op_code'])
+        if 'op_code' in data:
+            return utils.getOpNodeType(data['op_code'])
+        if 'type' in data:
+            return utils.getStateNodeType(data['type'])
+        return QD_OpNode
 
     def doEvalOutputs(self):
         # eval all output nodes
-        for node in self.scene.nodes:
-            if node.__class__.__name__ == "CalcNode_Output":
-                node.eval()
+        for node in self.scene.nodesOfType("CalcNode_Output"):
+            node.eval()
 
     def onHistoryRestored(self):
         self.doEvalOutputs()
@@ -81,12 +83,14 @@ class QD_QuestWidget(QSplitter):
                     QMessageBox.warning(self, "Incompatible json file version: %s" % data['version'], "Current version is %s" % confg.APP_VERSION)
                     return False
 
-                self.confg.deserialize(data['confg'])
-                self.scene.deserialize(data['scene'])
+                # the loaded graph and its initial history stamp live until the document is closed
+                with loadingDocument():
+                    self.confg.deserialize(data['confg'])
+                    self.scene.deserialize(data['scene'])
 
-                self.scene.has_been_modified = False
-                self.scene.history.clear()
-                self.scene.history.storeInitialHistoryStamp()
+                    self.scene.has_been_modified = False
+                    self.scene.history.clear()
+                    self.scene.history.storeInitialHistoryStamp()
 
                 self.filename = filename
 
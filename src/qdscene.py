@@ -1,26 +1,27 @@
 # -*- coding: utf-8 -*-
 import os
 import json
+from contextlib import contextmanager
 from qdutils import *
-from qdserializable import QD_Serializable
+from qdmodel import QD_ModelScene
+from qdidallocator import remapLegacyIds
 from qdquestscenegfx import QD_QuestSceneGfx
 from qdopnode import QD_OpNode
 from qdedge import QD_Edge
+from qdsocket import QD_Socket
 from qdscenehistory import QD_SceneHistory
 from qdsceneclipboard import QD_SceneClipboard
+from qdscenetransaction import QD_SceneTransaction
+from qdgfxpool import QD_GfxPool
+from qdevalscheduler import QD_EvalScheduler
 
 from qdscenegfx import QD_SceneGfx
 
-class QD_Scene(QD_Serializable):
+class QD_Scene(QD_ModelScene):
     SceneGfx_class = QD_SceneGfx
 
     def __init__(self):
         super().__init__()
-        self.nodes = []
-        self.edges = []
-
-        self.scene_width = 64000
-        self.scene_height = 64000
 
         # custom flag used to suppress triggering onItemSelected which does a bunch of stuff
         self._silent_selection_events = False
@@ -36,6 +37,15 @@ class QD_Scene(QD_Serializable):
         # here we can store callback for retrieving the class for Nodes
         self.node_class_selector = None
 
+        # QD_SceneTransaction while transaction() is open
+        self.activeTransaction = None
+
+        # graphics items of removed sockets and edges, reused by new ones
+        self.gfxPool = QD_GfxPool()
+
+        # evaluates changed nodes and their descendants, see QD_Node.onInputChanged
+        self.evaluator = QD_EvalScheduler(self)
+
         self.initUI()
         self.history = QD_SceneHistory(self)
         self.clipboard = QD_SceneClipboard(self)
@@ -75,6 +85,9 @@ class QD_Scene(QD_Serializable):
         :type silent: ``bool``
         """
         if self._silent_selection_events: return
+        if self.activeTransaction is not None:
+            self.activeTransaction.selectionChanged = True
+            return
 
         current_selected_items = self.getSelectedItems()
         if current_selected_items != self._last_selected_items:
@@ -93,6 +106,10 @@ class QD_Scene(QD_Serializable):
         :param silent: If ``True`` scene's onItemsDeselected won't be called and history stamp not stored
         :type silent: ``bool``
         """
+        if self.activeTransaction is not None:
+            self.activeTransaction.selectionChanged = True
+            return
+
         self.resetLastSelectedStates()
         if self._last_selected_items != []:
             self._last_selected_items = []
@@ -100,6 +117,71 @@ class QD_Scene(QD_Serializable):
                 self.history.storeHistory("Deselected Everything")
                 for callback in self._items_deselected_listeners: callback()
 
+    @contextmanager
+    def transaction(self, desc: str = None):
+        """
+        Groups all edits done inside the ``with`` block into one undo step
+
+        History stamps, selection events, ``onInputChanged`` notifications and viewport repaints are deferred
+        to the end of the outermost transaction, which then stores one history stamp if anything has changed,
+        notifies each changed input once in topological order and repaints once. Nothing gets rolled back
+        if the block raises.
+
+        :param desc: Description of the history stamp, defaults to the first ``storeHistory`` call inside
+        :type desc: ``str``
+        """
+        if self.activeTransaction is not None:
+            yield self.activeTransaction
+            return
+
+        self.activeTransaction = QD_SceneTransaction(self, desc)
+        try:
+            yield self.activeTransaction
+        finally:
+            self._commitTransaction()
+
+    def _commitTransaction(self):
+        transaction = self.activeTransaction
+
+        # cleared first, a raising listener must not leave the scene absorbing edits into a dead transaction
+        self.activeTransaction = None
+        try:
+            try:
+                if transaction.selectionChanged:
+                    current_selected_items = self.getSelectedItems()
+                    if current_selected_items != self._last_selected_items:
+                        transaction.historyRequested = True
+                        if current_selected_items:
+                            self._last_selected_items = current_selected_items
+                            for callback in self._item_selected_listeners: callback()
+                        else:
+                            self.resetLastSelectedStates()
+                            self._last_selected_items = []
+                            for callback in self._items_deselected_listeners: callback()
+
+                sockets = [socket for socket in transaction.inputSockets if self.hasNode(socket.node)]
+                sockets.sort(key=lambda socket: self.topology.order(socket.node))
+
+                # nodes reached from several changed inputs get evaluated once
+                with self.evaluator.batch():
+                    for socket in sockets:
+                        socket.node.onInputChanged(socket)
+            finally:
+                # the edits are in the scene whatever failed above, they still get their undo step
+                if transaction.historyRequested or transaction.hasChanges:
+                    self.history.storeHistory(transaction.desc or "Edited scene", setModified=transaction.setModified or transaction.hasChanges)
+        finally:
+            for view in transaction.frozenViews:
+                view.setUpdatesEnabled(True)
+            self.gfx.update()
+
+    def notifyInputChanged(self, socket: QD_Socket):
+        """Calls ``onInputChanged`` of the node owning ``socket``, deferred to the end of an open transaction"""
+        if self.activeTransaction is not None:
+            self.activeTransaction.notifyInputChanged(socket)
+        else:
+            socket.node.onInputChanged(socket)
+
     def isModified(self) -> bool:
         return self.has_been_modified
 
@@ -167,9 +249,9 @@ class QD_Scene(QD_Serializable):
 
     # custom flag to detect node or edge has been selected....
     def resetLastSelectedStates(self):
-        for node in self.nodes:
+        for node in self._nodes:
             node.gfx._last_selected_state = False
-        for edge in self.edges:
+        for edge in self._edges:
             edge.gfx._last_selected_state = False
 
     def getView(self) -> 'QGraphicsView':
@@ -178,29 +260,26 @@ class QD_Scene(QD_Serializable):
     def getItemAt(self, pos: 'QPointF'):
         return self.getView().itemAt(pos)
 
-    def addNode(self, node: QD_OpNode):
-        self.nodes.append(node)
-
-    def addEdge(self, edge: QD_Edge):
-        self.edges.append(edge)
-
     def removeNode(self, node: QD_OpNode):
-        if node in self.nodes:
-            self.nodes.remove(node)
-        else:
-            if utils.DEBUG:
+        if not self.hasNode(node):
+            if confg.DEBUG:
                 print("!W:", "QD_Scene::removeNode", "wanna remove nodeeditor", node, "from self.nodes but it's not in the list!")
+        super().removeNode(node)
 
     def removeEdge(self, edge: QD_Edge):
-        if edge in self.edges:
-            self.edges.remove(edge)
-        else:
+        if not self.hasEdge(edge):
             if confg.DEBUG:
                 print("!W:", "QD_Scene::removeEdge", "wanna remove edge", edge, "from self.edges but it's not in the list!")
+        super().removeEdge(edge)
+
+    def onReachabilityChanged(self, nodes: set):
+        # dead nodes show the invalid icon, see QD_Node.iconIndex
+        for node in nodes:
+            if getattr(node, 'gfx', None) is not None:
+                node.gfx.update()
 
     def clear(self):
-        while len(self.nodes) > 0:
-            self.nodes[0].remove()
+        super().clear()
         self.has_been_modified = False
 
 
@@ -211,39 +290,23 @@ class QD_Scene(QD_Serializable):
         return QD_OpNode if self.node_class_selector is None else self.node_class_selector(data)
 
 
-    def serialize(self) -> dict:
-        nodes, edges = [], []
-        for node in self.nodes: nodes.append(node.serialize())
-        for edge in self.edges: edges.append(edge.serialize())
-        return {
-            'id': self.id,
-            'scene_width': self.scene_width,
-            'scene_height': self.scene_height,
-            'nodes': nodes,
-            'edges': edges,
-        }
-
     def deserialize(self, data: dict, hashmap: dict = {}, restore_id: bool = True) -> bool:
         hashmap = {}
+        data = remapLegacyIds(data)
 
         if restore_id: self.id = data['id']
 
         # -- deserialize NODES
 
         ## Instead of recreating all the nodes, reuse existing ones...
-        # get list of all current nodes:
-        all_nodes = self.nodes.copy()
+        # get all current nodes, used as an ordered set:
+        all_nodes = self._nodes.copy()
 
         # go through deserialized nodes:
         for node_data in data['nodes']:
             # can we find this node in the scene?
-            found = False
-            for node in all_nodes:
-                if node.id == node_data['id']:
-                    found = node
-                    break
-
-            if not found:
+            found = self.getNodeById(node_data['id'])
+            if found not in all_nodes:
                 new_node = self.getNodeClassFromData(node_data)(self)
                 new_node.deserialize(node_data, hashmap, restore_id)
                 new_node.onDeserialized(node_data)
@@ -251,41 +314,34 @@ class QD_Scene(QD_Serializable):
             else:
                 found.deserialize(node_data, hashmap, restore_id)
                 found.onDeserialized(node_data)
-                all_nodes.remove(found)
+                del all_nodes[found]
                 # print("Reused", node_data['title'])
 
         # remove nodes which are left in the scene and were NOT in the serialized data!
         # that means they were not in the graph before...
-        while all_nodes != []:
-            node = all_nodes.pop()
+        for node in all_nodes:
             node.remove()
 
         # -- deserialize EDGES
 
         ## Instead of recreating all the edges, reuse existing ones...
-        # get list of all current edges:
-        all_edges = self.edges.copy()
+        # get all current edges, used as an ordered set:
+        all_edges = self._edges.copy()
 
         # go through deserialized edges:
         for edge_data in data['edges']:
-            # can we find this node in the scene?
-            found = False
-            for edge in all_edges:
-                if edge.id == edge_data['id']:
-                    found = edge
-                    break
-
-            if not found:
+            # can we find this edge in the scene?
+            found = self.getEdgeById(edge_data['id'])
+            if found not in all_edges:
                 new_edge = QD_Edge(self).deserialize(edge_data, hashmap, restore_id)
                 # print("New edge for", edge_data)
             else:
                 found.deserialize(edge_data, hashmap, restore_id)
-                all_edges.remove(found)
+                del all_edges[found]
 
-        # remove nodes which are left in the scene and were NOT in the serialized data!
+        # remove edges which are left in the scene and were NOT in the serialized data!
         # that means they were not in the graph before...
-        while all_edges != []:
-            edge = all_edges.pop()
+        for edge in all_edges:
             edge.remove()
 
         return True
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+A module containing the change log of a scene
+"""
+import weakref
+from collections import deque
+from enum import Enum, unique
+from itertools import islice
+from typing import NamedTuple
+
+
+@unique
+class ChangeType(Enum):
+    NodeAdded = 0
+    NodeRemoved = 1
+    NodeMoved = 2
+    NodeContentChanged = 3
+    EdgeAdded = 4
+    EdgeRemoved = 5
+    EdgeConnected = 6
+    EdgeDisconnected = 7
+    EdgeChanged = 8
+
+    @property
+    def is_node(self) -> bool:
+        return self.value <= ChangeType.NodeContentChanged.value
+
+    @property
+    def is_edge(self) -> bool:
+        return self.value >= ChangeType.EdgeAdded.value
+
+
+class QD_SceneChange(NamedTuple):
+    serial: int
+    type: ChangeType
+    ref: weakref.ref
+
+    @property
+    def obj(self):
+        """The changed node or edge, ``None`` if it has been freed since"""
+        return self.ref()
+
+
+class QD_SceneChangeLog():
+    """Append-only stream of typed scene mutations
+
+    Every change gets the next serial number, which is also stored as ``version`` of the changed node or edge,
+    so versions of an object only grow and ``obj.version > serial`` tells that it changed after ``serial``.
+
+    Listeners are called synchronously for every change. Consumers which poll instead keep the last serial
+    they have seen and call :meth:`changesSince`, only the last ``maxLength`` changes are kept.
+    The log refers to objects weakly and doesn't keep removed nodes and edges alive.
+
+    ``NodeContentChanged`` covers sockets, id and any data written by ``serialize()``, content widgets report
+    edits through ``QD_Node.onContentChanged``. ``EdgeChanged`` covers edge type and id. ``EdgeDisconnected`` is logged while the edge still refers to both its sockets.
+    """
+
+    def __init__(self, maxLength: int = 10000):
+        self.serial = 0
+        self._changes = deque(maxlen=maxLength)
+        self._listeners = []
+
+    def addListener(self, callback: 'function'):
+        self._listeners.append(callback)
+
+    def removeListener(self, callback: 'function'):
+        self._listeners.remove(callback)
+
+    def append(self, changeType: ChangeType, obj) -> QD_SceneChange:
+        self.serial += 1
+        obj.version = self.serial
+
+        change = QD_SceneChange(self.serial, changeType, weakref.ref(obj))
+        self._changes.append(change)
+
+        for callback in self._listeners:
+            callback(change)
+        return change
+
+    def changesSince(self, serial: int) -> [list, None]:
+        """Returns changes with serial above ``serial`` in order, ``None`` if some of them have been dropped already"""
+        if serial >= self.serial:
+            return []
+
+        if not self._changes or self._changes[0].serial > serial + 1:
+            return None
+        return list(islice(self._changes, serial + 1 - self._changes[0].serial, None))
@@ -79,9 +79,8 @@ class QD_SceneClipboard():
 
         # if CUT (aka delete) remove selected items
         if delete:
-            self.scene.getView().deleteSelected()
-            # store our history
-            self.scene.history.storeHistory("Cut out elements from scene", setModified=True)
+            with self.scene.transaction("Cut out elements from scene"):
+                self.scene.getView().deleteSelected()
 
         return data
 
@@ -126,40 +125,37 @@ class QD_SceneClipboard():
         # create each node
         created_nodes = []
 
-        self.scene.setSilentSelectionEvents()
+        # selection events, history and repaint happen once for the whole paste
+        with self.scene.transaction("Pasted elements in scene"):
+            self.scene.doDeselectItems()
 
-        self.scene.doDeselectItems()
+            for node_data in data['nodes']:
+                new_node = self.scene.getNodeClassFromData(node_data)(self.scene)
+                new_node.deserialize(node_data, hashmap, restore_id=False)
+                created_nodes.append(new_node)
 
-        for node_data in data['nodes']:
-            new_node = self.scene.getNodeClassFromData(node_data)(self.scene)
-            new_node.deserialize(node_data, hashmap, restore_id=False)
-            created_nodes.append(new_node)
-
-            # readjust the new nodeeditor's position
-
-            # new node's current position
-            posx, posy = new_node.pos.x(), new_node.pos.y()
-            newx, newy = mousex + posx - minx, mousey + posy - miny
+                # readjust the new nodeeditor's position
 
-            new_node.setPos(newx, newy)
+                # new node's current position
+                posx, posy = new_node.pos.x(), new_node.pos.y()
+                newx, newy = mousex + posx - minx, mousey + posy - miny
 
-            new_node.doSelect()
+                new_node.setPos(newx, newy)
 
-            if confg.DEBUG:
-                print("** PASTA SUM:")
-                print("\tMouse pos:", mousex, mousey)
-                print("\tnew node pos:", posx, posy)
-                print("\tFINAL:", newx, newy)
+                new_node.doSelect()
 
-        # create each edge
-        if 'edges' in data:
-            for edge_data in data['edges']:
-                new_edge = QD_Edge(self.scene)
-                new_edge.deserialize(edge_data, hashmap, restore_id=False)
-
-        self.scene.setSilentSelectionEvents(False)
-
-        # store history
-        self.scene.history.storeHistory("Pasted elements in scene", setModified=True)
+                if confg.DEBUG:
+                    print("** PASTA SUM:")
+                    print("\tMouse pos:", mousex, mousey)
+                    print("\tnew node pos:", posx, posy)
+                    print("\tFINAL:", newx, newy)
+
+            # create each edge
+            if 'edges' in data:
+                for edge_data in data['edges']:
+                    new_edge = QD_Edge(self.scene)
+                    new_edge.deserialize(edge_data, hashmap, restore_id=False)
+
+            self.scene.history.storeHistory("Pasted elements in scene", setModified=True)
 
         return created_nodes
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+A module containing the incremental connected-component tracking of a scene
+"""
+from collections import deque
+
+from qdsockettype import SocketType
+
+
+class QD_SceneComponent():
+    """One connected component of the scene graph, pulse edges are not counted as connections
+
+    :Instance Attributes:
+
+    - **nodes** - set of all nodes in this component
+    - **roots** - set of nodes which have no input edge connected
+    - **enterNodes** - set of ``StateNode_enter`` nodes in this component
+    - **exitNodes** - set of ``StateNode_exit`` nodes in this component
+
+    These sets are owned by :class:`QD_SceneComponents` and must not be modified by callers
+    """
+
+    def __init__(self):
+        self.nodes = set()
+        self.roots = set()
+        self.enterNodes = set()
+        self.exitNodes = set()
+
+    @property
+    def enterNode(self) -> 'QD_Node':
+        """Any enter node of this component or ``None``, a valid quest graph has at most one"""
+        return next(iter(self.enterNodes), None)
+
+    @property
+    def exitNode(self) -> 'QD_Node':
+        """Any exit node of this component or ``None``, a valid quest graph has at most one"""
+        return next(iter(self.exitNodes), None)
+
+
+class QD_SceneComponents():
+    """Tracks connected components of the scene graph as nodes and edges get added and removed
+
+    Two nodes are in the same component if they are linked by non-pulse edges, ignoring edge direction,
+    this is the same relation as ``QD_Node.findNodes(True, ...)``. Connecting merges the smaller
+    component into the larger one, disconnecting searches from both ends at the same time and stops
+    as soon as the smaller side is exhausted, so each update only touches the smaller component.
+    """
+
+    def __init__(self, scene: 'QD_Scene'):
+        """
+        :param scene: Reference to the :class:`scene.QD_Scene`
+        :type scene: :class:`scene.QD_Scene`
+        """
+        self.scene = scene
+        self.clear()
+
+    def clear(self):
+        self._componentOf = {}
+        self._inputCount = {}
+
+    def componentOf(self, node: 'QD_Node') -> QD_SceneComponent:
+        return self._componentOf[node]
+
+    def rootsOf(self, node: 'QD_Node') -> set:
+        return self._componentOf[node].roots
+
+    def enterNodeOf(self, node: 'QD_Node') -> 'QD_Node':
+        return self._componentOf[node].enterNode
+
+    def exitNodeOf(self, node: 'QD_Node') -> 'QD_Node':
+        return self._componentOf[node].exitNode
+
+    def enterNodesOf(self, node: 'QD_Node') -> set:
+        return self._componentOf[node].enterNodes
+
+    def exitNodesOf(self, node: 'QD_Node') -> set:
+        return self._componentOf[node].exitNodes
+
+    def sameComponent(self, node1: 'QD_Node', node2: 'QD_Node') -> bool:
+        return self._componentOf[node1] is self._componentOf[node2]
+
+    def components(self) -> list:
+        """Returns list of all distinct components"""
+        return list({id(component): component for component in self._componentOf.values()}.values())
+
+    @staticmethod
+    def isEnterNode(node: 'QD_Node') -> bool:
+        return node.typeName == 'StateNode_enter'
+
+    @staticmethod
+    def isExitNode(node: 'QD_Node') -> bool:
+        return node.typeName == 'StateNode_exit'
+
+    @staticmethod
+    def isTrackedEdge(edge: 'QD_Edge') -> bool:
+        """Only fully connected non-pulse edges link components"""
+        return edge.isConnected() and not edge.start_socket.type.is_pulse
+
+    def addNode(self, node: 'QD_Node'):
+        component = QD_SceneComponent()
+        self._addToComponent(component, node)
+        self._componentOf[node] = component
+        self._inputCount[node] = 0
+
+    def removeNode(self, node: 'QD_Node'):
+        component = self._componentOf.pop(node, None)
+        if component is not None:
+            component.nodes.discard(node)
+            component.roots.discard(node)
+            component.enterNodes.discard(node)
+            component.exitNodes.discard(node)
+        self._inputCount.pop(node, None)
+
+    def onEdgeConnected(self, edge: 'QD_Edge'):
+        if not self.isTrackedEdge(edge):
+            return
+
+        node1, node2 = edge.start_socket.node, edge.end_socket.node
+        if node1 not in self._componentOf or node2 not in self._componentOf:
+            return
+
+        for socket in (edge.start_socket, edge.end_socket):
+            if socket.type is SocketType.In:
+                self._inputCount[socket.node] += 1
+                self._componentOf[socket.node].roots.discard(socket.node)
+
+        component1, component2 = self._componentOf[node1], self._componentOf[node2]
+        if component1 is component2:
+            return
+
+        if len(component1.nodes) < len(component2.nodes):
+            component1, component2 = component2, component1
+
+        for node in component2.nodes:
+            self._componentOf[node] = component1
+
+        component1.nodes |= component2.nodes
+        component1.roots |= component2.roots
+        component1.enterNodes |= component2.enterNodes
+        component1.exitNodes |= component2.exitNodes
+
+    def onEdgeDisconnected(self, edge: 'QD_Edge'):
+        """Called while ``edge`` still refers to both its sockets, the edge itself is ignored from now on"""
+        if not self.isTrackedEdge(edge):
+            return
+
+        node1, node2 = edge.start_socket.node, edge.end_socket.node
+        if node1 not in self._componentOf or node2 not in self._componentOf:
+            return
+
+        for socket in (edge.start_socket, edge.end_socket):
+            if socket.type is SocketType.In:
+                self._inputCount[socket.node] -= 1
+                if self._inputCount[socket.node] == 0:
+                    self._componentOf[socket.node].roots.add(socket.node)
+
+        splitNodes = self._findSplit(node1, node2, edge)
+        if splitNodes is None:
+            return
+
+        oldComponent = self._componentOf[node1]
+        newComponent = QD_SceneComponent()
+
+        for node in splitNodes:
+            oldComponent.nodes.discard(node)
+            oldComponent.roots.discard(node)
+            oldComponent.enterNodes.discard(node)
+            oldComponent.exitNodes.discard(node)
+
+            self._addToComponent(newComponent, node)
+            self._componentOf[node] = newComponent
+
+    def _addToComponent(self, component: QD_SceneComponent, node: 'QD_Node'):
+        component.nodes.add(node)
+        if self._inputCount.get(node, 0) == 0:
+            component.roots.add(node)
+        if self.isEnterNode(node):
+            component.enterNodes.add(node)
+        if self.isExitNode(node):
+            component.exitNodes.add(node)
+
+    def _neighbors(self, node: 'QD_Node', ignoredEdge: 'QD_Edge'):
+        for socket in node.sockets:
+            if socket.type.is_pulse:
+                continue
+
+            for edge in socket.edges:
+                if edge is ignoredEdge:
+                    continue
+
+                otherSocket = edge.getOtherSocket(socket)
+                if otherSocket is not None and otherSocket.node in self._componentOf:
+                    yield otherSocket.node
+
+    def _findSplit(self, node1: 'QD_Node', node2: 'QD_Node', ignoredEdge: 'QD_Edge') -> [set, None]:
+        """Returns nodes of the smaller side if removing ``ignoredEdge`` splits the component, otherwise ``None``"""
+        if node1 is node2:
+            return None
+
+        seen1, seen2 = {node1}, {node2}
+        queue1, queue2 = deque([node1]), deque([node2])
+
+        def expand(queue, seen, otherSeen) -> bool:
+            for neighbor in self._neighbors(queue.popleft(), ignoredEdge):
+                if neighbor in otherSeen:
+                    return True
+
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    queue.append(neighbor)
+            return False
+
+        while True:
+            if not queue1:
+                return seen1
+
+            if expand(queue1, seen1, seen2):
+                return None
+
+            if not queue2:
+                return seen2
+
+            if expand(queue2, seen2, seen1):
+                return None
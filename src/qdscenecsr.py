@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+A module exporting the graph of a scene or a saved quest as NumPy CSR arrays
+
+Only this module needs NumPy, the editor itself runs without it.
+"""
+import json
+
+import numpy as np
+
+from qdidallocator import remapLegacyIds
+from qdsockettype import SocketType
+
+
+class QD_SceneCSR():
+    """Adjacency of a scene in compressed sparse row form, nodes are numbered ``0..nodeCount-1`` in id order
+
+    Every connected edge points from the node of its output socket to the node of its input socket, like
+    :meth:`qdnode.QD_Node.getChildrenNodes`. Out-edges of node ``i`` are ``indptr[i]:indptr[i + 1]``,
+    in id order. Edges missing one of their sockets are left out. Ids are allocated in creation order, so the
+    same scene exports the same arrays whether it comes from a live scene or from its saved data.
+
+    :Instance Attributes:
+
+    - **nodeIds** - ``int64[nodeCount]`` id of each node
+    - **nodeTypes** - ``int32[nodeCount]`` code of each node type, see **typeCodes**
+    - **typeCodes** - dict of node type name to its code, ``None`` for nodes without type is a name too
+    - **indptr** - ``int64[nodeCount + 1]`` offsets of the out-edges of each node
+    - **indices** - ``int32[edgeCount]`` target node of each edge
+    - **edgeIds** - ``int64[edgeCount]`` id of each edge
+    - **edgeLabels** - ``int16[edgeCount]`` :class:`qdsockettype.SocketType` value of the output socket of each edge
+    - **pulseMask** - ``bool[edgeCount]`` ``True`` for edges between pulse sockets
+    - **graphOffsets** - ``int64[graphCount + 1]`` first node of each quest, see :meth:`concatenate`
+
+    Pass the same ``typeCodes`` dict when exporting many quests and codes are comparable between them,
+    new type names get added to it.
+    """
+
+    def __init__(self, nodes: list, edges: list, typeCodes: dict = None):
+        """
+        :param nodes: ``(id, typeName, sockets)`` of each node, ``sockets`` are ``(id, type)`` pairs
+        :param edges: ``(id, startSocketId, endSocketId)`` of each edge
+        :param typeCodes: node type name to code, extended with names not in it yet
+        """
+        self.typeCodes = {} if typeCodes is None else typeCodes
+
+        nodeCount = len(nodes)
+        self.nodeIds = np.empty(nodeCount, dtype=np.int64)
+        self.nodeTypes = np.empty(nodeCount, dtype=np.int32)
+
+        # socket id -> (node index, socket type)
+        socketNodes = {}
+        for index, (nodeId, typeName, sockets) in enumerate(sorted(nodes)):
+            self.nodeIds[index] = nodeId
+            self.nodeTypes[index] = self.typeCodes.setdefault(typeName, len(self.typeCodes))
+            for sockId, socktype in sockets:
+                socketNodes[sockId] = (index, SocketType(socktype))
+
+        sources, targets, edgeIds, labels = [], [], [], []
+        for edgeId, start, end in sorted(edges):
+            if start not in socketNodes or end not in socketNodes:
+                continue
+
+            (startIndex, startType), (endIndex, endType) = socketNodes[start], socketNodes[end]
+            if startType.is_in:
+                startIndex, startType, endIndex = endIndex, endType, startIndex
+
+            sources.append(startIndex)
+            targets.append(endIndex)
+            edgeIds.append(edgeId)
+            labels.append(startType)
+
+        # stable sort keeps edges of one node in id order
+        order = np.argsort(np.asarray(sources, dtype=np.int32), kind='stable')
+        self.indices = np.asarray(targets, dtype=np.int32)[order]
+        self.edgeIds = np.asarray(edgeIds, dtype=np.int64)[order]
+        self.edgeLabels = np.asarray(labels, dtype=np.int16)[order]
+        self.pulseMask = self.edgeLabels == SocketType.PulseOut
+
+        self.indptr = np.zeros(nodeCount + 1, dtype=np.int64)
+        np.cumsum(np.bincount(np.asarray(sources, dtype=np.int32), minlength=nodeCount), out=self.indptr[1:])
+
+        self.graphOffsets = np.array([0, nodeCount], dtype=np.int64)
+
+    @classmethod
+    def concatenate(cls, graphs: list) -> 'QD_SceneCSR':
+        """
+        Joins exported quests into one graph without edges between them, so one vectorized call covers all of them
+
+        Node indices of graph ``k`` start at ``graphOffsets[k]``. All graphs must have been exported with the
+        same ``typeCodes`` dict.
+        """
+        if any(graph.typeCodes is not graphs[0].typeCodes for graph in graphs):
+            raise ValueError('graphs are exported with different typeCodes')
+
+        result = cls.__new__(cls)
+        result.typeCodes = graphs[0].typeCodes
+
+        nodeOffsets = np.cumsum([0] + [graph.nodeCount for graph in graphs])
+        edgeOffsets = np.cumsum([0] + [graph.edgeCount for graph in graphs])
+
+        result.nodeIds = np.concatenate([graph.nodeIds for graph in graphs])
+        result.nodeTypes = np.concatenate([graph.nodeTypes for graph in graphs])
+        result.indices = np.concatenate([graph.indices + offset for graph, offset in zip(graphs, nodeOffsets)]).astype(np.int32)
+        result.edgeIds = np.concatenate([graph.edgeIds for graph in graphs])
+        result.edgeLabels = np.concatenate([graph.edgeLabels for graph in graphs])
+        result.pulseMask = np.concatenate([graph.pulseMask for graph in graphs])
+        result.indptr = np.concatenate([[0]] + [graph.indptr[1:] + offset for graph, offset in zip(graphs, edgeOffsets)]).astype(np.int64)
+        result.graphOffsets = np.concatenate([graph.graphOffsets[:-1] + offset for graph, offset in zip(graphs, nodeOffsets)] + [nodeOffsets[-1:]]).astype(np.int64)
+        return result
+
+    @classmethod
+    def fromSnapshot(cls, snapshot: 'QD_SceneSnapshot', typeCodes: dict = None) -> 'QD_SceneCSR':
+        return cls(
+                [(node.id, node.typeName, node.sockets) for node in snapshot.nodes.values()],
+                [(edge.id, edge.start, edge.end) for edge in snapshot.edges.values()],
+                typeCodes)
+
+    @classmethod
+    def fromScene(cls, scene: 'QD_ModelScene', typeCodes: dict = None) -> 'QD_SceneCSR':
+        """Exports a :class:`qdmodel.QD_ModelScene` or an editor scene, see :meth:`qdmodel.QD_ModelScene.takeSnapshot`"""
+        return cls.fromSnapshot(scene.takeSnapshot(), typeCodes)
+
+    @classmethod
+    def fromData(cls, data: dict, typeCodes: dict = None) -> 'QD_SceneCSR':
+        """Exports serialized scene ``data`` without creating any node objects"""
+        data = remapLegacyIds(data)
+        return cls(
+                [(node['id'], node.get('type'), [(sock['id'], sock['type']) for sock in node['sockets']]) for node in data['nodes']],
+                [(edge['id'], edge['start'], edge['end']) for edge in data['edges']],
+                typeCodes)
+
+    @classmethod
+    def fromFile(cls, filename: str, typeCodes: dict = None) -> 'QD_SceneCSR':
+        """Exports the scene of a saved quest file"""
+        with open(filename, "r", encoding='utf-8') as f:
+            return cls.fromData(json.load(f)['scene'], typeCodes)
+
+    @property
+    def nodeCount(self) -> int:
+        return len(self.nodeIds)
+
+    @property
+    def edgeCount(self) -> int:
+        return len(self.indices)
+
+    @property
+    def graphCount(self) -> int:
+        return len(self.graphOffsets) - 1
+
+    @property
+    def nodeGraphs(self) -> np.ndarray:
+        """``int32[nodeCount]`` quest of each node"""
+        return np.repeat(np.arange(self.graphCount, dtype=np.int32), np.diff(self.graphOffsets))
+
+    @property
+    def edgeSources(self) -> np.ndarray:
+        """``int32[edgeCount]`` source node of each edge"""
+        return np.repeat(np.arange(self.nodeCount, dtype=np.int32), np.diff(self.indptr))
+
+    def typeCode(self, typeName: str) -> int:
+        """Code of ``typeName``, ``-1`` if no exported node has this type"""
+        return self.typeCodes.get(typeName, -1)
+
+    def edgeMask(self, ignorePulseEdge: bool = False) -> np.ndarray:
+        return ~self.pulseMask if ignorePulseEdge else np.ones(self.edgeCount, dtype=bool)
+
+    def outDegrees(self, ignorePulseEdge: bool = False) -> np.ndarray:
+        return np.bincount(self.edgeSources[self.edgeMask(ignorePulseEdge)], minlength=self.nodeCount)
+
+    def inDegrees(self, ignorePulseEdge: bool = False) -> np.ndarray:
+        return np.bincount(self.indices[self.edgeMask(ignorePulseEdge)], minlength=self.nodeCount)
+
+    def rootMask(self, ignorePulseEdge: bool = True) -> np.ndarray:
+        """``True`` for nodes without incoming edges"""
+        return self.inDegrees(ignorePulseEdge) == 0
+
+    def reachable(self, sources, ignorePulseEdge: bool = False) -> np.ndarray:
+        """
+        Returns ``bool[nodeCount]``, ``True`` for nodes reachable from ``sources`` including the sources themselves
+
+        :param sources: node indices or a ``bool[nodeCount]`` mask
+        """
+        visited = np.zeros(self.nodeCount, dtype=bool)
+        visited[sources] = True
+        mask = None if not ignorePulseEdge else ~self.pulseMask
+
+        # level by level, each level only reads the out-edges of the nodes reached by the previous one
+        frontier = np.flatnonzero(visited)
+        while frontier.size:
+            starts = self.indptr[frontier]
+            counts = self.indptr[frontier + 1] - starts
+            ends = np.cumsum(counts)
+
+            positions = np.repeat(starts - ends + counts, counts) + np.arange(ends[-1])
+            if mask is not None:
+                positions = positions[mask[positions]]
+
+            frontier = np.unique(self.indices[positions])
+            frontier = frontier[~visited[frontier]]
+            visited[frontier] = True
+        return visited
+
+    def componentLabels(self, ignorePulseEdge: bool = False) -> np.ndarray:
+        """Returns ``int32[nodeCount]``, nodes of one weakly connected component share the smallest index among them"""
+        labels = np.arange(self.nodeCount, dtype=np.int32)
+
+        mask = self.edgeMask(ignorePulseEdge)
+        edgeSources, indices = self.edgeSources[mask], self.indices[mask]
+
+        while True:
+            oldLabels = labels.copy()
+
+            # hook both ends of every edge to the smaller label, then jump to the root labels
+            edgeLabels = np.minimum(labels[edgeSources], labels[indices])
+            np.minimum.at(labels, edgeSources, edgeLabels)
+            np.minimum.at(labels, indices, edgeLabels)
+            np.minimum.at(labels, oldLabels, labels)
+            labels = labels[labels]
+
+            if np.array_equal(labels, oldLabels):
+                return labels
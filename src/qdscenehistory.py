@@ -131,7 +131,13 @@ class QD_SceneHistory():
 
         - `History Modified`
         - `History Stored`
+
+        Inside :meth:`scene.QD_Scene.transaction` only one stamp gets stored when the transaction ends
         """
+        if self.scene.activeTransaction is not None:
+            self.scene.activeTransaction.storeHistory(desc, setModified)
+            return
+
         if setModified:
             self.scene.has_been_modified = True
 
@@ -222,10 +228,9 @@ class QD_SceneHistory():
 
             # now restore selected edges from history_stamp
             for edge_id in history_stamp['selection']['edges']:
-                for edge in self.scene.edges:
-                    if edge.id == edge_id:
-                        edge.gfx.setSelected(True)
-                        break
+                edge = self.scene.getEdgeById(edge_id)
+                if edge is not None:
+                    edge.gfx.setSelected(True)
 
             # first clear all selection on nodes
             for node in self.scene.nodes:
@@ -233,10 +238,9 @@ class QD_SceneHistory():
 
             # now restore selected nodes from history_stamp
             for node_id in history_stamp['selection']['nodes']:
-                for node in self.scene.nodes:
-                    if node.id == node_id:
-                        node.gfx.setSelected(True)
-                        break
+                node = self.scene.getNodeById(node_id)
+                if node is not None:
+                    node.gfx.setSelected(True)
 
             current_selection = self.captureCurrentSelection()
             if confg.DEBUG:
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+A module containing the incremental reachability analysis of a scene
+"""
+import heapq
+from collections import deque
+
+
+class QD_SceneReachability():
+    """Keeps track of which nodes are reachable from an enter node and which can reach an exit node
+
+    Edges count from output socket to input socket, pulse edges included. A node is dead if the scene has enter
+    nodes and none of them reaches it, or if the scene has exit nodes and it reaches none of them. Scenes without
+    enter and exit nodes, like the ones inside state nodes, have no dead nodes.
+
+    Every reached node keeps its distance in edges from the nearest enter node, and to the nearest exit node.
+    Adding an edge only walks the nodes it brings closer. Removing one only walks the nodes which lost all their
+    neighbours one step closer, others keep their distance: most edges of a quest graph have siblings or are
+    not on a shortest path, so most removals stop right away. The scene hears about nodes changing their state
+    through ``onReachabilityChanged``.
+    """
+
+    def __init__(self, scene: 'QD_Scene'):
+        """
+        :param scene: Reference to the :class:`scene.QD_Scene`
+        :type scene: :class:`scene.QD_Scene`
+        """
+        self.scene = scene
+        self.clear()
+
+    def clear(self):
+        # node -> {node: number of edges}, parallel edges between two nodes are counted
+        self._succ = {}
+        self._pred = {}
+
+        # edge -> (fromNode, toNode)
+        self._edgeEnds = {}
+
+        self._enterNodes = set()
+        self._exitNodes = set()
+
+        # node reachable from some enter node -> distance from the nearest one, same for reaching exit nodes
+        self._forward = {}
+        self._backward = {}
+
+    def isReachable(self, node: 'QD_Node') -> bool:
+        """``True`` if some enter node reaches ``node``, enter nodes reach themselves"""
+        return node in self._forward
+
+    def canFinish(self, node: 'QD_Node') -> bool:
+        """``True`` if ``node`` reaches some exit node, exit nodes reach themselves"""
+        return node in self._backward
+
+    def isDead(self, node: 'QD_Node') -> bool:
+        return bool(self._enterNodes) and node not in self._forward or bool(self._exitNodes) and node not in self._backward
+
+    def deadNodes(self) -> list:
+        return [node for node in self._succ if self.isDead(node)]
+
+    @staticmethod
+    def isEnterNode(node: 'QD_Node') -> bool:
+        return node.typeName == 'StateNode_enter'
+
+    @staticmethod
+    def isExitNode(node: 'QD_Node') -> bool:
+        return node.typeName == 'StateNode_exit'
+
+    @staticmethod
+    def edgeEnds(edge: 'QD_Edge') -> [tuple, None]:
+        """Returns ``(fromNode, toNode)`` of a connected edge, pulse edges included, ``None`` for others"""
+        if not edge.isConnected():
+            return None
+
+        if edge.start_socket.is_output:
+            return edge.start_socket.node, edge.end_socket.node
+        return edge.end_socket.node, edge.start_socket.node
+
+    def addNode(self, node: 'QD_Node'):
+        self._succ[node] = {}
+        self._pred[node] = {}
+
+        changed = set()
+        if self.isEnterNode(node):
+            changed |= self._addSource(node, self._enterNodes, self._forward, self._succ)
+        if self.isExitNode(node):
+            changed |= self._addSource(node, self._exitNodes, self._backward, self._pred)
+        self._notify(changed)
+
+    def removeNode(self, node: 'QD_Node'):
+        if node not in self._succ:
+            return
+
+        # nodes remove their edges first, this only happens if the scene drops a node on its own
+        if self._succ[node] or self._pred[node]:
+            for edge in [edge for edge, ends in self._edgeEnds.items() if node in ends]:
+                self.onEdgeDisconnected(edge)
+
+        changed = set()
+        if node in self._enterNodes:
+            changed |= self._removeSource(node, self._enterNodes, self._forward, self._succ, self._pred)
+        if node in self._exitNodes:
+            changed |= self._removeSource(node, self._exitNodes, self._backward, self._pred, self._succ)
+
+        del self._succ[node]
+        del self._pred[node]
+        self._forward.pop(node, None)
+        self._backward.pop(node, None)
+
+        changed.discard(node)
+        self._notify(changed)
+
+    def onEdgeConnected(self, edge: 'QD_Edge'):
+        ends = self.edgeEnds(edge)
+        if ends is None or ends[0] not in self._succ or ends[1] not in self._succ:
+            return
+
+        fromNode, toNode = ends
+        self._edgeEnds[edge] = ends
+
+        count = self._succ[fromNode].get(toNode, 0)
+        self._succ[fromNode][toNode] = count + 1
+        self._pred[toNode][fromNode] = count + 1
+        if count > 0:
+            return
+
+        changed = set()
+        if fromNode in self._forward:
+            changed |= self._extend(toNode, self._forward[fromNode] + 1, self._forward, self._succ)
+        if toNode in self._backward:
+            changed |= self._extend(fromNode, self._backward[toNode] + 1, self._backward, self._pred)
+        self._notify(changed)
+
+    def onEdgeDisconnected(self, edge: 'QD_Edge'):
+        """Called while ``edge`` still refers to both its sockets, the edge itself is ignored from now on"""
+        ends = self._edgeEnds.pop(edge, None)
+        if ends is None:
+            return
+
+        fromNode, toNode = ends
+        count = self._succ[fromNode][toNode] - 1
+        if count > 0:
+            self._succ[fromNode][toNode] = count
+            self._pred[toNode][fromNode] = count
+            return
+
+        del self._succ[fromNode][toNode]
+        del self._pred[toNode][fromNode]
+
+        changed = set()
+        if fromNode in self._forward and toNode not in self._enterNodes:
+            changed |= self._retract(toNode, self._forward, self._succ, self._pred)
+        if toNode in self._backward and fromNode not in self._exitNodes:
+            changed |= self._retract(fromNode, self._backward, self._pred, self._succ)
+        self._notify(changed)
+
+    def _addSource(self, node: 'QD_Node', sources: set, reached: dict, links: dict) -> set:
+        # the first enter or exit node turns all nodes it doesn't reach dead
+        changed = set(self._succ) if not sources else set()
+        sources.add(node)
+        return changed | self._extend(node, 0, reached, links)
+
+    def _removeSource(self, node: 'QD_Node', sources: set, reached: dict, links: dict, inverse: dict) -> set:
+        sources.discard(node)
+        changed = self._retract(node, reached, links, inverse)
+
+        # without enter or exit nodes left, nothing is dead for lack of them
+        return (changed | set(self._succ)) if not sources else changed
+
+    @staticmethod
+    def _extend(start: 'QD_Node', distance: int, reached: dict, links: dict) -> set:
+        """Brings ``start`` to ``distance`` and everything it links to closer, returns the nodes newly reached"""
+        added = set()
+        queue = deque([(start, distance)])
+        while queue:
+            node, distance = queue.popleft()
+            if reached.get(node, distance + 1) <= distance:
+                continue
+
+            if node not in reached:
+                added.add(node)
+
+            reached[node] = distance
+            for other in links[node]:
+                if reached.get(other, distance + 2) > distance + 1:
+                    queue.append((other, distance + 1))
+        return added
+
+    @staticmethod
+    def _retract(start: 'QD_Node', reached: dict, links: dict, inverse: dict) -> set:
+        """Called after ``start`` lost a link from a closer node, returns the nodes no longer reached"""
+        # nodes left without any link from a node one step closer, level by level so a node is only checked once
+        # all nodes closer than it are settled
+        lost = set()
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            if node in lost or node not in reached:
+                continue
+
+            distance = reached[node]
+            if any(other not in lost and reached.get(other) == distance - 1 for other in inverse[node]):
+                continue
+
+            lost.add(node)
+            queue.extend(other for other in links[node] if reached.get(other) == distance + 1)
+
+        if not lost:
+            return set()
+
+        for node in lost:
+            del reached[node]
+
+        # lost nodes linked from a node still reached get their new distance, nearest first
+        heap = []
+        for node in lost:
+            distances = [reached[other] for other in inverse[node] if other in reached]
+            if distances:
+                heapq.heappush(heap, (min(distances) + 1, id(node), node))
+
+        while heap:
+            distance, _, node = heapq.heappop(heap)
+            if node in reached:
+                continue
+
+            reached[node] = distance
+            for other in links[node]:
+                if other in lost and other not in reached:
+                    heapq.heappush(heap, (distance + 1, id(other), other))
+        return {node for node in lost if node not in reached}
+
+    def _notify(self, nodes: set):
+        if nodes:
+            self.scene.onReachabilityChanged(nodes)
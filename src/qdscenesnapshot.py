@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+A module containing immutable scene snapshots which can be handed over to worker threads
+"""
+from types import MappingProxyType
+from typing import NamedTuple
+
+from qdscenechanges import ChangeType
+from qdsockettype import SocketType
+
+
+def freeze(value):
+    """Returns an immutable copy of serialized data, dicts become read-only mappings and lists tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class QD_SocketRecord(NamedTuple):
+    id: int
+    type: SocketType
+
+
+class QD_NodeRecord(NamedTuple):
+    id: int
+    typeName: str
+    position: tuple
+    sockets: tuple
+
+    # everything else ``serialize()`` writes: title, content, widget, state config..., frozen by :func:`freeze`
+    data: MappingProxyType
+
+
+class QD_EdgeRecord(NamedTuple):
+    id: int
+    edgeType: int
+    start: int
+    end: int
+
+
+class QD_SceneSnapshot():
+    """Immutable view of the scene graph at the time :meth:`QD_SceneSnapshotter.take` was called
+
+    :Instance Attributes:
+
+    - **serial** - increases by one with every snapshot taken from the same scene
+    - **nodes** - read-only mapping of node id to :class:`QD_NodeRecord`, ``data`` holds the node attributes
+    - **edges** - read-only mapping of edge id to :class:`QD_EdgeRecord`, ``start``/``end`` are socket ids
+
+    Records are tuples and never change, records of objects which didn't change are the same objects in
+    successive snapshots, so ``record is oldRecord`` tells that nothing changed.
+    """
+
+    __slots__ = ('serial', 'nodes', 'edges', '_socketNodes')
+
+    def __init__(self, serial: int, nodes: dict, edges: dict):
+        self.serial = serial
+        self.nodes = MappingProxyType(nodes)
+        self.edges = MappingProxyType(edges)
+        self._socketNodes = None
+
+    def socketNode(self, socketId: int) -> [QD_NodeRecord, None]:
+        """Returns record of the node owning ``socketId``, the lookup table is built on first use"""
+        if self._socketNodes is None:
+            # racing threads build equal tables, the last assignment wins
+            self._socketNodes = {socket.id: node for node in self.nodes.values() for socket in node.sockets}
+        return self._socketNodes.get(socketId)
+
+
+class QD_SceneSnapshotter():
+    """Takes snapshots of a scene, only objects changed since the previous snapshot are read again
+
+    Must be used from the thread owning the scene, the snapshots it returns can be used from any thread.
+    Changed objects are picked up from the scene's change log, starting with the first snapshot taken.
+    Node attributes are serialized again on ``NodeContentChanged`` only, moved nodes keep them.
+    """
+
+    def __init__(self, scene: 'QD_ModelScene'):
+        """
+        :param scene: Reference to the :class:`qdmodel.QD_ModelScene`
+        :type scene: :class:`qdmodel.QD_ModelScene`
+        """
+        self.scene = scene
+        self._tracking = False
+        self.clear()
+
+    def clear(self):
+        self._serial = 0
+
+        # live object -> its current record, and record id -> record in scene order
+        self._nodeRecords = {}
+        self._edgeRecords = {}
+        self._nodesById = {}
+        self._edgesById = {}
+
+        self._dirtyNodes = set()
+        self._dirtyEdges = set()
+
+        # dirty nodes whose attributes have to be serialized again, the others only moved
+        self._dirtyContents = set()
+
+    def markAllChanged(self):
+        """Makes the next snapshot read every node and edge again"""
+        self._dirtyNodes.update(self.scene.nodes)
+        self._dirtyContents.update(self.scene.nodes)
+        self._dirtyEdges.update(self.scene.edges)
+
+    def onSceneChange(self, change: 'QD_SceneChange'):
+        if change.type.is_node:
+            self._dirtyNodes.add(change.obj)
+            if change.type is not ChangeType.NodeMoved:
+                self._dirtyContents.add(change.obj)
+        else:
+            self._dirtyEdges.add(change.obj)
+
+    def take(self) -> QD_SceneSnapshot:
+        if not self._tracking:
+            # nothing is recorded until snapshots are used, so scenes without readers don't hold on to changed objects
+            self._tracking = True
+            self.scene.changes.addListener(self.onSceneChange)
+            self.markAllChanged()
+
+        if self._dirtyNodes:
+            makeRecord = lambda node, oldRecord: self.makeNodeRecord(node, None if node in self._dirtyContents or oldRecord is None else oldRecord.data)
+            self._update(self._dirtyNodes, self._nodeRecords, self._nodesById, self.scene.hasNode, makeRecord)
+            self._dirtyNodes = set()
+            self._dirtyContents = set()
+
+        if self._dirtyEdges:
+            self._update(self._dirtyEdges, self._edgeRecords, self._edgesById, self.scene.hasEdge, self.makeEdgeRecord)
+            self._dirtyEdges = set()
+
+        self._serial += 1
+        return QD_SceneSnapshot(self._serial, self._nodesById.copy(), self._edgesById.copy())
+
+    @staticmethod
+    def _update(dirtyObjects: set, records: dict, recordsById: dict, isAlive, makeRecord):
+        for obj in dirtyObjects:
+            oldRecord = records.pop(obj, None)
+            newRecord = makeRecord(obj, oldRecord) if isAlive(obj) else None
+
+            if oldRecord is not None and (newRecord is None or oldRecord.id != newRecord.id):
+                if recordsById.get(oldRecord.id) is oldRecord:
+                    del recordsById[oldRecord.id]
+
+            if newRecord is not None:
+                if newRecord == oldRecord:
+                    newRecord = oldRecord
+
+                records[obj] = newRecord
+                recordsById[newRecord.id] = newRecord
+
+    @staticmethod
+    def makeNodeRecord(node: 'QD_ModelNode', data: MappingProxyType = None) -> QD_NodeRecord:
+        """Builds the record of ``node``, its attributes are serialized unless ``data`` is still up to date"""
+        if data is None:
+            data = freeze({key: value for key, value in node.serialize().items() if key not in ('id', 'type', 'position', 'sockets')})
+        return QD_NodeRecord(node.id, node.typeName, tuple(node.position), tuple(QD_SocketRecord(socket.id, socket.type) for socket in node.sockets), data)
+
+    @staticmethod
+    def makeEdgeRecord(edge: 'QD_ModelEdge', oldRecord: QD_EdgeRecord = None) -> QD_EdgeRecord:
+        return QD_EdgeRecord(
+                edge.id,
+                edge.edge_type,
+                edge.start_socket.id if edge.start_socket is not None else None,
+                edge.end_socket.id if edge.end_socket is not None else None)
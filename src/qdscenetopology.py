@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+A module containing the incremental topological order of a scene
+"""
+
+
+class QD_SceneTopology():
+    """Keeps the nodes of a scene in a topological order of the non-pulse edges, from output socket to input socket
+
+    The order is maintained with the Pearce-Kelly algorithm: inserting an edge ``x -> y`` with ``y`` already
+    ordered after ``x`` costs nothing, otherwise only nodes whose order lies between ``y`` and ``x`` and which
+    are reachable from ``y`` or reach ``x`` get reordered. Removing an edge never invalidates the order.
+
+    An edge which would close a cycle can't be ordered, it is kept aside and retried when other edges get
+    removed. The editor refuses to create such edges, see :meth:`wouldCreateCycle`, but loaded files may have them.
+    """
+
+    def __init__(self, scene: 'QD_Scene'):
+        """
+        :param scene: Reference to the :class:`scene.QD_Scene`
+        :type scene: :class:`scene.QD_Scene`
+        """
+        self.scene = scene
+        self.clear()
+
+    def clear(self):
+        self._ord = {}
+        self._nextOrd = 0
+
+        # node -> {node: number of edges}, parallel edges between two nodes are counted
+        self._succ = {}
+        self._pred = {}
+
+        # edge -> (fromNode, toNode)
+        self._orderedEdges = {}
+        self._cyclicEdges = {}
+
+    def order(self, node: 'QD_Node') -> int:
+        """Position of ``node`` in the order, only comparison between two positions is meaningful"""
+        return self._ord[node]
+
+    def sortedNodes(self, nodes=None) -> list:
+        """Returns ``nodes``, or all nodes of the scene, sorted so that every node comes after its inputs"""
+        return sorted(self._ord if nodes is None else nodes, key=self._ord.__getitem__)
+
+    def successors(self, node: 'QD_Node'):
+        return self._succ[node].keys()
+
+    def predecessors(self, node: 'QD_Node'):
+        return self._pred[node].keys()
+
+    def hasCycle(self) -> bool:
+        """``True`` if some edges could not be ordered because they close a cycle"""
+        return bool(self._cyclicEdges)
+
+    @staticmethod
+    def edgeEnds(edge: 'QD_Edge') -> [tuple, None]:
+        """Returns ``(fromNode, toNode)`` of an ordered edge or ``None`` if ``edge`` doesn't take part in the order"""
+        if not edge.isConnected() or edge.start_socket.type.is_pulse:
+            return None
+
+        if edge.start_socket.is_output:
+            return edge.start_socket.node, edge.end_socket.node
+        return edge.end_socket.node, edge.start_socket.node
+
+    def wouldCreateCycle(self, fromNode: 'QD_Node', toNode: 'QD_Node') -> bool:
+        """Checks if a new edge from an output socket of ``fromNode`` to an input socket of ``toNode`` closes a cycle"""
+        if fromNode is toNode:
+            return True
+
+        if self._ord[toNode] > self._ord[fromNode]:
+            return False
+
+        return self._searchForward(toNode, self._ord[fromNode], fromNode) is None
+
+    def addNode(self, node: 'QD_Node'):
+        self._ord[node] = self._nextOrd
+        self._nextOrd += 1
+
+        self._succ[node] = {}
+        self._pred[node] = {}
+
+    def removeNode(self, node: 'QD_Node'):
+        """Edges of ``node`` are expected to be removed already"""
+        self._ord.pop(node, None)
+        self._succ.pop(node, None)
+        self._pred.pop(node, None)
+
+    def onEdgeConnected(self, edge: 'QD_Edge'):
+        ends = self.edgeEnds(edge)
+        if ends is None:
+            return
+
+        fromNode, toNode = ends
+        if fromNode not in self._ord or toNode not in self._ord:
+            return
+
+        if self._insert(fromNode, toNode):
+            self._orderedEdges[edge] = ends
+        else:
+            self._cyclicEdges[edge] = ends
+
+    def onEdgeDisconnected(self, edge: 'QD_Edge'):
+        """Called while ``edge`` still refers to both its sockets"""
+        if self._cyclicEdges.pop(edge, None) is not None:
+            return
+
+        ends = self._orderedEdges.pop(edge, None)
+        if ends is None:
+            return
+
+        fromNode, toNode = ends
+        self._unlink(self._succ[fromNode], toNode)
+        self._unlink(self._pred[toNode], fromNode)
+
+        for cyclicEdge, cyclicEnds in list(self._cyclicEdges.items()):
+            if self._insert(*cyclicEnds):
+                del self._cyclicEdges[cyclicEdge]
+                self._orderedEdges[cyclicEdge] = cyclicEnds
+
+    @staticmethod
+    def _unlink(neighbors: dict, node: 'QD_Node'):
+        if neighbors[node] == 1:
+            del neighbors[node]
+        else:
+            neighbors[node] -= 1
+
+    def _insert(self, fromNode: 'QD_Node', toNode: 'QD_Node') -> bool:
+        """Adds ``fromNode -> toNode`` to the graph and fixes the order, returns ``False`` and changes nothing on cycle"""
+        if fromNode is toNode:
+            return False
+
+        lower, upper = self._ord[toNode], self._ord[fromNode]
+        if lower < upper:
+            forward = self._searchForward(toNode, upper, fromNode)
+            if forward is None:
+                return False
+
+            backward = self._searchBackward(fromNode, lower)
+            self._reorder(backward, forward)
+
+        self._succ[fromNode][toNode] = self._succ[fromNode].get(toNode, 0) + 1
+        self._pred[toNode][fromNode] = self._pred[toNode].get(fromNode, 0) + 1
+        return True
+
+    def _searchForward(self, start: 'QD_Node', upper: int, target: 'QD_Node') -> [list, None]:
+        """Nodes reachable from ``start`` with order below ``upper``, ``None`` if ``target`` is reachable"""
+        visited = {start}
+        stack = [start]
+
+        while stack:
+            for node in self._succ[stack.pop()]:
+                if node is target:
+                    return None
+
+                if node not in visited and self._ord[node] < upper:
+                    visited.add(node)
+                    stack.append(node)
+        return list(visited)
+
+    def _searchBackward(self, start: 'QD_Node', lower: int) -> list:
+        """Nodes reaching ``start`` with order above ``lower``"""
+        visited = {start}
+        stack = [start]
+
+        while stack:
+            for node in self._pred[stack.pop()]:
+                if node not in visited and self._ord[node] > lower:
+                    visited.add(node)
+                    stack.append(node)
+        return list(visited)
+
+    def _reorder(self, backward: list, forward: list):
+        """Reuses the positions of both regions, all ``backward`` nodes are placed before all ``forward`` nodes"""
+        backward.sort(key=self._ord.__getitem__)
+        forward.sort(key=self._ord.__getitem__)
+
+        nodes = backward + forward
+        for node, order in zip(nodes, sorted(self._ord[node] for node in nodes)):
+            self._ord[node] = order
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+A module containing the state of an open scene transaction
+"""
+
+
+class QD_SceneTransaction():
+    """Notifications collected while :meth:`qdscene.QD_Scene.transaction` is open, dispatched once on commit
+
+    :Instance Attributes:
+
+    - **scene** - the :class:`qdscene.QD_Scene` this transaction belongs to
+    - **desc** - description of the history stamp stored on commit
+    - **startSerial** - serial of the scene change log when the transaction began
+    - **historyRequested** - ``True`` if ``storeHistory`` was called inside the transaction
+    - **setModified** - ``True`` if any of those calls asked to mark the scene modified
+    - **selectionChanged** - ``True`` if selection or deselection events got deferred
+    - **inputSockets** - sockets whose node waits for ``onInputChanged``, in notification order
+    """
+
+    def __init__(self, scene: 'QD_Scene', desc: str = None):
+        self.scene = scene
+        self.desc = desc
+        self.startSerial = scene.changes.serial
+
+        self.historyRequested = False
+        self.setModified = False
+        self.selectionChanged = False
+        self.inputSockets = {}
+
+        # views get repainted once on commit
+        self.frozenViews = [view for view in scene.gfx.views() if view.updatesEnabled()]
+        for view in self.frozenViews:
+            view.setUpdatesEnabled(False)
+
+    @property
+    def hasChanges(self) -> bool:
+        return self.scene.changes.serial != self.startSerial
+
+    def storeHistory(self, desc: str, setModified: bool = False):
+        if self.desc is None:
+            self.desc = desc
+
+        self.historyRequested = True
+        self.setModified = self.setModified or setModified
+
+    def notifyInputChanged(self, socket: 'QD_Socket'):
+        self.inputSockets[socket] = None
@@ -1,10 +1,28 @@
 # -*- coding: utf-8 -*-
-from qdutils import *
 
 
 class QD_Serializable():
-    def __init__(self):
-        self.id = id(self)
+    __slots__ = ('_id',)
+
+    def __init__(self, objId: int = None):
+        self._id = id(self) if objId is None else objId
+
+
+    @property
+    def id(self):
+        return self._id
+
+
+    @id.setter
+    def id(self, value):
+        if self._id != value:
+            oldId, self._id = self._id, value
+            self.onIdChanged(oldId)
+
+
+    def onIdChanged(self, oldId):
+        """Called after the persistent id changed, owners keyed by id can re-index this object here"""
+        pass
 
 
     def serialize(self) -> dict:
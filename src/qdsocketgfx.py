@@ -1,98 +1,19 @@
 # -*- coding: utf-8 -*-
-from enum import Enum, unique
+import weakref
+
 from PySide6.QtGui import *
 from PySide6.QtCore import *
 from PySide6.QtWidgets import *
 
-@unique
-class SocketType(int, Enum):
-    In = 0
-    Out_True = 1
-    Out_False = 2
-
-    IndexOut_0 = 10
-    IndexOut_1 = 11
-    IndexOut_2 = 12
-    IndexOut_3 = 13
-    IndexOut_4 = 14
-    IndexOut_5 = 15
-    IndexOut_6 = 16
-    IndexOut_7 = 17
-    IndexOut_8 = 18
-    IndexOut_9 = 19
-
-    PulseIn = 100
-    PulseOut = 101
-
-
-    @staticmethod
-    def IndexOut_min():
-        return SocketType.IndexOut_0
-
-
-    @staticmethod
-    def IndexOut_max():
-        return SocketType.IndexOut_9
-
-
-    @property
-    def is_in(self) -> bool:
-        return self in (SocketType.In, SocketType.PulseIn)
-
-
-    @property
-    def is_out(self) -> bool:
-        return not self.is_in
-
-
-    @property
-    def is_pulse(self) -> bool:
-        return self in (SocketType.PulseIn, SocketType.PulseOut)
-
-
-    @property
-    def is_bool(self) -> bool:
-        return self in (SocketType.Out_True, SocketType.Out_False)
-
-
-    @property
-    def as_bool(self) -> bool:
-        if self is SocketType.Out_True:
-            return True
-        elif self is SocketType.Out_False:
-            return False
-        else:
-            raise ValueError(self)
-
-
-    @property
-    def is_index(self) -> bool:
-        return self >= SocketType.IndexOut_min() and self <= SocketType.IndexOut_max()
-
-
-    @property
-    def as_index(self) -> int:
-        if self.is_index:
-            return self - SocketType.IndexOut_min()
-        else:
-            raise ValueError(self)
-
-
-    @property
-    def cast_type(self):
-        if self.is_bool:
-            return bool
-        elif self.is_index:
-            return int
-        else:
-            raise ValueError(self)
+from qdassets import assets
+from qdsockettype import SocketType
 
 
 class QD_SocketGfx(QGraphicsItem):
     def __init__(self, socket: 'QD_Socket'):
         super().__init__(socket.node.gfx)
         self.setAcceptHoverEvents(True)
-        self.socket = socket
+        self._socket = weakref.ref(socket)
 
         # _hoverState: 0 not hovered
         #              1     hovered and normal
@@ -103,6 +24,21 @@ class QD_SocketGfx(QGraphicsItem):
         self.initAssets()
 
 
+    def rebind(self, socket: 'QD_Socket'):
+        """Reuses this item released by a removed socket for ``socket``"""
+        self._socket = weakref.ref(socket)
+        self._hoverState = 0
+
+        self.setParentItem(socket.node.gfx)
+        self.changeSocketType()
+
+
+    @property
+    def socket(self) -> 'QD_Socket':
+        """The socket owning this item, ``None`` once the socket has been freed"""
+        return self._socket()
+
+
     @property
     def color(self) -> QColor:
         return self.__class__.getSocketColor(self.socket.type)
@@ -172,9 +108,6 @@ class QD_SocketGfx(QGraphicsItem):
         self._brush = QBrush(self.color)
         self._brushError = QBrush(self._colorError)
 
-        self._iconPulse = QImage("icons/socket_pulse.png")
-        self._iconError = QImage("icons/socket_error.png")
-
 
     def paint(self, painter, option: QStyleOptionGraphicsItem, widget=None):
         match self._hoverState:
@@ -186,10 +119,10 @@ class QD_SocketGfx(QGraphicsItem):
         painter.drawEllipse(QRectF(-self.radius, -self.radius, 2 * self.radius, 2 * self.radius))
 
         if self.socket.type.is_pulse:
-            painter.drawImage(QRectF(-self.radius, -self.radius, 2 * self.radius, 2 * self.radius), self._iconPulse)
+            assets.drawImage(painter, QRectF(-self.radius, -self.radius, 2 * self.radius, 2 * self.radius), 'icons/socket_pulse.png')
 
         if self._hoverState == 2:
-            painter.drawImage(QRectF(-self.radius, -self.radius, 2 * self.radius, 2 * self.radius), self._iconError)
+            assets.drawImage(painter, QRectF(-self.radius, -self.radius, 2 * self.radius, 2 * self.radius), 'icons/socket_error.png')
 
         match self._hoverState:
             case 0: painter.setPen(self._pen)
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+from enum import Enum, unique
+
+@unique
+class SocketType(int, Enum):
+    In = 0
+    Out_True = 1
+    Out_False = 2
+
+    IndexOut_0 = 10
+    IndexOut_1 = 11
+    IndexOut_2 = 12
+    IndexOut_3 = 13
+    IndexOut_4 = 14
+    IndexOut_5 = 15
+    IndexOut_6 = 16
+    IndexOut_7 = 17
+    IndexOut_8 = 18
+    IndexOut_9 = 19
+
+    PulseIn = 100
+    PulseOut = 101
+
+
+    @staticmethod
+    def IndexOut_min():
+        return SocketType.IndexOut_0
+
+
+    @staticmethod
+    def IndexOut_max():
+        return SocketType.IndexOut_9
+
+
+    @property
+    def as_bool(self) -> bool:
+        if self is SocketType.Out_True:
+            return True
+        elif self is SocketType.Out_False:
+            return False
+        else:
+            raise ValueError(self)
+
+
+    @property
+    def as_index(self) -> int:
+        if self.is_index:
+            return self - SocketType.IndexOut_min()
+        else:
+            raise ValueError(self)
+
+
+    @property
+    def cast_type(self):
+        if self.is_bool:
+            return bool
+        elif self.is_index:
+            return int
+        else:
+            raise ValueError(self)
+
+
+# flags are looked up on every socket position and connection check, compute them once per member
+# instead of doing tuple membership tests in properties
+for _socktype in SocketType:
+    _socktype.is_in = _socktype in (SocketType.In, SocketType.PulseIn)
+    _socktype.is_out = not _socktype.is_in
+    _socktype.is_pulse = _socktype in (SocketType.PulseIn, SocketType.PulseOut)
+    _socktype.is_bool = _socktype in (SocketType.Out_True, SocketType.Out_False)
+    _socktype.is_index = SocketType.IndexOut_min() <= _socktype <= SocketType.IndexOut_max()
+del _socktype
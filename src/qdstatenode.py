@@ -26,23 +26,23 @@ class QD_StateNode(QD_Node):
         if self.__class__.StateNodeGfx_class is None:
             raise NotImplementedError("QD_StateNode::StateNodeGfx_class not defined")
 
-        self.gfx = self.__class__.StateNodeGfx_class(self)
+        self.gfx = self.acquireGfx(self.__class__.StateNodeGfx_class)
 
         self.scene.addNode(self)
         self.scene.gfx.addItem(self.gfx)
 
-        self.sockets = []
         self.initSockets(sockets)
 
 
     def initSockets(self, sockets, reset: bool = True):
         if reset:
-            for sock in self.sockets:
+            for sock in self.sockets.copy():
                 self.scene.gfx.removeItem(sock.gfx)
-            self.sockets = []
+                self.scene.removeSocket(sock)
+                self.removeSocket(sock)
 
         for type in sockets:
-            self.sockets.append(self.__class__.Socket_class(node=self, socktype=type))
+            self.addSocket(self.__class__.Socket_class(node=self, socktype=type))
 
         self.updateSockets()
 
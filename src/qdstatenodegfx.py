@@ -4,16 +4,16 @@ from PySide6.QtGui import *
 from PySide6.QtCore import *
 from PySide6.QtWidgets import *
 
+from qdnodegfx import QD_NodeGfx
 
-class QD_StateNodeGfx(QGraphicsObject):
+
+class QD_StateNodeGfx(QD_NodeGfx):
 
     def __init__(self, node: 'QD_StateNode', parent: QGraphicsItem = None):
-        super().__init__(parent)
-        self.node = node
+        super().__init__(node, parent)
 
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable)
-        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsFocusable)
         self.setAcceptHoverEvents(True)
 
@@ -36,7 +36,7 @@ class QD_StateNodeGfx(QGraphicsObject):
         def normalizeLightness(color: QColor, lightness: float = 0.2) -> QColor:
             return color.lighter(round(lightness * 100 / color.lightnessF()))
 
-        for root in self.node.getRoots():
-            if root.__class__.__name__ == 'StateNode_enter' and hasattr(root, 'index'):
-                return normalizeLightness(utils.player_color(root.index - 1))
+        enterNode = self.node.scene.components.enterNodeOf(self.node)
+        if enterNode is not None and hasattr(enterNode, 'index'):
+            return normalizeLightness(utils.player_color(enterNode.index - 1))
         return normalizeLightness(QColor("#313131"))
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import os
 import json
+import weakref
 
 from PySide6.QtGui import *
 from PySide6.QtCore import *
@@ -13,6 +14,7 @@ from qdopnode import *
 from qdedge import *
 from qdviewgfx import MODE_EDGE_DRAG, QD_ViewGfx  # , MODE_EDGES_REROUTING
 from qdutils import *
+from qdgc import loadingDocument
 
 
 class QD_StateWidget(utils.disableAutoDelete(QSplitter)):
@@ -22,7 +24,8 @@ class QD_StateWidget(utils.disableAutoDelete(QSplitter)):
     def __init__(self, node: 'QD_StateNode' = None, parent: QWidget = None):
         super().__init__(parent)
 
-        self.node = node
+        # owned by the node, see node.widget
+        self._node = weakref.ref(node) if node is not None else None
         self.filename = None
 
         self.initUI()
@@ -41,6 +44,11 @@ class QD_StateWidget(utils.disableAutoDelete(QSplitter)):
         self.__closeEventListeners = []
 
 
+    @property
+    def node(self) -> 'QD_StateNode':
+        return self._node() if self._node is not None else None
+
+
     def initUI(self):
         self.confg = QD_StateConfg()
         self.addWidget(self.confg.gfx)
@@ -63,9 +71,8 @@ class QD_StateWidget(utils.disableAutoDelete(QSplitter)):
 
     def doEvalOutputs(self):
         # eval all output nodes
-        for node in self.scene.nodes:
-            if node.__class__.__name__ == "CalcNode_Output":
-                node.eval()
+        for node in self.scene.nodesOfType("CalcNode_Output"):
+            node.eval()
 
     def onHistoryRestored(self):
         self.doEvalOutputs()
@@ -88,12 +95,14 @@ class QD_StateWidget(utils.disableAutoDelete(QSplitter)):
                     QMessageBox.warning(self, "Incompatible json file version: %s" % data['version'], "Current version is %s" % confg.APP_VERSION)
                     return False
 
-                self.confg.deserialize(data['confg'])
-                self.scene.deserialize(data['scene'])
+                # the loaded graph and its initial history stamp live until the document is closed
+                with loadingDocument():
+                    self.confg.deserialize(data['confg'])
+                    self.scene.deserialize(data['scene'])
 
-                self.scene.has_been_modified = False
-                self.scene.history.clear()
-                self.scene.history.storeInitialHistoryStamp()
+                    self.scene.has_been_modified = False
+                    self.scene.history.clear()
+                    self.scene.history.storeInitialHistoryStamp()
 
                 self.filename = filename
 
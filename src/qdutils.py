@@ -4,10 +4,12 @@ import pprint
 import traceback
 import functools
 
-from PySide6.QtCore import QFile, QRectF
-from PySide6.QtGui import QFontDatabase, QImage, QPainter, QColor
+from PySide6.QtCore import QFile, QRectF, Qt
+from PySide6.QtGui import QFontDatabase, QImage, QPainter, QPainterPath, QColor
 from PySide6.QtWidgets import QApplication
 
+from qdassets import assets
+
 LISTBOX_MIMETYPE = "application/x-item"
 
 OPS_NONE      = 0
@@ -32,6 +34,9 @@ class Confg:
 
     DEBUG = True
 
+    # print garbage collector pauses on exit, also enabled by environment variable QD_GC_STATS
+    GC_STATS = False
+
     def __init__(self):
         pass
 
@@ -48,7 +53,6 @@ class Utils:
     _stateNodeTypeList = {}
 
     _mainWindow = None
-    _nodeStateIcons = None
     _monoFontFamilies = None
 
     _color_table = [
@@ -184,11 +188,44 @@ class Utils:
             case 1: offset = icon_size * 0
             case _: offset = icon_size * 2
 
-        if not self._nodeStateIcons:
-            assert QApplication.instance()
-            self._nodeStateIcons = QImage("icons/status_icons.png")
+        assets.drawImage(painter, QRectF(x, y, icon_size, icon_size), 'icons/status_icons.png', QRectF(offset, 0, icon_size, icon_size))
+
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def titledNodePaths(width: float, height: float, titleHeight: float, roundness: float) -> tuple:
+        """Returns ``(title, content, outline)`` paths of a rounded node body with a title bar
+
+        Paths only depend on the size, nodes of the same size share them and must not modify them.
+        """
+        title = QPainterPath()
+        title.setFillRule(Qt.FillRule.WindingFill)
+        title.addRoundedRect(0, 0, width, titleHeight, roundness, roundness)
+        title.addRect(0, titleHeight - roundness, roundness, roundness)
+        title.addRect(width - roundness, titleHeight - roundness, roundness, roundness)
+
+        content = QPainterPath()
+        content.setFillRule(Qt.FillRule.WindingFill)
+        content.addRoundedRect(0, titleHeight, width, height - titleHeight, roundness, roundness)
+        content.addRect(0, titleHeight, roundness, roundness)
+        content.addRect(width - roundness, titleHeight, roundness, roundness)
+
+        outline = QPainterPath()
+        outline.addRoundedRect(-1, -1, width + 2, height + 2, roundness, roundness)
+        return title.simplified(), content.simplified(), outline.simplified()
+
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def ellipseNodePaths(width: float, height: float) -> tuple:
+        """Returns ``(content, outline)`` paths of an elliptic node body, shared like :meth:`titledNodePaths`"""
+        content = QPainterPath()
+        content.setFillRule(Qt.FillRule.WindingFill)
+        content.addEllipse(QRectF(0, 0, width, height))
 
-        painter.drawImage(QRectF(x, y, icon_size, icon_size), self._nodeStateIcons, QRectF(offset, 0, icon_size, icon_size))
+        outline = QPainterPath()
+        outline.addEllipse(QRectF(-1, -1, width + 2, height + 2))
+        return content.simplified(), outline.simplified()
 
 
     def printObj(self, obj):
@@ -104,7 +104,7 @@ class QD_ViewGfx(QGraphicsView):
                 print("MMB DEBUG:", item.edge, "\n\t", item.edge.gfx if item.edge.gfx is not None else None)
 
             if isinstance(item, QD_SocketGfx):
-                print("MMB DEBUG:", item.socket, "socket_type:", item.socket.socket_type, "has edges:", "no" if item.socket.edges == [] else "")
+                print("MMB DEBUG:", item.socket, "socket_type:", item.socket.socket_type, "has edges:", "no" if not item.socket.edges else "")
                 if item.socket.edges:
                     for edge in item.socket.edges: print("\t", edge)
 
@@ -297,25 +297,27 @@ class QD_ViewGfx(QGraphicsView):
         super().keyPressEvent(event)
 
     def cutIntersectingEdges(self):
-        for ix in range(len(self.cutline.line_points) - 1):
-            p1 = self.cutline.line_points[ix]
-            p2 = self.cutline.line_points[ix + 1]
+        # the transaction notifies each touched node once after all edges are removed
+        with self.gfx.scene.transaction("Delete cutted edges"):
+            for ix in range(len(self.cutline.line_points) - 1):
+                p1 = self.cutline.line_points[ix]
+                p2 = self.cutline.line_points[ix + 1]
 
-            # @TODO: we could collect all touched nodes, and notify them once after all edges removed
-            # we could cut 3 edges leading to a single nodeeditor this will notify it 3x
-            # maybe we could use some Notifier class with methods collect() and dispatch()
-            for edge in self.gfx.scene.edges:
-                if edge.gfx.intersectsWith(p1, p2):
-                    edge.remove()
-        self.gfx.scene.history.storeHistory("Delete cutted edges", setModified=True)
+                for edge in self.gfx.scene.edges:
+                    if edge.gfx.intersectsWith(p1, p2):
+                        edge.remove()
+            self.gfx.scene.history.storeHistory("Delete cutted edges", setModified=True)
 
     def deleteSelected(self):
-        for item in self.gfx.selectedItems():
-            if isinstance(item, QD_EdgeGfx):
-                item.edge.remove()
-            elif hasattr(item, 'node'):
-                item.node.remove()
-        self.gfx.scene.history.storeHistory("Delete selected", setModified=True)
+        with self.gfx.scene.transaction("Delete selected"):
+            for item in self.gfx.selectedItems():
+                if isinstance(item, QD_EdgeGfx):
+                    # edges of removed nodes are gone already
+                    if item.edge is not None:
+                        item.edge.remove()
+                elif hasattr(item, 'node'):
+                    item.node.remove()
+            self.gfx.scene.history.storeHistory("Delete selected", setModified=True)
 
     def debug_modifiers(self, event):
         out = "MODS: "
@@ -356,21 +358,28 @@ class QD_ViewGfx(QGraphicsView):
                 raise ValueError('Cannot connect pulse socket and non-pulse socket')
 
             if hasattr(startSocket, 'node') and startSocket.node and hasattr(endSocket, 'node') and endSocket.node:
+                scene = startSocket.node.scene
                 if startSocket.type.is_pulse:
-                    if startSocket.node.findNodes(True, lambda node: node is endSocket.node):
+                    if scene.components.sameComponent(startSocket.node, endSocket.node):
                         raise ValueError('Cannot connect send pulse signal inside its own graph')
 
                 else:
-                    startEnterNodes = startSocket.node.findNodes(True, lambda node: node.__class__.__name__ == 'StateNode_enter')
-                    endEnterNodes = endSocket.node.findNodes(True, lambda node: node.__class__.__name__ == 'StateNode_enter')
+                    outSocket, inSocket = (startSocket, endSocket) if startSocket.is_output else (endSocket, startSocket)
+                    if scene.topology.wouldCreateCycle(outSocket.node, inSocket.node):
+                        raise ValueError('Cannot connect sockets to create a loop')
+
+                    components = scene.components
 
-                    if len(startEnterNodes.union(endEnterNodes)) > 1:
+                    startEnterNodes = components.enterNodesOf(startSocket.node)
+                    endEnterNodes = components.enterNodesOf(endSocket.node)
+
+                    if len(startEnterNodes | endEnterNodes) > 1:
                         raise ValueError('Cannot connect sockets with multiple enter nodes')
 
-                    startExitNodes = startSocket.node.findNodes(True, lambda node: node.__class__.__name__ == 'StateNode_exit')
-                    endExitNodes = endSocket.node.findNodes(True, lambda node: node.__class__.__name__ == 'StateNode_exit')
+                    startExitNodes = components.exitNodesOf(startSocket.node)
+                    endExitNodes = components.exitNodesOf(endSocket.node)
 
-                    if len(startExitNodes.union(endExitNodes)) > 1:
+                    if len(startExitNodes | endExitNodes) > 1:
                         raise ValueError('Cannot connect sockets with multiple exit nodes')
 
             return True, 'No error'
@@ -394,27 +403,29 @@ class QD_ViewGfx(QGraphicsView):
                 canConnect, errmsg = self.canConnectSockets(item.socket, self.dragStartSocket)
                 if canConnect:
                     # if we released dragging on a socket (other then the beginning socket)
-                    ## First remove old edges / send notifications
-                    for socket in (item.socket, self.dragStartSocket):
-                        if not socket.is_multi_edges:
+                    # removed and replaced inputs get notified once when the transaction ends
+                    with self.gfx.scene.transaction("Created new edge by dragging"):
+                        ## First remove old edges / send notifications
+                        for socket in (item.socket, self.dragStartSocket):
+                            if not socket.is_multi_edges:
+                                if socket.is_input:
+                                    socket.removeAllEdges(silent=True)
+                                else:
+                                    socket.removeAllEdges(silent=False)
+
+                        ## Create new QD_Edge
+                        new_edge = QD_Edge(self.gfx.scene, self.dragStartSocket, item.socket, edge_type=EdgeType.Bezier)
+                        if confg.DEBUG:
+                            print("View::edgeDragEnd ~  created new edge:", new_edge, "connecting", new_edge.start_socket, "<-->", new_edge.end_socket)
+
+                        ## Send notifications for the new edge
+                        for socket in [self.dragStartSocket, item.socket]:
+                            # @TODO: Add possibility (ie when an input edge was replaced) to be silent and don't trigger change
+                            socket.node.onEdgeConnectionChanged(new_edge)
                             if socket.is_input:
-                                socket.removeAllEdges(silent=True)
-                            else:
-                                socket.removeAllEdges(silent=False)
-
-                    ## Create new QD_Edge
-                    new_edge = QD_Edge(self.gfx.scene, self.dragStartSocket, item.socket, edge_type=EdgeType.Bezier)
-                    if confg.DEBUG:
-                        print("View::edgeDragEnd ~  created new edge:", new_edge, "connecting", new_edge.start_socket, "<-->", new_edge.end_socket)
-
-                    ## Send notifications for the new edge
-                    for socket in [self.dragStartSocket, item.socket]:
-                        # @TODO: Add possibility (ie when an input edge was replaced) to be silent and don't trigger change
-                        socket.node.onEdgeConnectionChanged(new_edge)
-                        if socket.is_input:
-                            socket.node.onInputChanged(socket)
-
-                    self.gfx.scene.history.storeHistory("Created new edge by dragging", setModified=True)
+                                self.gfx.scene.notifyInputChanged(socket)
+
+                        self.gfx.scene.history.storeHistory("Created new edge by dragging", setModified=True)
                     return True
 
                 else:
@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
-from PySide6.QtCore import QPointF, Signal, Qt
+from PySide6.QtCore import QPointF, QSignalBlocker, Signal, Qt
 from PySide6.QtGui import *
 from PySide6.QtWidgets import *
+import shiboken6
 
 from qdstatewidget import QD_StateWidget
 from qdsocket import *
+from qdassets import assets
 from qdutils import *
 from qdnode import QD_Node
 
@@ -101,6 +103,26 @@ class _StateNodeGfx_act(QD_NodeGfx):
         self.vbox.addWidget(self.edit)
 
 
+    def rebind(self, node: 'StateNode_act'):
+        super().rebind(node)
+
+        self.handleSelected = None
+        self.mousePressPos = None
+        self.mousePressRect = None
+
+        # neither size nor text are saved with the node, start over like a new item
+        self.prepareGeometryChange()
+        self._width = self._miniWidth
+        self._height = self._miniHeight
+        self.sizeChanged.emit()
+
+        blocker = QSignalBlocker(self.edit)
+        self.edit.clear()
+        blocker.unblock()
+
+        self.title = node.title
+
+
     def initSizes(self):
         self._miniWidth = 120
         self._miniHeight = 100
@@ -131,9 +153,7 @@ class _StateNodeGfx_act(QD_NodeGfx):
         self._pen_hover_selected.setWidthF(3.0)
 
         self._brush_background = QBrush(QColor("#E3474747"))
-
-        self._icons = QImage("icons/status_icons.png")
-        self._image = QImage("icons/src.png")
+        self._imagePath = 'icons/src.png'
 
 
     def getFrameRect(self, w: float, h: float) -> QRectF:
@@ -292,51 +312,41 @@ class _StateNodeGfx_act(QD_NodeGfx):
         def normalizeLightness(color: QColor, lightness: float = 0.2) -> QColor:
             return color.lighter(round(lightness * 100 / color.lightnessF()))
 
-        for root in self.node.getRoots():
-            if root.__class__.__name__ == 'StateNode_enter' and hasattr(root, 'index'):
-                return normalizeLightness(utils.player_color(root.index - 1))
+        enterNode = self.node.scene.components.enterNodeOf(self.node)
+        if enterNode is not None and hasattr(enterNode, 'index'):
+            return normalizeLightness(utils.player_color(enterNode.index - 1))
         return normalizeLightness(QColor("#313131"))
 
 
     def paint(self, painter, option: QStyleOptionGraphicsItem, widget=None):
+        path_title, path_content, path_outline = utils.titledNodePaths(self.width, self.height, self.title_height, self.edge_roundness)
+
         # title
-        path_title = QPainterPath()
-        path_title.setFillRule(Qt.FillRule.WindingFill)
-        path_title.addRoundedRect(0, 0, self.width, self.title_height, self.edge_roundness, self.edge_roundness)
-        path_title.addRect(0, self.title_height - self.edge_roundness, self.edge_roundness, self.edge_roundness)
-        path_title.addRect(self.width - self.edge_roundness, self.title_height - self.edge_roundness, self.edge_roundness, self.edge_roundness)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.setBrush(QBrush(self.playerColor()))
-        painter.drawPath(path_title.simplified())
+        painter.drawPath(path_title)
 
         painter.setPen(self._pen_text)
         painter.drawText(QRectF(self.edge_roundness, 0, self.width - self.edge_roundness * 2, self.title_height), Qt.AlignmentFlag.AlignCenter, self.title)
 
         # content
-        path_content = QPainterPath()
-        path_content.setFillRule(Qt.FillRule.WindingFill)
-        path_content.addRoundedRect(0, self.title_height, self.width, self.height - self.title_height, self.edge_roundness, self.edge_roundness)
-        path_content.addRect(0, self.title_height, self.edge_roundness, self.edge_roundness)
-        path_content.addRect(self.width - self.edge_roundness, self.title_height, self.edge_roundness, self.edge_roundness)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.setBrush(self._brush_background)
-        painter.drawPath(path_content.simplified())
+        painter.drawPath(path_content)
 
         # outline
-        path_outline = QPainterPath()
-        path_outline.addRoundedRect(-1, -1, self.width + 2, self.height + 2, self.edge_roundness, self.edge_roundness)
         painter.setBrush(Qt.BrushStyle.NoBrush)
         if self.hovered:
             painter.setPen(self._pen_hover_selected if self.isSelected() else self._pen_hovered)
-            painter.drawPath(path_outline.simplified())
+            painter.drawPath(path_outline)
             painter.setPen(self._pen)
-            painter.drawPath(path_outline.simplified())
+            painter.drawPath(path_outline)
         else:
             painter.setPen(self._pen_selected if self.isSelected() else self._pen)
-            painter.drawPath(path_outline.simplified())
+            painter.drawPath(path_outline)
 
         utils.drawNodeStateIcon(painter, self.node.iconIndex, 0, 0, False)
-        painter.drawImage(QRectF(25, 20, 50, 50), self._image)
+        assets.drawImage(painter, QRectF(25, 20, 50, 50), self._imagePath)
 
 
 @utils.stateNodeRegister
@@ -354,7 +364,6 @@ class StateNode_act(QD_Node):
 
         # just to be sure, init these variables
         self.gfx = None
-        self.sockets = []
 
         self.initInnerClasses()
         self.initSettings()
@@ -383,6 +392,7 @@ class StateNode_act(QD_Node):
     def title(self, value):
         self._title = value
         self.gfx.title = self._title
+        self.scene.onNodeChanged(self)
 
     @property
     def pos(self):
@@ -392,7 +402,9 @@ class StateNode_act(QD_Node):
         self.gfx.setPos(x, y)
 
     def initInnerClasses(self):
-        self.gfx = self.__class__.StateNodeGfx_class(self)
+        self.gfx = self.acquireGfx(self.__class__.StateNodeGfx_class)
+
+        # the editor isn't saved with the node, a reused one would show the sub scene of another node
         self.widget = self.__class__.StateNodeWidget_class(self)
 
 
@@ -403,27 +415,32 @@ class StateNode_act(QD_Node):
 
     def initSockets(self, sockets, reset: bool = True):
         if reset:
-            for sock in self.sockets:
+            for sock in self.sockets.copy():
                 self.scene.gfx.removeItem(sock.gfx)
-            self.sockets = []
+                self.scene.removeSocket(sock)
+                self.removeSocket(sock)
 
         for type in sockets:
-            self.sockets.append(self.__class__.Socket_class(node=self, socktype=type))
+            self.addSocket(self.__class__.Socket_class(node=self, socktype=type))
 
         self.updateSockets()
 
 
+    def remove(self):
+        super().remove()
+
+        # the editor and its scene refer to each other, the garbage collector tearing that down in any order
+        # crashes, delete it right away unless a sub window shows it
+        if self.widget.parentWidget() is None:
+            shiboken6.delete(self.widget)
+        self.widget = None
+
+
     def switchPulseSocketPosition(self):
         self.pulse_on_bottom = not self.pulse_on_bottom
         self.updateSockets()
 
 
-    def onInputChanged(self, socket: 'QD_Socket'):
-        self.markDirty(False)
-        self.markDescendantsDirty()
-        self.eval()
-
-
     def onDeserialized(self, data: dict):
         pass
 
@@ -452,19 +469,20 @@ class StateNode_act(QD_Node):
         if self.getSocket(SocketType.PulseIn):
             return
 
-        self.sockets.append(self.__class__.Socket_class(node=self, socktype=SocketType.PulseIn))
+        self.addSocket(self.__class__.Socket_class(node=self, socktype=SocketType.PulseIn))
         self.updateSockets()
 
 
     def removePulseIn(self):
-        for socket in self.sockets:
+        for socket in self.sockets.copy():
             if socket.type is SocketType.PulseIn:
-                for edge in socket.edges:
+                for edge in socket.edges.copy():
                     if confg.DEBUG:
                         print("    - removing from socket:", socket, "edge:", edge)
                     edge.remove()
                 self.scene.gfx.removeItem(socket.gfx)
-                self.sockets.remove(socket)
+                self.scene.removeSocket(socket)
+                self.removeSocket(socket)
         self.updateSockets()
 
 
@@ -483,11 +501,6 @@ class StateNode_act(QD_Node):
         for other_node in self.getChildrenNodes():
             other_node.markDirty(new_value)
 
-    def markDescendantsDirty(self, new_value: bool = True):
-        for other_node in self.getChildrenNodes():
-            other_node.markDirty(new_value)
-            other_node.markChildrenDirty(new_value)
-
     def getChildrenNodes(self) -> 'List[StateNode_act]':
         other_nodes = []
         for sock in self.sockets:
@@ -498,11 +511,8 @@ class StateNode_act(QD_Node):
 
 
     def serialize(self) -> dict:
-        return {
-            'id': self.id,
+        return super().serialize() | {
             'title': self._title,
-            'position': (self.gfx.scenePos().x(), self.gfx.scenePos().y()),
-            'sockets': [sock.serialize() for sock in self.sockets],
         }
 
     def deserialize(self, data: dict, hashmap: dict = {}, restore_id: bool = True) -> bool:
@@ -516,18 +526,15 @@ class StateNode_act(QD_Node):
             self._title = data['title']
 
             for sockdata in data['sockets']:
-                found = None
-                for sock in self.sockets:
-                    if sock.type == sockdata['type']:
-                        found = sock
-                        break
-
+                found = self.getSocket(SocketType(sockdata['type']))
                 if found is None:
                     found = self.__class__.Socket_class(node=self, socktype=SocketType(sockdata['type']))
-                    self.sockets.append(found)
+                    self.addSocket(found)
 
                 found.deserialize(sockdata, hashmap, restore_id)
 
+            self.scene.onNodeChanged(self)
+
         except Exception as e:
             utils.dumpExcept(e)
 
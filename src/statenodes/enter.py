@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+import weakref
+import functools
+
 from PySide6.QtGui import *
 from PySide6.QtCore import *
 from PySide6.QtWidgets import *
@@ -17,10 +20,31 @@ class _StateNodeWidget_enter(utils.disableAutoDelete(QWidget)):
     def __init__(self, node: 'StateNode_enter' = None, parent: QWidget = None):
         super().__init__(parent)
 
-        self.node = node
-        self.scene = self.node.scene
+        # owned by the node, see node.widget
+        self._node = weakref.ref(node)
         self.initUI()
 
+        # a widget reused for another node starts over from here, see rebind()
+        self._initialData = self.toDict()
+
+
+    def rebind(self, node: 'StateNode_enter'):
+        """Reuses this widget released by a removed node for ``node``, edits are reset to how a new widget starts"""
+        self._node = None
+        self.fromDict(self._initialData)
+        self._node = weakref.ref(node)
+
+
+    @property
+    def node(self) -> 'StateNode_enter':
+        """The node owning this widget, ``None`` while it is rebound"""
+        return self._node() if self._node is not None else None
+
+
+    @property
+    def scene(self) -> 'QD_QuestScene':
+        return self.node.scene
+
 
     def initUI(self):
         self.vbox = QVBoxLayout(self)
@@ -58,6 +82,41 @@ class _StateNodeWidget_enter(utils.disableAutoDelete(QWidget)):
         if 'CreateBlankArea':
             self.vbox.addWidget(QFrame())
 
+        # edits change the saved data of the node
+        for checkBox in (self.warrior, self.wizard, self.taoist):
+            checkBox.toggled.connect(self.onChanged)
+
+        for condition in (self.level, self.gold):
+            condition.choice.currentIndexChanged.connect(self.onChanged)
+            condition.edit.textChanged.connect(self.onChanged)
+
+
+    def onChanged(self, *args):
+        if self.node is not None:
+            self.scene.onNodeChanged(self.node)
+
+
+    def fromDict(self, data: dict):
+        self.warrior.setChecked(data['job']['warrior'])
+        self.wizard.setChecked(data['job']['wizard'])
+        self.taoist.setChecked(data['job']['taoist'])
+
+        self.level.fromDict(data['level'])
+        self.gold.fromDict(data['gold'])
+
+
+    def toDict(self) -> dict:
+        return {
+            'job': {
+                'warrior': self.warrior.isChecked(),
+                'wizard': self.wizard.isChecked(),
+                'taoist': self.taoist.isChecked(),
+            },
+
+            'level': self.level.toDict(),
+            'gold': self.gold.toDict(),
+        }
+
 
 class _StateNodeGfx_enter(QD_StateNodeGfx):
     StateNodeWidget_class = _StateNodeWidget_enter
@@ -117,8 +176,6 @@ class _StateNodeGfx_enter(QD_StateNodeGfx):
         self._pen_hover_selected = QPen(self._colorHoverSelected)
         self._pen_hover_selected.setWidthF(3.0)
 
-        self._image = QImage("icons/src.png")
-
     def onSelected(self):
         self.node.scene.gfx.itemSelected.emit()
 
@@ -178,48 +235,47 @@ class _StateNodeGfx_enter(QD_StateNodeGfx):
         return QRectF(0, 0, self.width, self.height).normalized()
 
 
-    def paint(self, painter, option: QStyleOptionGraphicsItem, widget=None):
-        path_content = QPainterPath()
-        path_content.setFillRule(Qt.FillRule.WindingFill)
-        path_content.addEllipse(QRectF(0, 0, self.width, self.height))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QBrush(self.playerColor()))
-        painter.drawPath(path_content.simplified())
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def textPath(width: float, height: float, textWidth: float, textHeight: float) -> tuple:
+        """Returns the ``QRectF`` of the player text and the arrow shaped path behind it, shared by all enter nodes"""
+        text_x = max(0, (width  - textWidth ) / 2)
+        text_y = max(0, (height - textHeight) / 2)
+        text_w = width  - 2 * text_x
+        text_h = height - 2 * text_y
 
         path_text = QPainterPath()
         path_text.setFillRule(Qt.FillRule.WindingFill)
+        path_text.addPolygon(QPolygonF([QPointF(text_x, text_y), QPointF(text_x + text_w, text_y), QPointF(width, height / 2), QPointF(text_x + text_w, text_y + text_h), QPointF(text_x, text_y + text_h)]))
+        return QRectF(text_x, text_y, text_w, text_h), path_text.simplified()
 
-        text_x = max(0, (self.width  - self._rect_text_width ) / 2)
-        text_y = max(0, (self.height - self._rect_text_height) / 2)
-        text_w = self.width  - 2 * text_x
-        text_h = self.height - 2 * text_y
 
-        path_text.addPolygon(QPolygonF([QPointF(text_x, text_y), QPointF(text_x + text_w, text_y), QPointF(self.width, self.height / 2), QPointF(text_x + text_w, text_y + text_h), QPointF(text_x, text_y + text_h)]))
+    def paint(self, painter, option: QStyleOptionGraphicsItem, widget=None):
+        path_content, path_outline = utils.ellipseNodePaths(self.width, self.height)
+        rect_text, path_text = self.textPath(self.width, self.height, self._rect_text_width, self._rect_text_height)
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QBrush(self.playerColor()))
+        painter.drawPath(path_content)
+
         painter.setPen(Qt.PenStyle.NoPen)
         painter.setBrush(QBrush(self._colorTextBackground))
-        painter.drawPath(path_text.simplified())
+        painter.drawPath(path_text)
 
         painter.setPen(self._pen_text)
-        painter.drawText(QRectF(text_x, text_y, text_w, text_h), Qt.AlignmentFlag.AlignCenter, '玩家%d' % self.node.index)
+        painter.drawText(rect_text, Qt.AlignmentFlag.AlignCenter, '玩家%d' % self.node.index)
 
-        path_outline = QPainterPath()
-        path_outline.addEllipse(QRectF(-1, -1, self.width + 2, self.height + 2))
         painter.setBrush(Qt.BrushStyle.NoBrush)
         if self.hovered:
             painter.setPen(self._pen_hover_selected if self.isSelected() else self._pen_hovered)
-            painter.drawPath(path_outline.simplified())
+            painter.drawPath(path_outline)
             painter.setPen(self._pen)
-            painter.drawPath(path_outline.simplified())
+            painter.drawPath(path_outline)
         else:
             painter.setPen(self._pen_selected if self.isSelected() else self._pen)
-            painter.drawPath(path_outline.simplified())
+            painter.drawPath(path_outline)
 
-        if self.node.isDirty():
-            utils.drawNodeStateIcon(painter, 1, self.width / 2, 0, False)
-        elif self.node.isInvalid():
-            utils.drawNodeStateIcon(painter, 2, self.width / 2, 0, False)
-        else:
-            utils.drawNodeStateIcon(painter, 0, self.width / 2, 0, False)
+        utils.drawNodeStateIcon(painter, self.node.iconIndex, self.width / 2, 0, False)
 
 
 @utils.stateNodeRegister
@@ -230,22 +286,38 @@ class StateNode_enter(QD_StateNode):
     StateNodeGfx_class = _StateNodeGfx_enter
     def __init__(self, scene: 'QD_QuestScene', sockets: set = {SocketType.Out_True}):
         super().__init__(scene, sockets)
-        self.widget = _StateNodeWidget_enter(self)
 
-        # TODO
-        # get_next_valid_start_index() searches all StateNode_enter for existing index
-        # but also searches to this obj under construction which has no index yet, bad design
+        self.widget = self.scene.gfxPool.acquire(self.__class__.StateNodeWidget_class)
+        if self.widget is None:
+            self.widget = self.__class__.StateNodeWidget_class(self)
+        else:
+            self.widget.rebind(self)
+
+        self._index = scene.playerIndices.allocate()
+
+
+    @property
+    def index(self) -> int:
+        return self._index
 
-        indics = {}
-        for item in scene.gfx.items():
-            if isinstance(item, utils.getStateNodeType('StateNode_enter').StateNodeGfx_class) and hasattr(item.node, 'index'):
-                indics[item.node.index] = True
 
-        i = 1
-        while i in indics:
-            i += 1
+    @index.setter
+    def index(self, value: int):
+        if value != self._index:
+            self.scene.playerIndices.release(self._index)
+            self.scene.playerIndices.acquire(value)
+            self._index = value
+            self.scene.onNodeChanged(self)
 
-        self.index = i
+
+    def remove(self):
+        super().remove()
+        self.scene.playerIndices.release(self._index)
+
+        # a widget shown in a sub window stays with it
+        if self.widget.parentWidget() is None:
+            self.scene.gfxPool.release(self.__class__.StateNodeWidget_class, self.widget)
+            self.widget = None
 
 
     def getSocketPosition(self, socktype: SocketType) -> QPointF:
@@ -256,29 +328,14 @@ class StateNode_enter(QD_StateNode):
     def serialize(self) -> dict:
         return super().serialize() | {
             'index': self.index,
-            'widget': {
-                'job': {
-                    'warrior': self.widget.warrior.isChecked(),
-                    'wizard': self.widget.wizard.isChecked(),
-                    'taoist': self.widget.taoist.isChecked(),
-                },
-
-                'level': self.widget.level.toDict(),
-                'gold': self.widget.gold.toDict(),
-            },
+            'widget': self.widget.toDict(),
         }
 
 
     def deserialize(self, data: dict, hashmap: dict = {}, restoreId: bool = True):
         super().deserialize(data, hashmap, restoreId)
         self.index = data['index']
-
-        self.widget.warrior.setChecked(data['widget']['job']['warrior'])
-        self.widget.wizard.setChecked(data['widget']['job']['wizard'])
-        self.widget.taoist.setChecked(data['widget']['job']['taoist'])
-
-        self.widget.level.fromDict(data['widget']['level'])
-        self.widget.gold.fromDict(data['widget']['gold'])
+        self.widget.fromDict(data['widget'])
 
 
     def translate(self):
@@ -5,6 +5,7 @@ from PySide6.QtWidgets import *
 
 from qdstatewidget import QD_StateWidget
 from qdsocket import *
+from qdassets import assets
 from qdutils import *
 from qdstatenode import QD_StateNode
 from qdstatenodegfx import QD_StateNodeGfx
@@ -58,7 +59,7 @@ class _StateNodeGfx_exit(QD_StateNodeGfx):
         self._pen_hover_selected = QPen(self._color_hover_selected)
         self._pen_hover_selected.setWidthF(3.0)
 
-        self._image = QImage("icons/dst.png")
+        self._imagePath = 'icons/dst.png'
 
 
     def initUI(self):
@@ -119,24 +120,21 @@ class _StateNodeGfx_exit(QD_StateNodeGfx):
 
 
     def paint(self, painter, option: QStyleOptionGraphicsItem, widget=None):
-        path_content = QPainterPath()
-        path_content.setFillRule(Qt.FillRule.WindingFill)
-        path_content.addEllipse(QRectF(0, 0, self.width, self.height))
+        path_content, path_outline = utils.ellipseNodePaths(self.width, self.height)
+
         painter.setPen(Qt.PenStyle.NoPen)
         painter.setBrush(QBrush(self.playerColor()))
-        painter.drawPath(path_content.simplified())
+        painter.drawPath(path_content)
 
-        path_outline = QPainterPath()
-        path_outline.addEllipse(QRectF(-1, -1, self.width + 2, self.height + 2))
         painter.setBrush(Qt.BrushStyle.NoBrush)
         if self.hovered:
             painter.setPen(self._pen_hover_selected if self.isSelected() else self._pen_hovered)
-            painter.drawPath(path_outline.simplified())
+            painter.drawPath(path_outline)
             painter.setPen(self._pen_default)
-            painter.drawPath(path_outline.simplified())
+            painter.drawPath(path_outline)
         else:
             painter.setPen(self._pen_selected if self.isSelected() else self._pen_default)
-            painter.drawPath(path_outline.simplified())
+            painter.drawPath(path_outline)
 
         img_x = max(0, (self.width  - self._rect_image_width ) / 2)
         img_y = max(0, (self.height - self._rect_image_height) / 2)
@@ -144,14 +142,9 @@ class _StateNodeGfx_exit(QD_StateNodeGfx):
         img_w = self.width  - 2 * img_x
         img_h = self.height - 2 * img_y
 
-        painter.drawImage(QRectF(img_x, img_y, img_w, img_h), self._image)
+        assets.drawImage(painter, QRectF(img_x, img_y, img_w, img_h), self._imagePath)
 
-        if self.node.isDirty():
-            utils.drawNodeStateIcon(painter, 1, self.width / 2, 0, False)
-        elif self.node.isInvalid():
-            utils.drawNodeStateIcon(painter, 2, self.width / 2, 0, False)
-        else:
-            utils.drawNodeStateIcon(painter, 0, self.width / 2, 0, False)
+        utils.drawNodeStateIcon(painter, self.node.iconIndex, self.width / 2, 0, False)
 
 
 @utils.stateNodeRegister